@@ -0,0 +1,27 @@
+"""
+analysis/jit.py — Optional Numba JIT support for numeric hot paths.
+
+Numba is an optional dependency. When it is installed, `njit` is Numba's
+decorator and decorated kernels compile to native code on first call. When
+it is not, `njit` is a no-op and the same functions run as plain Python.
+
+Usage:
+    from analysis.jit import njit
+
+    @njit(cache=True)
+    def _kernel(x: float) -> float:
+        ...
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional — kernels run as plain Python
+    def njit(*_args, **_kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        def decorator(func):
+            return func
+        return decorator
+
+__all__ = ["njit"]
@@ -22,11 +22,18 @@ Usage:
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import List, Optional
 
+import numpy as np
 
+
+@lru_cache(maxsize=1)
 def _load_vader():
-    """Lazy-load VADER to avoid import errors if not installed yet."""
+    """
+    Lazy-load VADER to avoid import errors if not installed yet.
+    Cached so every SentimentAnalyzer shares one parsed lexicon.
+    """
     try:
         from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
         return SentimentIntensityAnalyzer()
@@ -34,6 +41,23 @@ def _load_vader():
         return None
 
 
+# Word tokenizer shared by booster matching and the fallback scorer. Applied
+# to lowercased text; an explicit ASCII class avoids Unicode \w lookups and
+# every lexicon word is plain ASCII.
+_WORD_RE = re.compile(r"[a-z0-9_]+")
+
+# Lexicons for the keyword fallback scorer (used when VADER is unavailable).
+_POSITIVE_WORDS = frozenset({
+    "good", "great", "win", "won", "positive", "up", "rise",
+    "gain", "profit", "success", "strong", "high", "record",
+    "best", "beat", "exceed", "outperform", "surpass",
+})
+_NEGATIVE_WORDS = frozenset({
+    "bad", "loss", "lost", "negative", "down", "fall", "drop",
+    "fail", "weak", "low", "miss", "underperform", "injury",
+    "suspend", "cancel", "crash", "decline",
+})
+
 # Category-specific keyword boosters — these words carry extra weight
 # in prediction market contexts that VADER's general dictionary misses.
 DOMAIN_BOOSTERS: dict = {
@@ -58,6 +82,20 @@ DOMAIN_BOOSTERS: dict = {
 }
 
 
+@lru_cache(maxsize=16)
+def _normalize_category(category: str) -> str:
+    """Lowercase a category name once; callers pass the same few strings."""
+    return category.lower()
+
+
+@lru_cache(maxsize=64)
+def _recency_weights(n: int) -> np.ndarray:
+    """Decay weights for a batch of n items: last gets 1.0, prior decay by 0.9."""
+    weights = np.power(0.9, np.arange(n - 1, -1, -1, dtype=np.float64))
+    weights.flags.writeable = False  # shared across calls via the cache
+    return weights
+
+
 class SentimentAnalyzer:
     """
     Sentiment scoring engine combining VADER with domain-specific keyword
@@ -67,6 +105,9 @@ class SentimentAnalyzer:
     def __init__(self) -> None:
         self._vader = _load_vader()
         self._vader_available = self._vader is not None
+        # Headlines repeat across refresh cycles and across markets in the
+        # same category; scoring is pure in (text, category), so memoize it.
+        self._score_cached = lru_cache(maxsize=4096)(self._score_uncached)
 
     def score_text(self, text: str, category: str = "") -> float:
         """
@@ -77,7 +118,13 @@ class SentimentAnalyzer:
         """
         if not text or not text.strip():
             return 50.0
+        return self._score_cached(text, _normalize_category(category))
 
+    def _score_uncached(self, text: str, category: str) -> float:
+        """
+        Compute the score_text result without consulting the cache.
+        `category` must already be lowercased (see _normalize_category).
+        """
         text_clean = text.strip().lower()
 
         # VADER base score
@@ -89,11 +136,17 @@ class SentimentAnalyzer:
             compound = self._simple_keyword_score(text_clean)
 
         # Apply domain-specific boosters
-        if category and category.lower() in DOMAIN_BOOSTERS:
-            boosters = DOMAIN_BOOSTERS[category.lower()]
-            for word, boost in boosters.items():
-                if re.search(r"\b" + re.escape(word) + r"\b", text_clean):
-                    compound = max(-1.0, min(1.0, compound + boost))
+        boosters = DOMAIN_BOOSTERS.get(category)
+        if boosters:
+            # Every booster is a single word, so one tokenization pass plus a
+            # hash-set intersection finds all hits (same as \bword\b matching).
+            hits = boosters.keys() & set(_WORD_RE.findall(text_clean))
+            # Each word boosts at most once, applied in lexicon order so the
+            # running clamp behaves exactly as before.
+            if hits:
+                for word, boost in boosters.items():
+                    if word in hits:
+                        compound = max(-1.0, min(1.0, compound + boost))
 
         # Normalize from [-1, 1] to [0, 100]
         return round((compound + 1.0) / 2.0 * 100.0, 2)
@@ -108,18 +161,26 @@ class SentimentAnalyzer:
         if not texts:
             return 50.0
 
-        scores = [self.score_text(t, category) for t in texts]
+        return self._weighted_average(self.score_many(texts, category))
 
-        # Recency weighting: last item gets weight 1.0, prior items decay by 0.9
-        n = len(scores)
-        weights = [0.9 ** (n - 1 - i) for i in range(n)]
-        total_weight = sum(weights)
+    def score_many(self, texts: List[str], category: str = "") -> List[float]:
+        """
+        Score each text in a batch; same results as calling score_text() per item.
 
-        if total_weight <= 0:
-            return 50.0
+        Binds the cached scorer once for the whole batch instead of paying
+        method dispatch and argument binding per headline.
+        """
+        score = self._score_cached
+        category = _normalize_category(category)
+        return [score(t, category) if t and t.strip() else 50.0 for t in texts]
 
-        weighted_sum = sum(s * w for s, w in zip(scores, weights))
-        return round(weighted_sum / total_weight, 2)
+    @staticmethod
+    def _weighted_average(scores: List[float]) -> float:
+        """Recency-weighted mean of already-computed scores (see score_batch)."""
+        # Recency weighting: last item gets weight 1.0, prior items decay by 0.9
+        weights = _recency_weights(len(scores))
+        weighted = np.dot(np.asarray(scores, dtype=np.float64), weights)
+        return round(float(weighted / weights.sum()), 2)
 
     def analyze_market(
         self,
@@ -161,11 +222,10 @@ class SentimentAnalyzer:
                 "confidence": 0.0,
             }
 
-        # Score each item individually for distribution analysis
-        individual_scores = [self.score_text(item, category) for item in all_items]
-
-        # Aggregate score with recency weighting
-        aggregate_score = self.score_batch(all_items, category)
+        # Score each item once; the same scores feed both the distribution
+        # analysis and the recency-weighted aggregate.
+        individual_scores = self.score_many(all_items, category)
+        aggregate_score = self._weighted_average(individual_scores)
 
         # Direction determination
         if aggregate_score > 58:
@@ -208,20 +268,12 @@ class SentimentAnalyzer:
         Fallback scorer when VADER is unavailable.
         Simple positive/negative word counting. Returns [-1, 1].
         """
-        positive_words = {
-            "good", "great", "win", "won", "positive", "up", "rise",
-            "gain", "profit", "success", "strong", "high", "record",
-            "best", "beat", "exceed", "outperform", "surpass",
-        }
-        negative_words = {
-            "bad", "loss", "lost", "negative", "down", "fall", "drop",
-            "fail", "weak", "low", "miss", "underperform", "injury",
-            "suspend", "cancel", "crash", "decline",
-        }
-
-        words = re.findall(r"\b\w+\b", text.lower())
-        pos = sum(1 for w in words if w in positive_words)
-        neg = sum(1 for w in words if w in negative_words)
+        pos = neg = 0
+        for w in _WORD_RE.findall(text.lower()):
+            if w in _POSITIVE_WORDS:
+                pos += 1
+            elif w in _NEGATIVE_WORDS:
+                neg += 1
         total = pos + neg
 
         if total == 0:
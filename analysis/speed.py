@@ -20,9 +20,23 @@ Usage:
 
 from __future__ import annotations
 
+import math
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional
+
+import numpy as np
+
+from analysis.jit import njit
+
+# Number of ticks kept per market (oldest are evicted automatically)
+HISTORY_LENGTH = 30
+
+# Direction codes used internally; converted to strings only in results
+BULLISH, NEUTRAL, BEARISH = 1, 0, -1
+_DIRECTION_NAMES: Dict[int, str] = {BULLISH: "bullish", NEUTRAL: "neutral", BEARISH: "bearish"}
+_DIRECTION_CODES: Dict[str, int] = {name: code for code, name in _DIRECTION_NAMES.items()}
 
 
 @dataclass
@@ -30,37 +44,44 @@ class MarketSpeedData:
     """Per-market data tracked by the speed monitor."""
 
     market_id: str
-    last_update_ts: float = 0.0          # Unix timestamp of last update
-    price_history: List[float] = field(default_factory=list)
-    volume_history: List[float] = field(default_factory=list)
+    last_update_ts: float = 0.0          # time.monotonic() of last update
+    price_history: Deque[float] = field(default_factory=lambda: deque(maxlen=HISTORY_LENGTH))
+    volume_history: Deque[float] = field(default_factory=lambda: deque(maxlen=HISTORY_LENGTH))
     consensus_score: Optional[float] = None   # from multi-source consensus
-    consensus_direction: str = "neutral"
+    consensus_direction: int = NEUTRAL         # BULLISH | NEUTRAL | BEARISH
     consensus_source_count: int = 0
+    # Running total of volume_history, maintained on append/evict
+    _volume_sum: float = field(default=0.0, repr=False)
+    # Last compute_speed_score() result and the inputs it was computed from
+    _last_score_key: Optional[tuple] = field(default=None, repr=False)
+    _last_score_result: Optional[dict] = field(default=None, repr=False)
 
     def record(self, price: float, volume: float) -> None:
         """Record a new price/volume tick."""
-        self.last_update_ts = time.time()
+        self.last_update_ts = time.monotonic()
         self.price_history.append(price)
+        if len(self.volume_history) == self.volume_history.maxlen:
+            self._volume_sum -= self.volume_history[0]  # about to be evicted
         self.volume_history.append(volume)
-        # Keep last 30 data points
-        if len(self.price_history) > 30:
-            self.price_history.pop(0)
-        if len(self.volume_history) > 30:
-            self.volume_history.pop(0)
+        self._volume_sum += volume
 
     @property
     def staleness_seconds(self) -> float:
-        """Seconds since last update. 0 if never updated."""
+        """Seconds since last update. inf if never updated."""
+        return self.staleness_at(time.monotonic())
+
+    def staleness_at(self, now: float) -> float:
+        """Seconds between the last update and `now`. inf if never updated."""
         if self.last_update_ts == 0:
             return float("inf")
-        return time.time() - self.last_update_ts
+        return now - self.last_update_ts
 
     @property
     def volume_baseline(self) -> float:
         """Average volume over the history window."""
         if len(self.volume_history) < 2:
             return max(self.volume_history[0], 1.0) if self.volume_history else 1.0
-        return sum(self.volume_history[:-1]) / len(self.volume_history[:-1])
+        return (self._volume_sum - self.volume_history[-1]) / (len(self.volume_history) - 1)
 
     @property
     def latest_volume_spike(self) -> float:
@@ -83,6 +104,102 @@ class MarketSpeedData:
         return self.price_history[-1] - self.price_history[-3]
 
 
+@njit(cache=True, nogil=True)
+def _score_kernel(
+    staleness: float,
+    spike_ratio: float,
+    momentum: float,
+    consensus_score: float,
+    source_count: float,
+    market_price: float,
+    freshness_knots: tuple,
+    freshness_segments: tuple,
+    spike_threshold: float,
+    momentum_scale: float,
+) -> tuple:
+    """
+    Scalar scoring arithmetic behind SpeedMonitor.compute_speed_score().
+
+    Pure float math so it can be JIT-compiled (and run without the GIL, so
+    threads can score different markets concurrently); consensus_score and
+    market_price are NaN when unavailable. Returns (score, direction_code,
+    freshness, volume_bonus, momentum_impact, consensus_edge, consensus_bonus).
+    """
+    # Start from neutral baseline
+    score = 50.0
+    direction = NEUTRAL
+
+    # ---- Component 1: Freshness ----
+    # Clamp first so a never-updated market (inf) lands in the stale segment
+    clamped = min(staleness, freshness_knots[-1])
+    segment = 0
+    for knot in freshness_knots:
+        if clamped >= knot:
+            segment += 1
+    intercept, slope = freshness_segments[segment]
+    freshness_bonus = intercept + slope * clamped
+    score += freshness_bonus
+
+    # ---- Component 2: Volume spike ----
+    if spike_ratio >= spike_threshold * 2:
+        volume_bonus = 15.0    # extreme spike — someone knows something
+    elif spike_ratio >= spike_threshold:
+        volume_bonus = 8.0     # notable spike
+    elif spike_ratio >= 1.5:
+        volume_bonus = 3.0
+    else:
+        volume_bonus = 0.0
+    score += volume_bonus
+
+    # ---- Component 3: Price momentum ----
+    momentum_impact = momentum * momentum_scale  # scale for 0-1 price domain
+    if abs(momentum_impact) > 0.1:
+        score += momentum_impact
+        if momentum > 0:
+            direction = BULLISH
+        elif momentum < 0:
+            direction = BEARISH
+
+    # ---- Component 4: Consensus edge ----
+    consensus_bonus = 0.0
+    consensus_edge = 0.0
+    if not math.isnan(consensus_score) and not math.isnan(market_price):
+        # Consensus score is probability from external sources (0-100)
+        # Market price is the implied probability (0-1 → multiply by 100)
+        consensus_edge = consensus_score - market_price * 100.0
+
+        # If sources agree on outcome with 3+ sources, larger bonus
+        source_multiplier = min(source_count / 3.0, 2.0)
+
+        if abs(consensus_edge) > 10:   # >10 percentage point divergence
+            consensus_bonus = min(abs(consensus_edge) * 0.3 * source_multiplier, 20.0)
+            if consensus_edge > 0:
+                direction = BULLISH
+            else:
+                direction = BEARISH
+                consensus_bonus = -consensus_bonus  # negative means bearish, flip sign for score
+            score += consensus_bonus
+
+    # Clamp final score
+    score = max(0.0, min(100.0, score))
+
+    # Re-determine direction from final score
+    if score > 60 and direction == NEUTRAL:
+        direction = BULLISH
+    elif score < 40 and direction == NEUTRAL:
+        direction = BEARISH
+
+    return score, direction, freshness_bonus, volume_bonus, momentum_impact, consensus_edge, consensus_bonus
+
+
+def _copy_result(result: dict) -> dict:
+    """
+    Copy of a cached speed score result. Callers may add or edit keys, and
+    the cached dict is handed out again on the next unchanged poll.
+    """
+    return {**result, "score_breakdown": dict(result["score_breakdown"])}
+
+
 class SpeedMonitor:
     """
     Tracks price update freshness, volume spikes, and price momentum
@@ -95,6 +212,18 @@ class SpeedMonitor:
     VOLUME_SPIKE_THRESHOLD: float = 2.0        # >2x baseline = spike signal
     MOMENTUM_SCALE: float = 500.0              # multiply momentum to get score impact
 
+    # Freshness bonus as a piecewise-linear table: staleness upper bounds and
+    # the (intercept, slope) that applies below each bound. Steps of +15/+10/+5,
+    # then a linear decay from +5 at 60s to -15 at the stale cutoff.
+    _FRESHNESS_KNOTS: tuple = (FRESHNESS_FULL_SCORE_SECS, 30.0, 60.0, FRESHNESS_STALE_SECS)
+    _FRESHNESS_SEGMENTS: tuple = (
+        (15.0, 0.0),
+        (10.0, 0.0),
+        (5.0, 0.0),
+        (5.0 + 60.0 * 20.0 / (FRESHNESS_STALE_SECS - 60.0), -20.0 / (FRESHNESS_STALE_SECS - 60.0)),
+        (-15.0, 0.0),
+    )
+
     def __init__(self) -> None:
         self._data: Dict[str, MarketSpeedData] = {}
 
@@ -139,7 +268,7 @@ class SpeedMonitor:
         """
         data = self._get_data(market_id)
         data.consensus_score = consensus_score
-        data.consensus_direction = direction
+        data.consensus_direction = _DIRECTION_CODES.get(direction, NEUTRAL)
         data.consensus_source_count = source_count
 
     def compute_speed_score(
@@ -147,6 +276,7 @@ class SpeedMonitor:
         market_id: str,
         category: str,
         current_market_price: Optional[float] = None,
+        now: Optional[float] = None,
     ) -> dict:
         """
         Compute the speed/information advantage score for a market.
@@ -155,6 +285,8 @@ class SpeedMonitor:
             market_id: Market identifier
             category: 'sports' | 'crypto' | 'weather'
             current_market_price: Current YES price for consensus comparison
+            now: time.monotonic() value to measure staleness against; pass one snapshot
+                 when scoring several markets in the same pass
 
         Returns:
             {
@@ -168,101 +300,180 @@ class SpeedMonitor:
             }
         """
         data = self._get_data(market_id)
+        staleness = data.staleness_at(time.monotonic() if now is None else now)
+        reported_staleness = round(staleness, 1) if staleness != math.inf else 9999.0
+
+        # Markets are often polled faster than they update: reuse the last
+        # result while no input has changed (staleness at reported precision).
+        key = (
+            data.last_update_ts,
+            data.consensus_score,
+            data.consensus_source_count,
+            current_market_price,
+            reported_staleness,
+        )
+        if key == data._last_score_key:
+            return _copy_result(data._last_score_result)
 
-        # Start from neutral baseline
-        score = 50.0
-        direction = "neutral"
-        breakdown = {}
-
-        # ---- Component 1: Freshness ----
-        staleness = data.staleness_seconds
-        if staleness == float("inf") or staleness > self.FRESHNESS_STALE_SECS:
-            freshness_bonus = -15.0  # no data at all
-        elif staleness < self.FRESHNESS_FULL_SCORE_SECS:
-            freshness_bonus = 15.0   # very fresh data
-        elif staleness < 30:
-            freshness_bonus = 10.0
-        elif staleness < 60:
-            freshness_bonus = 5.0
-        else:
-            # Linear decay between 60s and 120s
-            decay_pct = (staleness - 60) / (self.FRESHNESS_STALE_SECS - 60)
-            freshness_bonus = max(-15.0, 5.0 - decay_pct * 20.0)
-
-        score += freshness_bonus
-        breakdown["freshness"] = round(freshness_bonus, 2)
-
-        # ---- Component 2: Volume spike ----
         spike_ratio = data.latest_volume_spike
-        if spike_ratio >= self.VOLUME_SPIKE_THRESHOLD * 2:
-            volume_bonus = 15.0    # extreme spike — someone knows something
-        elif spike_ratio >= self.VOLUME_SPIKE_THRESHOLD:
-            volume_bonus = 8.0     # notable spike
-        elif spike_ratio >= 1.5:
-            volume_bonus = 3.0
-        else:
-            volume_bonus = 0.0
-
-        score += volume_bonus
-        breakdown["volume_spike"] = round(volume_bonus, 2)
-
-        # ---- Component 3: Price momentum ----
         momentum = data.price_momentum
-        momentum_impact = momentum * self.MOMENTUM_SCALE  # scale for 0-1 price domain
 
-        if abs(momentum_impact) > 0.1:
-            score += momentum_impact
-            if momentum > 0:
-                direction = "bullish"
-            elif momentum < 0:
-                direction = "bearish"
+        (
+            score, direction, freshness_bonus, volume_bonus,
+            momentum_impact, consensus_edge, consensus_bonus,
+        ) = _score_kernel(
+            staleness,
+            spike_ratio,
+            momentum,
+            math.nan if data.consensus_score is None else float(data.consensus_score),
+            float(data.consensus_source_count),
+            math.nan if current_market_price is None else float(current_market_price),
+            self._FRESHNESS_KNOTS,
+            self._FRESHNESS_SEGMENTS,
+            self.VOLUME_SPIKE_THRESHOLD,
+            self.MOMENTUM_SCALE,
+        )
+
+        # Volume bonus is always one of the tier constants, and the edge is
+        # reported twice — round each value only once, and only when needed.
+        consensus_edge = round(consensus_edge, 2)
+        result = {
+            "speed_score": round(score, 2),
+            "direction": _DIRECTION_NAMES[direction],
+            "staleness_seconds": reported_staleness,
+            "volume_spike_ratio": round(spike_ratio, 2),
+            "price_momentum": round(momentum, 5),
+            "consensus_edge": consensus_edge,
+            "score_breakdown": {
+                "freshness": round(freshness_bonus, 2),
+                "volume_spike": volume_bonus,
+                "momentum": round(momentum_impact, 2),
+                "consensus_edge": consensus_edge,
+                "consensus_bonus": round(consensus_bonus, 2),
+            },
+        }
+        data._last_score_key = key
+        data._last_score_result = result
+        return _copy_result(result)
 
-        breakdown["momentum"] = round(momentum_impact, 2)
+    def compute_all_speed_scores(
+        self,
+        current_prices: Optional[Dict[str, float]] = None,
+        now: Optional[float] = None,
+    ) -> Dict[str, dict]:
+        """
+        Score every tracked market in one vectorized pass.
 
-        # ---- Component 4: Consensus edge ----
-        consensus_bonus = 0.0
-        consensus_edge = 0.0
+        Each market's scoring inputs (last update time, spike ratio, momentum,
+        consensus) are O(1) to read, so they are gathered into column arrays
+        and all four components are computed with NumPy across markets at once.
+        Results match compute_speed_score() for each market.
 
-        if data.consensus_score is not None and current_market_price is not None:
-            # Consensus score is probability from external sources (0-100)
-            # Market price is the implied probability (0-1 → multiply by 100)
-            market_prob = current_market_price * 100.0
-            consensus_edge = data.consensus_score - market_prob
+        Args:
+            current_prices: Optional {market_id: current YES price} for the
+                consensus comparison; markets without a price skip that component
+            now: time.monotonic() value to measure staleness against (one clock read per pass)
 
-            # If sources agree on outcome with 3+ sources, larger bonus
-            source_multiplier = min(data.consensus_source_count / 3.0, 2.0)
+        Returns:
+            {market_id: result dict in the compute_speed_score() format}
+        """
+        if not self._data:
+            return {}
+        current_prices = current_prices or {}
+        market_ids = list(self._data)
+        n = len(market_ids)
+
+        last_ts = np.empty(n)
+        spike = np.empty(n)
+        momentum = np.empty(n)
+        consensus = np.full(n, np.nan)
+        sources = np.zeros(n)
+        market_price = np.full(n, np.nan)
+        for i, market_id in enumerate(market_ids):
+            data = self._data[market_id]
+            last_ts[i] = data.last_update_ts
+            spike[i] = data.latest_volume_spike
+            momentum[i] = data.price_momentum
+            if data.consensus_score is not None:
+                consensus[i] = data.consensus_score
+                sources[i] = data.consensus_source_count
+            price = current_prices.get(market_id)
+            if price is not None:
+                market_price[i] = price
 
-            if abs(consensus_edge) > 10:   # >10 percentage point divergence
-                consensus_bonus = min(abs(consensus_edge) * 0.3 * source_multiplier, 20.0)
-                if consensus_edge > 0:
-                    direction = "bullish"
-                else:
-                    direction = "bearish"
-                    consensus_bonus = -consensus_bonus  # negative means bearish, flip sign for score
+        # ---- Component 1: Freshness ----
+        if now is None:
+            now = time.monotonic()
+        staleness = np.where(last_ts == 0, np.inf, now - last_ts)
+        clamped = np.minimum(staleness, self.FRESHNESS_STALE_SECS)
+        segments = np.asarray(self._FRESHNESS_SEGMENTS)
+        seg = np.searchsorted(self._FRESHNESS_KNOTS, clamped, side="right")
+        freshness = segments[seg, 0] + segments[seg, 1] * clamped
 
-                score += consensus_bonus
+        # ---- Component 2: Volume spike ----
+        volume_bonus = np.select(
+            [spike >= self.VOLUME_SPIKE_THRESHOLD * 2, spike >= self.VOLUME_SPIKE_THRESHOLD, spike >= 1.5],
+            [15.0, 8.0, 3.0],
+            default=0.0,
+        )
 
-        breakdown["consensus_edge"] = round(consensus_edge, 2)
-        breakdown["consensus_bonus"] = round(consensus_bonus, 2)
+        # ---- Component 3: Price momentum ----
+        momentum_impact = momentum * self.MOMENTUM_SCALE
+        moving = np.abs(momentum_impact) > 0.1
+        direction = np.where(moving, np.sign(momentum), NEUTRAL)
 
-        # Clamp final score
-        score = max(0.0, min(100.0, score))
+        # ---- Component 4: Consensus edge ----
+        has_consensus = ~np.isnan(consensus) & ~np.isnan(market_price)
+        edge = np.where(has_consensus, consensus - market_price * 100.0, 0.0)
+        diverged = np.abs(edge) > 10
+        source_multiplier = np.minimum(sources / 3.0, 2.0)
+        consensus_bonus = np.where(
+            diverged,
+            np.sign(edge) * np.minimum(np.abs(edge) * 0.3 * source_multiplier, 20.0),
+            0.0,
+        )
+        direction = np.where(diverged, np.sign(edge), direction)
+
+        score = 50.0 + freshness + volume_bonus + np.where(moving, momentum_impact, 0.0) + consensus_bonus
+        score = np.clip(score, 0.0, 100.0)
 
         # Re-determine direction from final score
-        if score > 60 and direction == "neutral":
-            direction = "bullish"
-        elif score < 40 and direction == "neutral":
-            direction = "bearish"
-
-        return {
-            "speed_score": round(score, 2),
-            "direction": direction,
-            "staleness_seconds": round(staleness if staleness != float("inf") else 9999.0, 1),
-            "volume_spike_ratio": round(spike_ratio, 2),
-            "price_momentum": round(momentum, 5),
-            "consensus_edge": round(consensus_edge, 2),
-            "score_breakdown": breakdown,
-        }
+        neutral = direction == NEUTRAL
+        direction = np.where(neutral & (score > 60), BULLISH, direction)
+        direction = np.where(neutral & (score < 40), BEARISH, direction)
+
+        # Round each column once in NumPy, then unpack to Python floats
+        reported_staleness = np.where(np.isinf(staleness), 9999.0, staleness)
+        cols = zip(
+            np.round(score, 2).tolist(),
+            direction.astype(int).tolist(),
+            np.round(reported_staleness, 1).tolist(),
+            np.round(spike, 2).tolist(),
+            np.round(momentum, 5).tolist(),
+            np.round(edge, 2).tolist(),
+            np.round(freshness, 2).tolist(),
+            volume_bonus.tolist(),
+            np.round(momentum_impact, 2).tolist(),
+            np.round(consensus_bonus, 2).tolist(),
+        )
+        results: Dict[str, dict] = {}
+        for market_id, (sc, dr, st, sp, mo, ed, fr, vb, mi, cb) in zip(market_ids, cols):
+            results[market_id] = {
+                "speed_score": sc,
+                "direction": _DIRECTION_NAMES[dr],
+                "staleness_seconds": st,
+                "volume_spike_ratio": sp,
+                "price_momentum": mo,
+                "consensus_edge": ed,
+                "score_breakdown": {
+                    "freshness": fr,
+                    "volume_spike": vb,
+                    "momentum": mi,
+                    "consensus_edge": ed,
+                    "consensus_bonus": cb,
+                },
+            }
+        return results
 
     def get_all_market_ids(self) -> List[str]:
         """Return all market IDs currently being tracked."""
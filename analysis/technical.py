@@ -15,22 +15,242 @@ All prices are in [0.0, 1.0] range (prediction market contract pricing).
 from __future__ import annotations
 
 import math
+from collections import deque
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import Dict, List, Optional
+from enum import IntEnum
+from operator import itemgetter
+from typing import ClassVar, Deque, Dict, List, Optional, Tuple
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
-class BreakoutState(Enum):
-    """State machine states for the double-breakout pattern detector."""
+from analysis.jit import njit
 
-    SCANNING = "SCANNING"
-    CONSOLIDATION_DETECTED = "CONSOLIDATION_DETECTED"
-    FIRST_BREAKOUT = "FIRST_BREAKOUT"
-    RETEST = "RETEST"
-    SECOND_BREAKOUT_SIGNAL = "SECOND_BREAKOUT_SIGNAL"
+# Number of recent candle volumes averaged for breakout volume confirmation
+VOLUME_WINDOW = 20
 
+# Fields update() reads from a candle dict, fetched in one call
+_CANDLE_FIELDS = itemgetter("close", "high", "low", "volume")
 
-@dataclass
+# Breakout direction codes kept on BreakoutMachine.breakout_dir
+BULLISH, NEUTRAL, BEARISH = 1, 0, -1
+_DIRECTION_NAMES: Dict[int, str] = {BULLISH: "bullish", NEUTRAL: "neutral", BEARISH: "bearish"}
+_DIRECTION_CODES: Dict[str, int] = {name: code for code, name in _DIRECTION_NAMES.items()}
+
+# Share of breakout confidence added to the TA score, indexed by BreakoutState
+_BREAKOUT_SCORE_WEIGHT = (0.0, 0.0, 0.15, 0.15, 0.3)
+
+
+@dataclass(frozen=True)
+class CandleSeries:
+    """
+    Column-oriented OHLCV history: one contiguous float64 array per field,
+    oldest first. Built once per analysis by candles_to_series() so the
+    indicators slice arrays instead of each re-walking the candle dicts.
+    """
+
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return self.close.shape[0]
+
+
+def candles_to_series(candles: List[dict]) -> CandleSeries:
+    """
+    Convert OHLCV dicts to a CandleSeries in one pass.
+    Missing volume is treated as 0; a missing open falls back to the close.
+    """
+    table = np.array(
+        [
+            (c.get("open", c["close"]), c["high"], c["low"], c["close"], c.get("volume", 0.0))
+            for c in candles
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 5)
+    # Copy each column out so every field is contiguous rather than strided
+    return CandleSeries(*(np.ascontiguousarray(table[:, i]) for i in range(5)))
+
+
+@njit(cache=True)
+def _ema_kernel(prices: np.ndarray, period: int) -> float:
+    """EMA recurrence over a float64 array, seeded with the first price."""
+    k = 2.0 / (period + 1)
+    ema_val = prices[0]
+    for i in range(1, prices.shape[0]):
+        ema_val = prices[i] * k + ema_val * (1.0 - k)
+    return ema_val
+
+
+@njit(cache=True)
+def _breakout_thresholds(
+    cons_high: float, cons_low: float, breakout_pct: float, retest_pct: float,
+) -> tuple:
+    """Breakout triggers and retest bands for a box (mirrors BreakoutMachine setters)."""
+    high_tol = retest_pct * max(cons_high, 0.001)
+    low_tol = retest_pct * max(cons_low, 0.001)
+    return (
+        cons_high * (1 + breakout_pct),
+        cons_low * (1 - breakout_pct),
+        cons_high - high_tol,
+        cons_high + high_tol,
+        cons_low - low_tol,
+        cons_low + low_tol,
+    )
+
+
+@njit(cache=True)
+def _replay_breakout(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    prior_volumes: np.ndarray,
+    volume_sum: float,
+    state: int,
+    direction: int,
+    cons_high: float,
+    cons_low: float,
+    first_price: float,
+    candles_in_state: int,
+    min_candles: int,
+    max_range_pct: float,
+    breakout_pct: float,
+    retest_pct: float,
+    timeout: int,
+) -> tuple:
+    """
+    Replay a candle series through the double-breakout state machine.
+
+    Step i is exactly what TechnicalAnalyzer.analyze() does when handed the
+    first i+1 candles: try to detect consolidation while SCANNING, then feed
+    candle i to BreakoutMachine.update(). States use BreakoutState values and
+    direction is +1 / -1 / 0. Returns the final machine scalars, the updated
+    volume window + running sum, and the confidence produced at every step.
+    """
+    n = close.shape[0]
+    confidences = np.zeros(n)
+    volumes = np.concatenate((prior_volumes, volume))
+    count = prior_volumes.shape[0]
+    upper, lower, hb_lo, hb_hi, lb_lo, lb_hi = _breakout_thresholds(
+        cons_high, cons_low, breakout_pct, retest_pct
+    )
+
+    # Monotonic index queues over the trailing min_candles window: high[] is
+    # decreasing along max_q and low[] increasing along min_q, so the window
+    # extremes sit at the heads and each candle is pushed/evicted once.
+    max_q = np.empty(n, dtype=np.int64)
+    min_q = np.empty(n, dtype=np.int64)
+    max_head = max_tail = min_head = min_tail = 0
+
+    for i in range(n):
+        while max_tail > max_head and high[max_q[max_tail - 1]] <= high[i]:
+            max_tail -= 1
+        max_q[max_tail] = i
+        max_tail += 1
+        while min_tail > min_head and low[min_q[min_tail - 1]] >= low[i]:
+            min_tail -= 1
+        min_q[min_tail] = i
+        min_tail += 1
+        window_start = i - min_candles + 1
+        while max_q[max_head] < window_start:
+            max_head += 1
+        while min_q[min_head] < window_start:
+            min_head += 1
+
+        # ---- Consolidation detection (analyze() while SCANNING) ----
+        if state == 0 and i + 1 >= min_candles:
+            highest = high[max_q[max_head]]
+            lowest = low[min_q[min_head]]
+            mid = (highest + lowest) / 2
+            if mid > 0 and (highest - lowest) / mid <= max_range_pct:
+                state = 1
+                cons_high = highest
+                cons_low = lowest
+                candles_in_state = 0
+                upper, lower, hb_lo, hb_hi, lb_lo, lb_hi = _breakout_thresholds(
+                    cons_high, cons_low, breakout_pct, retest_pct
+                )
+
+        # ---- BreakoutMachine.update() ----
+        c = close[i]
+        v = volume[i]
+        candles_in_state += 1
+        k = prior_volumes.shape[0] + i
+        if count == VOLUME_WINDOW:
+            volume_sum -= volumes[k - VOLUME_WINDOW]
+        else:
+            count += 1
+        volume_sum += v
+        avg_volume = volume_sum / count
+
+        reset = False
+        confidence = 0.0
+        if candles_in_state > timeout and state != 0 and state != 4:
+            reset = True
+        elif state == 1:
+            if c > upper:
+                state, direction, first_price, candles_in_state = 2, 1, c, 0
+                confidence = 35.0
+            elif c < lower:
+                state, direction, first_price, candles_in_state = 2, -1, c, 0
+                confidence = 35.0
+        elif state == 2:
+            band_lo, band_hi = (hb_lo, hb_hi) if direction == 1 else (lb_lo, lb_hi)
+            if band_lo <= c <= band_hi:
+                state, candles_in_state = 3, 0
+                confidence = 20.0
+            elif (direction == 1 and c < lower) or (direction != 1 and c > upper):
+                reset = True
+            else:
+                confidence = 25.0
+        elif state == 3:
+            if (direction == 1 and c > upper) or (direction != 1 and c < lower):
+                confidence = 75.0
+                if v > avg_volume * 1.5:
+                    confidence += 15.0
+                state, candles_in_state = 4, 0
+                confidence = min(confidence, 100.0)
+            elif (direction == 1 and c < lower) or (direction != 1 and c > upper):
+                reset = True
+            else:
+                confidence = 30.0
+        elif state == 4:
+            if candles_in_state > 3:
+                reset = True
+            confidence = 90.0
+
+        if reset:
+            state, direction, cons_high, cons_low, first_price, candles_in_state = 0, 0, 0.0, 0.0, 0.0, 0
+            upper, lower, hb_lo, hb_hi, lb_lo, lb_hi = _breakout_thresholds(
+                cons_high, cons_low, breakout_pct, retest_pct
+            )
+        confidences[i] = confidence
+
+    return (
+        state, direction, cons_high, cons_low, first_price, candles_in_state,
+        volumes[-min(count, VOLUME_WINDOW):], volume_sum, confidences,
+    )
+
+
+class BreakoutState(IntEnum):
+    """
+    State machine states for the double-breakout pattern detector.
+    Integer-valued for cheap comparisons and table dispatch; use `.name`
+    for the display string ("SCANNING", ...).
+    """
+
+    SCANNING = 0
+    CONSOLIDATION_DETECTED = 1
+    FIRST_BREAKOUT = 2
+    RETEST = 3
+    SECOND_BREAKOUT_SIGNAL = 4
+
+
+@dataclass(slots=True, init=False)
 class BreakoutMachine:
     """
     Per-market state machine that tracks the double-breakout pattern.
@@ -44,23 +264,111 @@ class BreakoutMachine:
     This "failed retest then successful second breakout" pattern is a
     reliable continuation signal in prediction markets because it shows
     that participants who faded the first breakout have capitulated.
+
+    Slotted: one machine is kept per tracked market and update() reads most
+    fields on every candle.
     """
 
     # Configuration thresholds
-    CONSOLIDATION_MIN_CANDLES: int = 5
-    CONSOLIDATION_MAX_RANGE_PCT: float = 0.03   # 3% range qualifies as consolidation
-    BREAKOUT_MIN_PCT: float = 0.015             # 1.5% move = breakout
-    RETEST_TOLERANCE_PCT: float = 0.015         # how far from breakout level = retest
-    TIMEOUT_CANDLES: int = 50                   # reset after this many candles
+    CONSOLIDATION_MIN_CANDLES: int
+    CONSOLIDATION_MAX_RANGE_PCT: float
+    BREAKOUT_MIN_PCT: float
+    RETEST_TOLERANCE_PCT: float
+    TIMEOUT_CANDLES: int
 
     # Current state
-    state: BreakoutState = BreakoutState.SCANNING
-    breakout_direction: str = "neutral"          # 'bullish' | 'bearish'
-    consolidation_high: float = 0.0
-    consolidation_low: float = 0.0
-    first_breakout_price: float = 0.0
-    candles_in_state: int = 0
-    recent_volumes: List[float] = field(default_factory=list)
+    state: BreakoutState
+    breakout_dir: int                            # BULLISH | BEARISH once broken out
+    _consolidation_high: float
+    _consolidation_low: float
+    first_breakout_price: float
+    candles_in_state: int
+    _recent_volumes: Deque[float]
+    _volume_sum: float                           # running total of _recent_volumes
+
+    # Price thresholds derived from the consolidation box, refreshed whenever
+    # consolidation_high/low are assigned so update() only compares.
+    _upper_trigger: float                        # close above = bullish breakout
+    _lower_trigger: float                        # close below = bearish breakout
+    _retest_band_high: Tuple[float, float]       # retest zone around the high
+    _retest_band_low: Tuple[float, float]        # retest zone around the low
+
+    # Written out rather than generated: consolidation_high/low,
+    # breakout_direction and recent_volumes are properties over the private
+    # fields, and a generated __init__ could only take the private names.
+    def __init__(
+        self,
+        CONSOLIDATION_MIN_CANDLES: int = 5,
+        CONSOLIDATION_MAX_RANGE_PCT: float = 0.03,   # 3% range qualifies as consolidation
+        BREAKOUT_MIN_PCT: float = 0.015,             # 1.5% move = breakout
+        RETEST_TOLERANCE_PCT: float = 0.015,         # how far from breakout level = retest
+        TIMEOUT_CANDLES: int = 50,                   # reset after this many candles
+        state: BreakoutState = BreakoutState.SCANNING,
+        breakout_direction: str = "neutral",         # 'bullish' | 'bearish'
+        consolidation_high: float = 0.0,
+        consolidation_low: float = 0.0,
+        first_breakout_price: float = 0.0,
+        candles_in_state: int = 0,
+        recent_volumes: Optional[List[float]] = None,
+    ) -> None:
+        self.CONSOLIDATION_MIN_CANDLES = CONSOLIDATION_MIN_CANDLES
+        self.CONSOLIDATION_MAX_RANGE_PCT = CONSOLIDATION_MAX_RANGE_PCT
+        self.BREAKOUT_MIN_PCT = BREAKOUT_MIN_PCT
+        self.RETEST_TOLERANCE_PCT = RETEST_TOLERANCE_PCT
+        self.TIMEOUT_CANDLES = TIMEOUT_CANDLES
+        self.state = state
+        self.breakout_direction = breakout_direction
+        self.consolidation_high = consolidation_high
+        self.consolidation_low = consolidation_low
+        self.first_breakout_price = first_breakout_price
+        self.candles_in_state = candles_in_state
+        self.recent_volumes = recent_volumes or []
+
+    @property
+    def consolidation_high(self) -> float:
+        """Top of the consolidation box (0.0 when none detected)."""
+        return self._consolidation_high
+
+    @consolidation_high.setter
+    def consolidation_high(self, value: float) -> None:
+        self._consolidation_high = value
+        self._upper_trigger = value * (1 + self.BREAKOUT_MIN_PCT)
+        self._retest_band_high = self._retest_band(value)
+
+    @property
+    def consolidation_low(self) -> float:
+        """Bottom of the consolidation box (0.0 when none detected)."""
+        return self._consolidation_low
+
+    @consolidation_low.setter
+    def consolidation_low(self, value: float) -> None:
+        self._consolidation_low = value
+        self._lower_trigger = value * (1 - self.BREAKOUT_MIN_PCT)
+        self._retest_band_low = self._retest_band(value)
+
+    def _retest_band(self, level: float) -> Tuple[float, float]:
+        """Closes within RETEST_TOLERANCE_PCT of `level` count as a retest."""
+        tolerance = self.RETEST_TOLERANCE_PCT * max(level, 0.001)
+        return level - tolerance, level + tolerance
+
+    @property
+    def breakout_direction(self) -> str:
+        """'bullish' | 'bearish' | 'neutral' view of breakout_dir."""
+        return _DIRECTION_NAMES[self.breakout_dir]
+
+    @breakout_direction.setter
+    def breakout_direction(self, name: str) -> None:
+        self.breakout_dir = _DIRECTION_CODES.get(name, NEUTRAL)
+
+    @property
+    def recent_volumes(self) -> Deque[float]:
+        """The last VOLUME_WINDOW candle volumes, oldest first."""
+        return self._recent_volumes
+
+    @recent_volumes.setter
+    def recent_volumes(self, volumes: List[float]) -> None:
+        self._recent_volumes = deque(volumes, maxlen=VOLUME_WINDOW)
+        self._volume_sum = float(sum(self._recent_volumes))
 
     def update(self, candle: dict) -> tuple[BreakoutState, float]:
         """
@@ -72,17 +380,25 @@ class BreakoutMachine:
         Returns:
             (new_state, confidence_score 0-100)
         """
-        close = candle["close"]
-        high = candle["high"]
-        low = candle["low"]
-        volume = candle.get("volume", 0.0)
-
+        try:
+            close, high, low, volume = _CANDLE_FIELDS(candle)
+        except KeyError:  # volume is optional
+            close, high, low = candle["close"], candle["high"], candle["low"]
+            volume = candle.get("volume", 0.0)
+        return self.update_scalar(close, high, low, volume)
+
+    def update_scalar(
+        self, close: float, high: float, low: float, volume: float,
+    ) -> tuple[BreakoutState, float]:
+        """update() for a candle already unpacked into scalars (e.g. from a CandleSeries)."""
         self.candles_in_state += 1
-        self.recent_volumes.append(volume)
-        if len(self.recent_volumes) > 20:
-            self.recent_volumes.pop(0)
+        volumes = self._recent_volumes
+        if len(volumes) == volumes.maxlen:
+            self._volume_sum -= volumes[0]  # about to be evicted
+        volumes.append(volume)
+        self._volume_sum += volume
 
-        avg_volume = sum(self.recent_volumes) / max(len(self.recent_volumes), 1)
+        avg_volume = self._volume_sum / len(volumes)
 
         # Timeout guard — reset if stuck too long in a non-terminal state
         if self.candles_in_state > self.TIMEOUT_CANDLES and self.state not in (
@@ -92,97 +408,126 @@ class BreakoutMachine:
             self._reset()
             return self.state, 0.0
 
-        if self.state == BreakoutState.SCANNING:
-            return self.state, 0.0  # accumulating data, no score yet
+        state = self.state
+        if state is BreakoutState.SCANNING:
+            return state, 0.0  # accumulating data, no score yet
+        return self._STATE_HANDLERS[state](self, close, volume, avg_volume)
 
-        elif self.state == BreakoutState.CONSOLIDATION_DETECTED:
-            # Check for breakout
-            if close > self.consolidation_high * (1 + self.BREAKOUT_MIN_PCT):
-                self.state = BreakoutState.FIRST_BREAKOUT
-                self.first_breakout_price = close
-                self.breakout_direction = "bullish"
-                self.candles_in_state = 0
-                return self.state, 35.0  # modest confidence for first breakout alone
+    # ------------------------------------------------------------------ #
+    # Per-state transition handlers, dispatched by state value from update()
+    # ------------------------------------------------------------------ #
 
-            elif close < self.consolidation_low * (1 - self.BREAKOUT_MIN_PCT):
-                self.state = BreakoutState.FIRST_BREAKOUT
-                self.first_breakout_price = close
-                self.breakout_direction = "bearish"
-                self.candles_in_state = 0
-                return self.state, 35.0
+    def _on_scanning(self, close: float, volume: float, avg_volume: float) -> tuple[BreakoutState, float]:
+        return self.state, 0.0  # accumulating data, no score yet
 
-            return self.state, 0.0
+    def _on_consolidation(self, close: float, volume: float, avg_volume: float) -> tuple[BreakoutState, float]:
+        # Check for breakout
+        if close > self._upper_trigger:
+            self.state = BreakoutState.FIRST_BREAKOUT
+            self.first_breakout_price = close
+            self.breakout_dir = BULLISH
+            self.candles_in_state = 0
+            return self.state, 35.0  # modest confidence for first breakout alone
 
-        elif self.state == BreakoutState.FIRST_BREAKOUT:
-            # Look for a retest of the breakout level
-            breakout_level = (
-                self.consolidation_high
-                if self.breakout_direction == "bullish"
-                else self.consolidation_low
-            )
-            distance_pct = abs(close - breakout_level) / max(breakout_level, 0.001)
+        elif close < self._lower_trigger:
+            self.state = BreakoutState.FIRST_BREAKOUT
+            self.first_breakout_price = close
+            self.breakout_dir = BEARISH
+            self.candles_in_state = 0
+            return self.state, 35.0
+
+        return self.state, 0.0
+
+    def _on_first_breakout(self, close: float, volume: float, avg_volume: float) -> tuple[BreakoutState, float]:
+        # Look for a retest of the breakout level
+        band_low, band_high = (
+            self._retest_band_high
+            if self.breakout_dir == BULLISH
+            else self._retest_band_low
+        )
 
-            if distance_pct <= self.RETEST_TOLERANCE_PCT:
-                # Price has returned to retest the breakout level
-                self.state = BreakoutState.RETEST
+        if band_low <= close <= band_high:
+            # Price has returned to retest the breakout level
+            self.state = BreakoutState.RETEST
+            self.candles_in_state = 0
+            return self.state, 20.0
+
+        # Check for invalidation (breakout in opposite direction)
+        if self.breakout_dir == BULLISH:
+            if close < self._lower_trigger:
+                self._reset()
+                return self.state, 0.0
+        else:
+            if close > self._upper_trigger:
+                self._reset()
+                return self.state, 0.0
+
+        return self.state, 25.0
+
+    def _on_retest(self, close: float, volume: float, avg_volume: float) -> tuple[BreakoutState, float]:
+        # Look for second breakout in the same direction
+        if self.breakout_dir == BULLISH:
+            if close > self._upper_trigger:
+                # SIGNAL: second bullish breakout confirmed
+                confidence = 75.0
+                if volume > avg_volume * 1.5:
+                    confidence += 15.0   # volume confirmation
+                self.state = BreakoutState.SECOND_BREAKOUT_SIGNAL
                 self.candles_in_state = 0
-                return self.state, 20.0
+                return self.state, min(confidence, 100.0)
 
-            # Check for invalidation (breakout in opposite direction)
-            if self.breakout_direction == "bullish":
-                if close < self.consolidation_low * (1 - self.BREAKOUT_MIN_PCT):
-                    self._reset()
-                    return self.state, 0.0
-            else:
-                if close > self.consolidation_high * (1 + self.BREAKOUT_MIN_PCT):
-                    self._reset()
-                    return self.state, 0.0
-
-            return self.state, 25.0
-
-        elif self.state == BreakoutState.RETEST:
-            # Look for second breakout in the same direction
-            if self.breakout_direction == "bullish":
-                if close > self.consolidation_high * (1 + self.BREAKOUT_MIN_PCT):
-                    # SIGNAL: second bullish breakout confirmed
-                    confidence = 75.0
-                    if volume > avg_volume * 1.5:
-                        confidence += 15.0   # volume confirmation
-                    self.state = BreakoutState.SECOND_BREAKOUT_SIGNAL
-                    self.candles_in_state = 0
-                    return self.state, min(confidence, 100.0)
-
-                # Invalidation: collapses through consolidation low
-                if close < self.consolidation_low * (1 - self.BREAKOUT_MIN_PCT):
-                    self._reset()
-                    return self.state, 0.0
-
-            else:  # bearish
-                if close < self.consolidation_low * (1 - self.BREAKOUT_MIN_PCT):
-                    # SIGNAL: second bearish breakout confirmed
-                    confidence = 75.0
-                    if volume > avg_volume * 1.5:
-                        confidence += 15.0
-                    self.state = BreakoutState.SECOND_BREAKOUT_SIGNAL
-                    self.candles_in_state = 0
-                    return self.state, min(confidence, 100.0)
-
-                # Invalidation
-                if close > self.consolidation_high * (1 + self.BREAKOUT_MIN_PCT):
-                    self._reset()
-                    return self.state, 0.0
-
-            return self.state, 30.0
-
-        elif self.state == BreakoutState.SECOND_BREAKOUT_SIGNAL:
-            # Hold signal for a few candles, then reset back to scanning
-            if self.candles_in_state > 3:
+            # Invalidation: collapses through consolidation low
+            if close < self._lower_trigger:
                 self._reset()
-            return self.state, 90.0  # high confidence while in signal state
+                return self.state, 0.0
+
+        else:  # bearish
+            if close < self._lower_trigger:
+                # SIGNAL: second bearish breakout confirmed
+                confidence = 75.0
+                if volume > avg_volume * 1.5:
+                    confidence += 15.0
+                self.state = BreakoutState.SECOND_BREAKOUT_SIGNAL
+                self.candles_in_state = 0
+                return self.state, min(confidence, 100.0)
 
-        return self.state, 0.0
+            # Invalidation
+            if close > self._upper_trigger:
+                self._reset()
+                return self.state, 0.0
+
+        return self.state, 30.0
+
+    def _on_signal(self, close: float, volume: float, avg_volume: float) -> tuple[BreakoutState, float]:
+        # Hold signal for a few candles, then reset back to scanning
+        if self.candles_in_state > 3:
+            self._reset()
+        return self.state, 90.0  # high confidence while in signal state
 
-    def try_detect_consolidation(self, candles: List[dict]) -> bool:
+    # Indexed by BreakoutState value — order must match the enum
+    _STATE_HANDLERS = (_on_scanning, _on_consolidation, _on_first_breakout, _on_retest, _on_signal)
+
+    def scan_consolidations(self, series: CandleSeries) -> np.ndarray:
+        """
+        Test every CONSOLIDATION_MIN_CANDLES-wide window of `series` for a
+        consolidation box. Returns a boolean mask with one entry per window;
+        entry i covers candles [i, i + CONSOLIDATION_MIN_CANDLES).
+        """
+        window = self.CONSOLIDATION_MIN_CANDLES
+        if len(series) < window:
+            return np.zeros(0, dtype=np.bool_)
+        highest = sliding_window_view(series.high, window).max(axis=1)
+        lowest = sliding_window_view(series.low, window).min(axis=1)
+        mid = (highest + lowest) * 0.5
+        range_pct = (highest - lowest) / np.maximum(mid, 1e-9)
+        return (mid > 0) & (range_pct <= self.CONSOLIDATION_MAX_RANGE_PCT)
+
+    def last_consolidation(self, series: CandleSeries) -> Optional[int]:
+        """Start index of the most recent consolidation window, or None."""
+        hits = np.flatnonzero(self.scan_consolidations(series))
+        return int(hits[-1]) if hits.size else None
+
+    def try_detect_consolidation(self, candles: List[dict] | CandleSeries) -> bool:
         """
         Analyze a window of recent candles to detect a consolidation box.
         Returns True if consolidation was detected and state was updated.
@@ -190,9 +535,13 @@ class BreakoutMachine:
         if len(candles) < self.CONSOLIDATION_MIN_CANDLES:
             return False
 
-        recent = candles[-self.CONSOLIDATION_MIN_CANDLES :]
-        highest_high = max(c["high"] for c in recent)
-        lowest_low = min(c["low"] for c in recent)
+        series = candles if isinstance(candles, CandleSeries) else candles_to_series(
+            candles[-self.CONSOLIDATION_MIN_CANDLES :]
+        )
+        recent_high = series.high[-self.CONSOLIDATION_MIN_CANDLES :]
+        recent_low = series.low[-self.CONSOLIDATION_MIN_CANDLES :]
+        highest_high = float(recent_high.max())
+        lowest_low = float(recent_low.min())
         mid_price = (highest_high + lowest_low) / 2
 
         if mid_price <= 0:
@@ -212,7 +561,7 @@ class BreakoutMachine:
     def _reset(self) -> None:
         """Reset to SCANNING state."""
         self.state = BreakoutState.SCANNING
-        self.breakout_direction = "neutral"
+        self.breakout_dir = NEUTRAL
         self.consolidation_high = 0.0
         self.consolidation_low = 0.0
         self.first_breakout_price = 0.0
@@ -231,79 +580,96 @@ class TechnicalAnalyzer:
         # result['direction'] -> 'bullish' | 'bearish' | 'neutral'
     """
 
+    # Result returned by analyze() for a market with no candles; copied per call
+    _NEUTRAL_TEMPLATE: ClassVar[Dict[str, object]] = {
+        "ta_score": 50.0,
+        "direction": "neutral",
+        "sma_10": 0.0,
+        "ema_60": 0.0,
+        "vwap": 0.0,
+        "volume_spike_ratio": 1.0,
+        "breakout_state": BreakoutState.SCANNING.name,
+        "breakout_direction": "neutral",
+        "breakout_confidence": 0.0,
+        "orderbook_imbalance": 0.0,
+        "candle_count": 0,
+    }
+
     def __init__(self) -> None:
         # One state machine per market
         self._machines: Dict[str, BreakoutMachine] = {}
 
     def _get_machine(self, market_id: str) -> BreakoutMachine:
         """Get or create the breakout machine for a market."""
-        if market_id not in self._machines:
-            self._machines[market_id] = BreakoutMachine()
-        return self._machines[market_id]
+        # Called per candle per market: one hash on the hit path
+        machine = self._machines.get(market_id)
+        if machine is None:
+            machine = self._machines[market_id] = BreakoutMachine()
+        return machine
 
     # ------------------------------------------------------------------ #
     # Indicator calculations (static-style, operate on price lists)
     # ------------------------------------------------------------------ #
 
     @staticmethod
-    def sma(prices: List[float], period: int) -> float:
+    def sma(prices: List[float] | np.ndarray, period: int) -> float:
         """Simple moving average of the last `period` prices."""
-        if not prices:
+        if len(prices) == 0:
             return 0.0
         window = prices[-period:] if len(prices) >= period else prices
+        if isinstance(window, np.ndarray):
+            # Summing native floats is ~3x faster than iterating float64
+            # scalars (or np.sum's dispatch) at indicator-sized windows
+            window = window.tolist()
         return sum(window) / len(window)
 
     @staticmethod
-    def ema(prices: List[float], period: int) -> float:
+    def ema(prices: List[float] | np.ndarray, period: int) -> float:
         """
         Exponential moving average using the standard smoothing factor k=2/(period+1).
-        Seeded with the first price value.
+        Seeded with the first price value. Accepts a list or a float64 array.
         """
-        if not prices:
+        if len(prices) == 0:
             return 0.0
         if len(prices) == 1:
-            return prices[0]
-        k = 2.0 / (period + 1)
-        ema_val = prices[0]
-        for price in prices[1:]:
-            ema_val = price * k + ema_val * (1.0 - k)
-        return ema_val
+            return float(prices[0])
+        return float(_ema_kernel(np.asarray(prices, dtype=np.float64), period))
 
     @staticmethod
-    def vwap(candles: List[dict]) -> float:
+    def vwap(candles: List[dict] | CandleSeries) -> float:
         """
         Volume-weighted average price.
         Typical price = (high + low + close) / 3
         """
-        if not candles:
+        if len(candles) == 0:
             return 0.0
-        total_volume = sum(c.get("volume", 0.0) for c in candles)
+        series = candles if isinstance(candles, CandleSeries) else candles_to_series(candles)
+        total_volume = series.volume.sum()
         if total_volume <= 0:
             # No volume data — return simple average of close prices
-            return sum(c["close"] for c in candles) / len(candles)
-
-        numerator = sum(
-            ((c["high"] + c["low"] + c["close"]) / 3.0) * c.get("volume", 0.0)
-            for c in candles
-        )
-        return numerator / total_volume
+            return float(series.close.mean())
+        typical = (series.high + series.low + series.close) * (1.0 / 3.0)
+        return float(np.dot(typical, series.volume) / total_volume)
 
     @staticmethod
-    def volume_spike_ratio(candles: List[dict], lookback: int = 20) -> float:
+    def volume_spike_ratio(candles: List[dict] | CandleSeries, lookback: int = 20) -> float:
         """
         Ratio of the most recent candle's volume vs the average of the previous
         `lookback` candles. Ratio > 2.0 indicates a significant volume spike.
         """
         if len(candles) < 2:
             return 1.0
-        recent_vol = candles[-1].get("volume", 0.0)
-        baseline_candles = candles[-lookback - 1 : -1]
-        if not baseline_candles:
-            return 1.0
-        baseline_avg = sum(c.get("volume", 0.0) for c in baseline_candles) / len(baseline_candles)
+        if isinstance(candles, CandleSeries):
+            volume = candles.volume[-lookback - 1 :]
+        else:
+            volume = np.array(
+                [c.get("volume", 0.0) for c in candles[-lookback - 1 :]], dtype=np.float64
+            )
+        baseline = volume[:-1]
+        baseline_avg = baseline.sum() / baseline.shape[0]
         if baseline_avg <= 0:
             return 1.0
-        return recent_vol / baseline_avg
+        return float(volume[-1] / baseline_avg)
 
     @staticmethod
     def orderbook_imbalance(yes_bid_volume: float, no_bid_volume: float) -> float:
@@ -323,7 +689,7 @@ class TechnicalAnalyzer:
     def analyze(
         self,
         market_id: str,
-        candles: List[dict],
+        candles: List[dict] | CandleSeries,
         yes_bid_volume: float = 0.0,
         no_bid_volume: float = 0.0,
     ) -> dict:
@@ -332,7 +698,7 @@ class TechnicalAnalyzer:
 
         Args:
             market_id: Unique market identifier
-            candles: List of OHLCV dicts (oldest first), price range [0, 1]
+            candles: OHLCV dicts or a CandleSeries (oldest first), price range [0, 1]
             yes_bid_volume: Total YES bid volume from orderbook
             no_bid_volume: Total NO bid volume from orderbook
 
@@ -351,71 +717,68 @@ class TechnicalAnalyzer:
                 'candle_count': int,
             }
         """
-        if not candles:
+        if len(candles) == 0:
             return self._neutral_result(market_id)
+        series = candles if isinstance(candles, CandleSeries) else candles_to_series(candles)
+        return self._analyze_series(market_id, series, yes_bid_volume, no_bid_volume)
 
-        closes = [c["close"] for c in candles]
-        current_price = closes[-1]
+    def _analyze_series(
+        self,
+        market_id: str,
+        series: CandleSeries,
+        yes_bid_volume: float,
+        no_bid_volume: float,
+    ) -> dict:
+        """analyze() over a non-empty history already converted to `series`."""
+        close = series.close
+        current_price = float(close[-1])
 
         # ---- Indicators ----
-        sma_10 = self.sma(closes, 10)
-        ema_60 = self.ema(closes, 60)
-        vwap_val = self.vwap(candles)
-        vol_spike = self.volume_spike_ratio(candles)
+        sma_10 = self.sma(close, 10)
+        ema_60 = self.ema(close, 60)
+        vwap_val = self.vwap(series)
+        vol_spike = self.volume_spike_ratio(series)
         ob_imbalance = self.orderbook_imbalance(yes_bid_volume, no_bid_volume)
 
         # ---- Breakout state machine ----
         machine = self._get_machine(market_id)
 
         # Try to detect a new consolidation if in scanning state
-        if machine.state == BreakoutState.SCANNING and len(candles) >= machine.CONSOLIDATION_MIN_CANDLES:
-            machine.try_detect_consolidation(candles)
+        if machine.state == BreakoutState.SCANNING and len(series) >= machine.CONSOLIDATION_MIN_CANDLES:
+            machine.try_detect_consolidation(series)
 
         # Feed the latest candle into the machine
-        machine_state, breakout_confidence = machine.update(candles[-1])
+        machine_state, breakout_confidence = machine.update_scalar(
+            current_price, float(series.high[-1]), float(series.low[-1]), float(series.volume[-1]),
+        )
 
         # ---- Score assembly ----
+        # Predicates are folded in as 0/1 multipliers rather than branches;
+        # terms are added in the same order as the original if/else chain so
+        # the float result is identical.
         score = 50.0  # neutral baseline
 
-        # SMA/EMA trend direction
-        if current_price > sma_10:
-            score += 5.0
-        else:
-            score -= 5.0
+        # SMA/EMA trend direction: ±5, and ±8 when short-term is above medium-term
+        score += 10.0 * (current_price > sma_10) - 5.0
+        score += 16.0 * (sma_10 > ema_60) - 8.0
 
-        if sma_10 > ema_60:
-            score += 8.0   # short-term trend above medium-term = bullish
-        else:
-            score -= 8.0
-
-        # VWAP deviation
+        # VWAP deviation (scale: 5% above VWAP = +2.5 points)
         if vwap_val > 0:
-            vwap_pct_diff = (current_price - vwap_val) / vwap_val
-            score += vwap_pct_diff * 50   # scale: 5% above VWAP = +2.5 points
+            score += (current_price - vwap_val) / vwap_val * 50
 
-        # Volume spike confirmation
-        if vol_spike > 2.0:
-            score += 10.0  # significant volume, something is happening
-        elif vol_spike > 1.5:
-            score += 5.0
+        # Volume spike confirmation: +10 above 2x, +5 above 1.5x
+        score += 5.0 * (vol_spike > 2.0) + 5.0 * (vol_spike > 1.5)
 
         # Orderbook imbalance (scaled: +1 imbalance = +10 points)
         score += ob_imbalance * 10.0
 
-        # Breakout pattern (dominant signal when present)
-        if machine_state == BreakoutState.SECOND_BREAKOUT_SIGNAL:
-            if machine.breakout_direction == "bullish":
-                score += breakout_confidence * 0.3
-            else:
-                score -= breakout_confidence * 0.3
-        elif machine_state in (BreakoutState.FIRST_BREAKOUT, BreakoutState.RETEST):
-            if machine.breakout_direction == "bullish":
-                score += breakout_confidence * 0.15
-            else:
-                score -= breakout_confidence * 0.15
+        # Breakout pattern (dominant signal when present); any non-bullish
+        # direction counts against the score
+        sign = 2.0 * (machine.breakout_dir == BULLISH) - 1.0
+        score += sign * (breakout_confidence * _BREAKOUT_SCORE_WEIGHT[machine_state])
 
-        # Clamp to [0, 100]
-        score = max(0.0, min(100.0, score))
+        # Clamp to [0, 100] (conditional expression: no min/max builtin calls)
+        score = 0.0 if score < 0.0 else 100.0 if score > 100.0 else score
 
         # Determine directional bias
         if score > 55:
@@ -426,35 +789,91 @@ class TechnicalAnalyzer:
             direction = "neutral"
 
         return {
-            "ta_score": round(score, 2),
+            # Unrounded: consumers round at their display/persistence boundary
+            "ta_score": score,
             "direction": direction,
-            "sma_10": round(sma_10, 4),
-            "ema_60": round(ema_60, 4),
-            "vwap": round(vwap_val, 4),
-            "volume_spike_ratio": round(vol_spike, 2),
-            "breakout_state": machine_state.value,
+            "sma_10": sma_10,
+            "ema_60": ema_60,
+            "vwap": vwap_val,
+            "volume_spike_ratio": vol_spike,
+            "breakout_state": machine_state.name,
             "breakout_direction": machine.breakout_direction,
-            "breakout_confidence": round(breakout_confidence, 2),
-            "orderbook_imbalance": round(ob_imbalance, 3),
-            "candle_count": len(candles),
+            "breakout_confidence": breakout_confidence,
+            "orderbook_imbalance": ob_imbalance,
+            "candle_count": len(series),
         }
 
+    def analyze_batch(
+        self,
+        market_id: str,
+        candles: List[dict],
+        yes_bid_volume: float = 0.0,
+        no_bid_volume: float = 0.0,
+    ) -> dict:
+        """
+        Replay a full candle history through the market's state machine and
+        analyze the latest candle — for warmup and backfills.
+
+        Equivalent to calling analyze() on every prefix of `candles` in turn,
+        but the state machine runs over the history in one compiled pass
+        instead of one Python call per candle.
+
+        Returns:
+            analyze()'s result for the full series, plus
+            'breakout_history': List[float] — the breakout confidence after each candle
+        """
+        if len(candles) < 2:
+            result = self.analyze(market_id, candles, yes_bid_volume, no_bid_volume)
+            result["breakout_history"] = [result["breakout_confidence"]] if candles else []
+            return result
+
+        machine = self._get_machine(market_id)
+        series = candles_to_series(candles)
+        history = slice(None, -1)
+        (
+            state, direction, cons_high, cons_low, first_price, candles_in_state,
+            recent_volumes, volume_sum, confidences,
+        ) = _replay_breakout(
+            series.high[history], series.low[history],
+            series.close[history], series.volume[history],
+            np.asarray(machine.recent_volumes, dtype=np.float64),
+            machine._volume_sum,
+            int(machine.state),
+            machine.breakout_dir,
+            machine.consolidation_high,
+            machine.consolidation_low,
+            machine.first_breakout_price,
+            machine.candles_in_state,
+            machine.CONSOLIDATION_MIN_CANDLES,
+            machine.CONSOLIDATION_MAX_RANGE_PCT,
+            machine.BREAKOUT_MIN_PCT,
+            machine.RETEST_TOLERANCE_PCT,
+            machine.TIMEOUT_CANDLES,
+        )
+
+        machine.state = BreakoutState(state)
+        machine.breakout_dir = int(direction)
+        machine.consolidation_high = cons_high
+        machine.consolidation_low = cons_low
+        machine.first_breakout_price = first_price
+        machine.candles_in_state = candles_in_state
+        machine._recent_volumes = deque(recent_volumes.tolist(), maxlen=VOLUME_WINDOW)
+        machine._volume_sum = volume_sum
+
+        # The last candle goes through the regular path so indicators and
+        # orderbook inputs are scored exactly as in analyze()
+        result = self._analyze_series(market_id, series, yes_bid_volume, no_bid_volume)
+        result["breakout_history"] = confidences.tolist() + [result["breakout_confidence"]]
+        return result
+
     def _neutral_result(self, market_id: str) -> dict:
         """Return a neutral analysis result when no data is available."""
-        machine = self._get_machine(market_id)
-        return {
-            "ta_score": 50.0,
-            "direction": "neutral",
-            "sma_10": 0.0,
-            "ema_60": 0.0,
-            "vwap": 0.0,
-            "volume_spike_ratio": 1.0,
-            "breakout_state": machine.state.value,
-            "breakout_direction": "neutral",
-            "breakout_confidence": 0.0,
-            "orderbook_imbalance": 0.0,
-            "candle_count": 0,
-        }
+        # Peek rather than create: an empty history has nothing to track yet
+        machine = self._machines.get(market_id)
+        if machine is None:
+            return dict(self._NEUTRAL_TEMPLATE)
+        # Callers may add keys (see analyze_batch), so always hand out a copy
+        return {**self._NEUTRAL_TEMPLATE, "breakout_state": machine.state.name}
 
     def get_state(self, market_id: str) -> BreakoutState:
         """Return the current breakout state for a market."""
@@ -462,5 +881,4 @@ class TechnicalAnalyzer:
 
     def reset_market(self, market_id: str) -> None:
         """Reset the state machine for a market (e.g., after resolution)."""
-        if market_id in self._machines:
-            del self._machines[market_id]
+        self._machines.pop(market_id, None)
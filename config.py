@@ -14,7 +14,8 @@ from __future__ import annotations
 import os
 import sys
 from dataclasses import dataclass, field
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
 
 from dotenv import load_dotenv
 
@@ -22,7 +23,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WeightConfig:
     """Signal type weights for a given market category. Must sum to 1.0."""
 
@@ -47,9 +48,13 @@ class WeightConfig:
         }
 
 
-def _get_float(key: str, default: float) -> float:
-    """Read an env var as float, falling back to default."""
-    val = os.getenv(key)
+# Fallback for unknown categories; immutable, so one shared instance suffices
+_EVEN_WEIGHTS = WeightConfig(ta_weight=0.33, sentiment_weight=0.33, speed_weight=0.34)
+
+
+def _get_float(env: Mapping[str, str], key: str, default: float) -> float:
+    """Read an env var from `env` as float, falling back to default."""
+    val = env.get(key)
     if val is None:
         return default
     try:
@@ -59,9 +64,9 @@ def _get_float(key: str, default: float) -> float:
         return default
 
 
-def _get_int(key: str, default: int) -> int:
-    """Read an env var as int, falling back to default."""
-    val = os.getenv(key)
+def _get_int(env: Mapping[str, str], key: str, default: int) -> int:
+    """Read an env var from `env` as int, falling back to default."""
+    val = env.get(key)
     if val is None:
         return default
     try:
@@ -71,11 +76,14 @@ def _get_int(key: str, default: int) -> int:
         return default
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     """
     Central configuration object. Populated from environment variables.
     Access via the module-level `config` singleton.
+
+    Frozen with __slots__: settings are read on every signal and risk check,
+    and nothing may change them after startup.
     """
 
     # ------------------------------------------------------------------ #
@@ -154,12 +162,13 @@ class Config:
     # ------------------------------------------------------------------ #
     # Default signal type weights by market category
     # Adjusted by the agent over time; stored in strategy_weights DB table
+    # (these defaults are read-only)
     # ------------------------------------------------------------------ #
-    category_weights: Dict[str, WeightConfig] = field(default_factory=lambda: {
+    category_weights: Mapping[str, WeightConfig] = field(default_factory=lambda: MappingProxyType({
         "sports":  WeightConfig(ta_weight=0.20, sentiment_weight=0.35, speed_weight=0.45),
         "crypto":  WeightConfig(ta_weight=0.40, sentiment_weight=0.30, speed_weight=0.30),
         "weather": WeightConfig(ta_weight=0.15, sentiment_weight=0.05, speed_weight=0.80),
-    })
+    }))
 
     @property
     def is_paper_mode(self) -> bool:
@@ -191,67 +200,67 @@ class Config:
         Return signal type weights for a given category.
         Falls back to even weights if category is unknown.
         """
-        return self.category_weights.get(
-            category.lower(),
-            WeightConfig(ta_weight=0.33, sentiment_weight=0.33, speed_weight=0.34),
-        )
+        return self.category_weights.get(category.lower(), _EVEN_WEIGHTS)
 
 
 def _build_config() -> Config:
     """Build the Config singleton from environment variables."""
-    mode = os.getenv("TRADING_MODE", "paper").strip().lower()
+    # Snapshot once: plain dict gets instead of os.environ's key encoding per read
+    env = dict(os.environ)
+
+    mode = env.get("TRADING_MODE", "paper").strip().lower()
     if mode not in ("paper", "live"):
         print(f"[config] WARNING: TRADING_MODE={mode!r} is invalid, defaulting to 'paper'", file=sys.stderr)
         mode = "paper"
 
     return Config(
         trading_mode=mode,
-        paper_starting_balance=_get_float("PAPER_STARTING_BALANCE", 100.0),
+        paper_starting_balance=_get_float(env, "PAPER_STARTING_BALANCE", 100.0),
 
         # Kalshi
-        kalshi_api_key_id=os.getenv("KALSHI_API_KEY_ID", ""),
-        kalshi_private_key_path=os.getenv("KALSHI_PRIVATE_KEY_PATH", "./kalshi_private_key.pem"),
+        kalshi_api_key_id=env.get("KALSHI_API_KEY_ID", ""),
+        kalshi_private_key_path=env.get("KALSHI_PRIVATE_KEY_PATH", "./kalshi_private_key.pem"),
 
         # Polymarket
-        polymarket_private_key=os.getenv("POLYMARKET_PRIVATE_KEY", ""),
-        polymarket_funder_address=os.getenv("POLYMARKET_FUNDER_ADDRESS", ""),
+        polymarket_private_key=env.get("POLYMARKET_PRIVATE_KEY", ""),
+        polymarket_funder_address=env.get("POLYMARKET_FUNDER_ADDRESS", ""),
 
         # Crypto
-        binance_api_key=os.getenv("BINANCE_API_KEY", ""),
-        binance_api_secret=os.getenv("BINANCE_API_SECRET", ""),
-        coingecko_api_key=os.getenv("COINGECKO_API_KEY", ""),
+        binance_api_key=env.get("BINANCE_API_KEY", ""),
+        binance_api_secret=env.get("BINANCE_API_SECRET", ""),
+        coingecko_api_key=env.get("COINGECKO_API_KEY", ""),
 
         # Weather
-        openweathermap_api_key=os.getenv("OPENWEATHERMAP_API_KEY", ""),
-        weatherapi_key=os.getenv("WEATHERAPI_KEY", ""),
+        openweathermap_api_key=env.get("OPENWEATHERMAP_API_KEY", ""),
+        weatherapi_key=env.get("WEATHERAPI_KEY", ""),
 
         # Sports
-        the_odds_api_key=os.getenv("THE_ODDS_API_KEY", ""),
-        sportsradar_api_key=os.getenv("SPORTSRADAR_API_KEY", ""),
+        the_odds_api_key=env.get("THE_ODDS_API_KEY", ""),
+        sportsradar_api_key=env.get("SPORTSRADAR_API_KEY", ""),
 
         # News
-        news_api_key=os.getenv("NEWS_API_KEY", ""),
-        reddit_client_id=os.getenv("REDDIT_CLIENT_ID", ""),
-        reddit_client_secret=os.getenv("REDDIT_CLIENT_SECRET", ""),
-        reddit_user_agent=os.getenv("REDDIT_USER_AGENT", "PredictionBot/1.0"),
-        twitter_bearer_token=os.getenv("TWITTER_BEARER_TOKEN", ""),
+        news_api_key=env.get("NEWS_API_KEY", ""),
+        reddit_client_id=env.get("REDDIT_CLIENT_ID", ""),
+        reddit_client_secret=env.get("REDDIT_CLIENT_SECRET", ""),
+        reddit_user_agent=env.get("REDDIT_USER_AGENT", "PredictionBot/1.0"),
+        twitter_bearer_token=env.get("TWITTER_BEARER_TOKEN", ""),
 
         # Telegram
-        telegram_bot_token=os.getenv("TELEGRAM_BOT_TOKEN", ""),
-        telegram_chat_id=os.getenv("TELEGRAM_CHAT_ID", ""),
+        telegram_bot_token=env.get("TELEGRAM_BOT_TOKEN", ""),
+        telegram_chat_id=env.get("TELEGRAM_CHAT_ID", ""),
 
         # Risk
-        max_positions=_get_int("MAX_POSITIONS", 5),
-        max_exposure_per_trade=_get_float("MAX_EXPOSURE_PER_TRADE", 0.20),
-        max_total_exposure=_get_float("MAX_TOTAL_EXPOSURE", 0.80),
-        trade_threshold=_get_int("TRADE_THRESHOLD", 65),
-        stop_loss_pct=_get_float("STOP_LOSS_PCT", 0.15),
-        take_profit_pct=_get_float("TAKE_PROFIT_PCT", 0.30),
+        max_positions=_get_int(env, "MAX_POSITIONS", 5),
+        max_exposure_per_trade=_get_float(env, "MAX_EXPOSURE_PER_TRADE", 0.20),
+        max_total_exposure=_get_float(env, "MAX_TOTAL_EXPOSURE", 0.80),
+        trade_threshold=_get_int(env, "TRADE_THRESHOLD", 65),
+        stop_loss_pct=_get_float(env, "STOP_LOSS_PCT", 0.15),
+        take_profit_pct=_get_float(env, "TAKE_PROFIT_PCT", 0.30),
 
         # Misc
-        sentiment_model=os.getenv("SENTIMENT_MODEL", "vader").strip().lower(),
-        log_level=os.getenv("LOG_LEVEL", "INFO").strip().upper(),
-        db_path=os.getenv("DB_PATH", "./trading_bot.db"),
+        sentiment_model=env.get("SENTIMENT_MODEL", "vader").strip().lower(),
+        log_level=env.get("LOG_LEVEL", "INFO").strip().upper(),
+        db_path=env.get("DB_PATH", "./trading_bot.db"),
     )
 
 
@@ -11,16 +11,23 @@ Keyboard shortcuts:
   r       Force refresh current tab
 
 The app receives a reference to the TradingEngine and passes it to
-each tab so they can query live data directly.
+each tab so they can query live data directly. Periodic DB reads for the
+positions, feeds and agent tabs go through the app's DataHub instead, and
+the Overview, Markets, History and Signals tabs refresh when the engine
+signals a change (engine.state_dirty) rather than on fixed timers.
 """
 
 from __future__ import annotations
 
+import asyncio
+
 from textual import on
 from textual.app import App, ComposeResult
 from textual.binding import Binding
+from textual.reactive import reactive
 from textual.widgets import Footer, Header, TabbedContent, TabPane
 
+from dashboard.data_hub import DataHub, build_current_prices
 from dashboard.tabs.active_markets import ActiveMarketsTab
 from dashboard.tabs.active_positions import ActivePositionsTab
 from dashboard.tabs.agent_insights import AgentInsightsTab
@@ -43,6 +50,14 @@ class TradingBotApp(App):
     TITLE = "Prediction Market Trading Bot"
     SUB_TITLE = "Paper Mode"
 
+    # Engine-driven tab refresh: at most every MIN_REFRESH seconds while the
+    # engine reports changes, and every KEEPALIVE seconds while it is idle
+    MIN_REFRESH = 2.0
+    KEEPALIVE = 30.0
+
+    # Paper balance, pushed by the paper trader after each fill or close
+    balance = reactive(0.0, init=False)
+
     CSS = """
     Screen {
         background: #0d1117;
@@ -90,15 +105,17 @@ class TradingBotApp(App):
     def __init__(self, engine, **kwargs) -> None:
         super().__init__(**kwargs)
         self.engine = engine
+        # Background DB poller shared by the tabs (started in on_mount)
+        self.hub = DataHub(engine)
         self._update_subtitle()
 
     def _update_subtitle(self) -> None:
         """Update sub-title based on current trading mode."""
         mode = self.engine.config.trading_mode.upper()
         if mode == "LIVE":
-            self.SUB_TITLE = "⚠ LIVE MODE — REAL MONEY"
+            self.sub_title = "⚠ LIVE MODE — REAL MONEY AT RISK"
         else:
-            self.SUB_TITLE = f"Paper Mode | Balance: ${self.engine.paper_trader.balance:.2f}"
+            self.sub_title = f"Paper Mode | Balance: ${self.engine.paper_trader.balance:.2f}"
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -134,20 +151,37 @@ class TradingBotApp(App):
         yield Footer()
 
     def on_mount(self) -> None:
-        """Start periodic subtitle update."""
-        self.set_interval(5.0, self._refresh_subtitle)
-
-    def _refresh_subtitle(self) -> None:
-        """Keep subtitle current with balance."""
-        try:
-            balance = self.engine.paper_trader.balance
-            mode = self.engine.config.trading_mode.upper()
-            if mode == "PAPER":
-                self.sub_title = f"Paper Mode | Balance: ${balance:.2f}"
-            else:
-                self.sub_title = "⚠ LIVE MODE — REAL MONEY AT RISK"
-        except Exception:
-            pass
+        """Start the data hub and refresh loop, and follow paper balance changes."""
+        self.run_worker(self.hub.run(), name="data_hub", exclusive=True)
+        self.run_worker(self._refresh_loop(), name="refresh_loop", group="refresh_loop")
+        # The subtitle only changes with the balance, so it is driven by the
+        # paper trader's updates instead of a timer. LIVE mode keeps the
+        # static warning set in __init__.
+        if self.engine.config.trading_mode.upper() == "PAPER":
+            self.engine.paper_trader.add_balance_listener(self._on_balance_change)
+
+    async def _refresh_loop(self) -> None:
+        """Refresh the engine-driven tabs whenever engine.state_dirty is set."""
+        dirty = self.engine.state_dirty
+        tabs = list(self.query("OverviewTab, ActiveMarketsTab, TradeHistoryTab, SignalLogTab"))
+        while True:
+            try:
+                await asyncio.wait_for(dirty.wait(), timeout=self.KEEPALIVE)
+            except asyncio.TimeoutError:
+                pass
+            dirty.clear()
+            for tab in tabs:
+                tab.call_later(tab.refresh_data)
+            self.hub.refresh("positions")
+            # Changes during the pause are coalesced into the next pass
+            await asyncio.sleep(self.MIN_REFRESH)
+
+    def _on_balance_change(self, balance: float) -> None:
+        """Paper trader callback; runs on the shared event loop."""
+        self.balance = balance
+
+    def watch_balance(self, balance: float) -> None:
+        self.sub_title = f"Paper Mode | Balance: ${balance:.2f}"
 
     def action_switch_tab(self, tab_id: str) -> None:
         """Switch to the specified tab by ID."""
@@ -158,17 +192,12 @@ class TradingBotApp(App):
 
     def action_panic_close(self) -> None:
         """Trigger panic close (close all positions immediately)."""
-        import asyncio
         asyncio.create_task(self._do_panic_close())
 
     async def _do_panic_close(self) -> None:
         """Execute panic close with current market prices."""
         try:
-            current_prices = {}
-            for market in (self.engine.markets or []):
-                market_id = market.get("id") or f"{market.get('exchange')}:{market.get('ticker')}"
-                yes_price = market.get("yes_price") or market.get("yes_ask", 0.5)
-                current_prices[market_id] = float(yes_price)
+            current_prices = build_current_prices(self.engine.markets)
 
             result = await self.engine.paper_trader.panic_close_all(current_prices)
             pnl = result.get("total_pnl", 0.0)
@@ -187,4 +216,5 @@ class TradingBotApp(App):
 
     def action_refresh_tab(self) -> None:
         """Force-refresh the current tab."""
+        self.engine.state_dirty.set()
         self.refresh()
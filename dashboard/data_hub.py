@@ -0,0 +1,191 @@
+"""
+dashboard/data_hub.py — Shared background poller for dashboard DB reads.
+
+Tabs used to each register their own set_interval() and run SQLite queries
+synchronously inside the callback, blocking the Textual event loop while
+the query ran. DataHub owns those periodic reads instead: a single async
+task runs each source's query in a worker thread on its own cadence and
+hands the snapshot to subscribed tabs only when it changed.
+
+Usage:
+    hub = DataHub(engine)
+    app.run_worker(hub.run(), name="data_hub")
+    hub.subscribe("positions", tab.on_positions)   # called on the UI loop
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from database.connection import execute_query
+from database.schema import get_current_weights
+
+# Categories shown in the Agent tab's weight panel
+WEIGHT_CATEGORIES = ("sports", "crypto", "weather")
+
+
+def build_current_prices(markets: Optional[list]) -> Dict[str, float]:
+    """
+    Map market id -> current YES price for the engine's market list,
+    as used by the panic-close paths.
+    """
+    prices: Dict[str, float] = {}
+    for market in markets or ():
+        get = market.get
+        market_id = get("id") or f"{get('exchange')}:{get('ticker')}"
+        prices[market_id] = float(get("yes_price") or get("yes_ask", 0.5))
+    return prices
+
+
+@dataclass
+class _Source:
+    """One periodically refreshed snapshot."""
+
+    fetch: Callable[[], Any]                    # blocking; runs in a worker thread
+    interval: float                             # seconds between fetches
+    max_interval: float = 0.0                   # back off towards this while unchanged (0 = fixed)
+    current_interval: float = 0.0               # cadence in effect; reset to interval on change
+    value: Any = None
+    loaded: bool = False                        # True once the first fetch succeeded
+    next_due: float = 0.0                       # time.monotonic() of the next fetch
+    subscribers: List[Callable[[Any], None]] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.current_interval = self.interval
+
+    def reschedule(self, changed: bool) -> None:
+        """Set the next fetch time, doubling the cadence while nothing changes."""
+        if changed or not self.max_interval:
+            self.current_interval = self.interval
+        else:
+            self.current_interval = min(self.max_interval, self.current_interval * 2)
+        self.next_due = time.monotonic() + self.current_interval
+
+
+class DataHub:
+    """
+    Polls dashboard data sources off the UI thread and fans snapshots out.
+
+    Sources:
+      'positions' — open paper positions with P&L (1 s, backing off to 5 s while unchanged)
+      'feeds'     — data_source_status rows (30 s)
+      'agent'     — (current weights per category, agent adjustment history) (30 s)
+    """
+
+    # Latest agent adjustments, already trimmed to the Agent tab's column widths
+    _AGENT_HISTORY_SQL = """
+        SELECT replace(substr(timestamp, 1, 19), 'T', ' ') AS timestamp,
+               category, action,
+               substr(COALESCE(old_value, ''), 1, 28) AS old_value,
+               substr(COALESCE(new_value, ''), 1, 28) AS new_value,
+               substr(COALESCE(reason, ''), 1, 48) AS reason
+        FROM agent_log
+        ORDER BY agent_log.timestamp DESC LIMIT 50"""
+
+    def __init__(self, engine) -> None:
+        self.engine = engine
+        self._sources: Dict[str, _Source] = {
+            "positions": _Source(self._fetch_positions, 1.0, max_interval=5.0),
+            "feeds": _Source(self._fetch_feeds, 30.0),
+            "agent": _Source(self._fetch_agent, 30.0),
+        }
+        # Agent snapshot memo: both tables are append-only, so their newest
+        # ids change exactly when the weights or history could have changed
+        self._agent_version: Optional[tuple] = None
+        self._agent_snapshot: Optional[tuple] = None
+        self._wakeup = asyncio.Event()
+
+    # ------------------------------------------------------------------ #
+    # Subscription API (UI thread)
+    # ------------------------------------------------------------------ #
+
+    def subscribe(self, name: str, callback: Callable[[Any], None]) -> None:
+        """
+        Call `callback(snapshot)` whenever source `name` changes.
+        If a snapshot is already loaded it is delivered immediately.
+        """
+        source = self._sources[name]
+        source.subscribers.append(callback)
+        if source.loaded:
+            callback(source.value)
+
+    def snapshot(self, name: str) -> Optional[Any]:
+        """Latest snapshot for `name`, or None before the first fetch."""
+        return self._sources[name].value
+
+    def refresh(self, name: Optional[str] = None) -> None:
+        """Make one source (or all) due immediately, e.g. after a user action."""
+        for key, source in self._sources.items():
+            if name is None or key == name:
+                source.next_due = 0.0
+                source.current_interval = source.interval
+        self._wakeup.set()
+
+    # ------------------------------------------------------------------ #
+    # Polling loop
+    # ------------------------------------------------------------------ #
+
+    async def run(self) -> None:
+        """Fetch each source when due, forever. Run as a Textual worker."""
+        while True:
+            now = time.monotonic()
+            for source in self._sources.values():
+                if source.next_due <= now:
+                    source.reschedule(await self._poll(source))
+
+            next_due = min(s.next_due for s in self._sources.values())
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=max(0.0, next_due - time.monotonic())
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    async def _poll(self, source: _Source) -> bool:
+        """
+        Fetch one source in a worker thread and notify subscribers on change.
+        Returns True if the snapshot changed.
+        """
+        try:
+            value = await asyncio.to_thread(source.fetch)
+        except Exception:
+            return False  # keep the last good snapshot; try again next interval
+        if source.loaded and value == source.value:
+            return False
+        source.value = value
+        source.loaded = True
+        for callback in source.subscribers:
+            try:
+                callback(value)
+            except Exception:
+                pass  # one broken tab must not stop the others updating
+        return True
+
+    # ------------------------------------------------------------------ #
+    # Fetchers (worker thread)
+    # ------------------------------------------------------------------ #
+
+    def _fetch_positions(self) -> list:
+        return self.engine.paper_trader.get_open_positions_with_pnl()
+
+    @staticmethod
+    def _fetch_feeds() -> list:
+        return execute_query("SELECT * FROM data_source_status ORDER BY source_name")
+
+    def _fetch_agent(self) -> tuple:
+        row = execute_query(
+            """SELECT (SELECT COALESCE(MAX(id), 0) FROM agent_log),
+                      (SELECT COALESCE(MAX(id), 0) FROM strategy_weights)"""
+        )[0]
+        version = tuple(row)
+        if version == self._agent_version and self._agent_snapshot is not None:
+            return self._agent_snapshot
+
+        weights = {category: get_current_weights(category) for category in WEIGHT_CATEGORIES}
+        self._agent_snapshot = (weights, execute_query(self._AGENT_HISTORY_SQL))
+        self._agent_version = version
+        return self._agent_snapshot
@@ -0,0 +1,33 @@
+"""
+dashboard/fetch_errors.py — Shared error reporting for tab refreshes.
+
+The tabs that read the DB on refresh each used to carry the same block for
+a failed fetch: count it, log it, and notify the user once. They now mix in
+FetchErrorReporting and call _report_fetch_error() instead.
+
+Usage:
+    class SignalLogTab(FetchErrorReporting, Widget):
+        ...
+        except sqlite3.Error as e:
+            self._report_fetch_error("Signal log", e)
+            return
+        self._fetch_errors = 0
+"""
+
+from __future__ import annotations
+
+
+class FetchErrorReporting:
+    """
+    Mixin for polling tabs. A failed refresh is logged every time and shown
+    to the user only on the first failure of a streak; the tab keeps its
+    last good data. Reset `_fetch_errors` to 0 after a successful refresh.
+    """
+
+    _fetch_errors: int = 0  # consecutive failed refreshes
+
+    def _report_fetch_error(self, label: str, exc: Exception) -> None:
+        self._fetch_errors += 1
+        self.log.warning(f"{label} refresh failed ({self._fetch_errors} in a row): {exc}")
+        if self._fetch_errors == 1:
+            self.app.notify(f"{label} refresh failed: {exc}", severity="warning")
@@ -0,0 +1,71 @@
+"""
+dashboard/row_format.py — Pure row formatters for the polled table tabs.
+
+The per-row string building for the Markets and Positions tables lives here
+rather than inside the widgets: it has no Textual dependency, takes plain
+mappings, and returns a tuple of cell strings in column order. Keeping it
+fully annotated and free of dynamic tricks means the module can be compiled
+with mypyc as-is if the Python loop ever shows up in a profile.
+
+Usage:
+    rows[market_id] = format_market_row(market, market_id, scores.get(market_id, {}))
+    rows[str(row["id"])] = format_position_row(row)
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Mapping, Tuple
+
+from dashboard.table_sync import short_title
+
+# Markets table markup
+_DIRECTION_MARKUP: Dict[str, str] = {
+    "bullish": "[green]↑ Bullish[/green]",
+    "bearish": "[red]↓ Bearish[/red]",
+}
+_NEUTRAL_MARKUP = "[dim]Neutral[/dim]"
+# Indexed by (score >= 50) + (score >= 65)
+_SCORE_TEMPLATES = ("[dim]{:.1f}[/dim]", "[yellow]{:.1f}[/yellow]", "[green]{:.1f}[/green]")
+
+# P&L markup indexed by (pnl >= 0)
+PNL_TEMPLATES = ("[red]${:+.2f}[/red]", "[green]${:+.2f}[/green]")
+
+MARKET_TITLE_WIDTH = 33
+POSITION_TITLE_WIDTH = 26
+
+
+def format_market_row(
+    market: Mapping[str, Any], market_id: str, score: Mapping[str, Any]
+) -> Tuple[str, ...]:
+    """Cells for one Active Markets row (engine market dict + latest composite)."""
+    final_score: float = score.get("final_score", 0.0)
+    yes_price: float = float(market.get("yes_price") or market.get("yes_ask", 0.5))
+    return (
+        short_title(market.get("title", market_id), MARKET_TITLE_WIDTH),
+        market.get("exchange", "—").capitalize(),
+        market.get("category", "—").capitalize(),
+        f"${yes_price:.3f}",
+        _SCORE_TEMPLATES[(final_score >= 50) + (final_score >= 65)].format(final_score),
+        _DIRECTION_MARKUP.get(score.get("direction", "—"), _NEUTRAL_MARKUP),
+        score.get("ta_breakout_state", "SCANNING"),
+        f"{int(market.get('volume', 0)):,}",
+    )
+
+
+def format_position_row(row: Mapping[str, Any]) -> Tuple[str, ...]:
+    """Cells for one Active Positions row (a get_open_positions_with_pnl row)."""
+    entry_price: float = row["entry_price"] or 0.5
+    mark_price: float = float(row["mark_price"])
+    quantity: float = row["quantity"] or 0.0
+    open_pnl: float = row["open_pnl"]
+    composite_score = row["composite_score"]
+    return (
+        short_title(row["title"] or row["market_id"] or "", POSITION_TITLE_WIDTH),
+        row["direction"],
+        f"${entry_price:.4f}",
+        f"${mark_price:.4f}",
+        f"{quantity:.3f}",
+        PNL_TEMPLATES[open_pnl >= 0].format(open_pnl),
+        f"{composite_score:.1f}" if composite_score else "—",
+        f"[Close:{row['market_id']}]",
+    )
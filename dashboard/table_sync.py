@@ -0,0 +1,58 @@
+"""
+dashboard/table_sync.py — Incremental DataTable refresh for polling tabs.
+
+Tabs that poll on a timer used to clear() their table and re-add every row,
+which makes Textual re-render the whole table even when nothing changed.
+sync_rows() diffs the new rows against the previous refresh and only adds,
+removes, or updates the cells that differ. short_title() memoizes the
+column-width truncation of titles that repeat on every refresh.
+
+Usage:
+    self._rows: Dict[str, tuple] = {}
+    ...
+    sync_rows(table, {market_id: (title, price, ...)}, self._rows)
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from textual.widgets import DataTable
+
+
+@lru_cache(maxsize=4096)
+def short_title(title: str, limit: int) -> str:
+    """`title` cut to `limit` characters, ending in "…" when shortened."""
+    if len(title) <= limit:
+        return title
+    return title[:limit - 1] + "…"
+
+
+def sync_rows(table: DataTable, rows: Dict[str, Tuple], cache: Dict[str, Tuple]) -> None:
+    """
+    Bring `table` in line with `rows` ({row key: cell values, in column order}).
+
+    `cache` holds the rows applied by the previous call and is updated in
+    place; pass the same dict on every refresh. New keys are appended, keys
+    no longer present are removed, and existing rows only have their changed
+    cells rewritten.
+    """
+    for key in cache.keys() - rows.keys():
+        table.remove_row(key)
+        del cache[key]
+
+    # DataTable.add_rows() is only an add_row() loop that cannot carry row
+    # keys, and add_row() already defers the layout pass to the next idle
+    # refresh, so appends stay keyed add_row() calls made in one batch here
+    columns = list(table.columns)
+    add_row, update_cell = table.add_row, table.update_cell
+    for key, cells in rows.items():
+        previous = cache.get(key)
+        if previous is None:
+            add_row(*cells, key=key)
+        elif previous != cells:
+            for column, old, new in zip(columns, previous, cells):
+                if old != new:
+                    update_cell(key, column, new)
+        cache[key] = cells
@@ -6,15 +6,26 @@ Displays all prediction markets being monitored with:
   - Category and exchange
   - Composite score (color-coded)
   - Breakout state from TA engine
-  - Refresh every 5 seconds
+  - Refreshed by TradingBotApp._refresh_loop when the engine sets
+    engine.state_dirty (at most every 2 seconds, and every 30 seconds while
+    the engine is idle)
+
+Only the rows that fit on screen plus an overscan margin are formatted and
+inserted; further pages are appended as the table is scrolled towards the end.
 """
 
 from __future__ import annotations
 
+from itertools import islice
+from typing import Dict
+
 from textual.app import ComposeResult
 from textual.widget import Widget
 from textual.widgets import DataTable, Label, Static
 
+from dashboard.row_format import format_market_row
+from dashboard.table_sync import sync_rows
+
 
 class ActiveMarketsTab(Widget):
     """Tab 2: Shows all monitored markets with signal scores."""
@@ -45,9 +56,17 @@ class ActiveMarketsTab(Widget):
         ("Volume", 8),
     ]
 
+    # Rows rendered beyond the visible height, and rows appended per scroll page
+    OVERSCAN = 40
+    PAGE_ROWS = 50
+
     def __init__(self, engine, **kwargs) -> None:
         super().__init__(**kwargs)
         self.engine = engine
+        self._rows: Dict[str, tuple] = {}  # market_id -> cells last shown
+        self._row_limit: int = 0  # rows requested by scrolling, on top of the first screen
+        # (engine snapshot, row limit) of the last render
+        self._shown: tuple = (None, 0)
 
     def compose(self) -> ComposeResult:
         yield Static(
@@ -57,57 +76,43 @@ class ActiveMarketsTab(Widget):
         yield DataTable(id="markets_table", zebra_stripes=True)
 
     def on_mount(self) -> None:
-        table = self.query_one("#markets_table", DataTable)
+        # Bound once; refreshes reuse it instead of re-querying the DOM
+        self._table = table = self.query_one("#markets_table", DataTable)
         for name, width in self.COLUMNS:
             table.add_column(name, width=width)
-        self.set_interval(5.0, self.refresh_data)
+        self.watch(table, "scroll_y", self._on_table_scroll, init=False)
         self.refresh_data()
 
     def refresh_data(self) -> None:
-        """Reload market data from engine."""
+        """Reload market data from engine, updating only rows that changed."""
         try:
-            table = self.query_one("#markets_table", DataTable)
-            table.clear()
-
-            markets = getattr(self.engine, "markets", [])
-            scores = getattr(self.engine, "latest_scores", {})
-
-            for market in markets:
+            table = self._table
+            rows: Dict[str, tuple] = {}
+
+            # The engine publishes a new immutable snapshot when markets or
+            # scores change; the same object means the rows are unchanged
+            snapshot = self.engine.snapshot
+            limit = max(self._row_limit, table.size.height + self.OVERSCAN)
+            shown_snapshot, shown_limit = self._shown
+            if snapshot is shown_snapshot and limit == shown_limit:
+                return
+            scores = snapshot.latest_scores
+
+            for market in islice(snapshot.markets, limit):
                 market_id = market.get("id") or f"{market.get('exchange')}:{market.get('ticker')}"
-                score_dict = scores.get(market_id, {})
-                final_score = score_dict.get("final_score", 0.0)
-                direction = score_dict.get("direction", "—")
-                ta_state = score_dict.get("ta_breakout_state", "SCANNING")
-
-                yes_price = market.get("yes_price") or market.get("yes_ask", 0.5)
-                volume = market.get("volume", 0)
-
-                # Color code by score
-                if final_score >= 65:
-                    score_str = f"[green]{final_score:.1f}[/green]"
-                elif final_score >= 50:
-                    score_str = f"[yellow]{final_score:.1f}[/yellow]"
-                else:
-                    score_str = f"[dim]{final_score:.1f}[/dim]"
-
-                direction_str = {
-                    "bullish": "[green]↑ Bullish[/green]",
-                    "bearish": "[red]↓ Bearish[/red]",
-                }.get(direction, "[dim]Neutral[/dim]")
-
-                title = market.get("title", market_id)
-                if len(title) > 33:
-                    title = title[:32] + "…"
-
-                table.add_row(
-                    title,
-                    market.get("exchange", "—").capitalize(),
-                    market.get("category", "—").capitalize(),
-                    f"${float(yes_price):.3f}",
-                    score_str,
-                    direction_str,
-                    ta_state,
-                    f"{int(volume):,}",
-                )
+                rows[market_id] = format_market_row(market, market_id, scores.get(market_id, {}))
+
+            sync_rows(table, rows, self._rows)
+            self._shown = (snapshot, limit)
         except Exception:
             pass
+
+    def _on_table_scroll(self, scroll_y: float) -> None:
+        """Append the next page of markets once the overscan is nearly used up."""
+        table = self._table
+        if table.max_scroll_y - scroll_y > self.OVERSCAN // 2:
+            return
+        if table.row_count >= len(self.engine.snapshot.markets):
+            return
+        self._row_limit = table.row_count + self.PAGE_ROWS
+        self.refresh_data()
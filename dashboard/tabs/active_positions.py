@@ -7,11 +7,61 @@ Includes per-position Close buttons and a Panic Close All button.
 
 from __future__ import annotations
 
+import asyncio
+from typing import Dict
+
 from textual.app import ComposeResult
-from textual.containers import Horizontal
+from textual.containers import Horizontal, Vertical
+from textual.screen import ModalScreen
 from textual.widget import Widget
 from textual.widgets import Button, DataTable, Label, Static
 
+from dashboard.data_hub import build_current_prices
+from dashboard.row_format import PNL_TEMPLATES, format_position_row
+from dashboard.table_sync import sync_rows
+
+
+class ConfirmPanicClose(ModalScreen[bool]):
+    """Yes/No confirmation shown before panic closing all positions."""
+
+    DEFAULT_CSS = """
+    ConfirmPanicClose {
+        align: center middle;
+    }
+    ConfirmPanicClose > Vertical {
+        width: 56;
+        height: auto;
+        border: thick red;
+        background: $surface;
+        padding: 1 2;
+    }
+    ConfirmPanicClose Horizontal {
+        height: 3;
+        align: center middle;
+    }
+    """
+
+    BINDINGS = [("escape", "cancel", "Cancel")]
+
+    def __init__(self, count: int, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.count = count
+
+    def compose(self) -> ComposeResult:
+        with Vertical():
+            yield Static(
+                f"[bold red]Close all {self.count} open position(s) at market?[/bold red]"
+            )
+            with Horizontal():
+                yield Button("Yes, close all", id="confirm_panic_yes", variant="error")
+                yield Button("No", id="confirm_panic_no", variant="default")
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        self.dismiss(event.button.id == "confirm_panic_yes")
+
+    def action_cancel(self) -> None:
+        self.dismiss(False)
+
 
 class ActivePositionsTab(Widget):
     """Tab 4: Open positions with live P&L and manual close controls."""
@@ -55,6 +105,7 @@ class ActivePositionsTab(Widget):
     def __init__(self, engine, **kwargs) -> None:
         super().__init__(**kwargs)
         self.engine = engine
+        self._rows: Dict[str, tuple] = {}  # position id -> cells last shown
 
     def compose(self) -> ComposeResult:
         with Horizontal(classes="positions-header"):
@@ -69,89 +120,65 @@ class ActivePositionsTab(Widget):
         yield Static("No open positions.", id="positions_summary", classes="positions-summary")
 
     def on_mount(self) -> None:
-        table = self.query_one("#positions_table", DataTable)
+        # Bound once; refreshes reuse them instead of re-querying the DOM
+        self._table = table = self.query_one("#positions_table", DataTable)
+        self._summary = self.query_one("#positions_summary", Static)
         for name, width in self.COLUMNS:
             table.add_column(name, width=width)
-        self.set_interval(1.0, self.refresh_data)
-        self.refresh_data()
+        # Positions are polled off the UI thread by the app's DataHub
+        self.app.hub.subscribe("positions", self._show_positions)
 
     def refresh_data(self) -> None:
-        """Reload open positions with latest prices."""
-        try:
-            table = self.query_one("#positions_table", DataTable)
-            table.clear()
+        """Ask the data hub to re-read open positions now."""
+        self.app.hub.refresh("positions")
 
-            positions = self.engine.paper_trader.get_open_positions()
+    def _show_positions(self, positions: list) -> None:
+        """Render a positions snapshot, updating only changed cells."""
+        try:
+            table = self._table
 
             if not positions:
-                self.query_one("#positions_summary", Static).update(
-                    "No open positions."
-                )
+                sync_rows(table, {}, self._rows)
+                self._summary.update("No open positions.")
                 return
 
-            total_unrealized = 0.0
-
-            for row in positions:
-                entry_price = row["entry_price"] or 0.5
-                current_price = row["yes_price"] or row["current_price"] or entry_price
-                quantity = row["quantity"] or 0.0
-                unrealized_pnl = (current_price - entry_price) * quantity
-                total_unrealized += unrealized_pnl
-
-                pnl_color = "green" if unrealized_pnl >= 0 else "red"
-                pnl_str = f"[{pnl_color}]${unrealized_pnl:+.2f}[/{pnl_color}]"
-
-                title = (row["title"] or row["market_id"] or "")
-                if len(title) > 26:
-                    title = title[:25] + "…"
-
-                table.add_row(
-                    title,
-                    row["direction"],
-                    f"${entry_price:.4f}",
-                    f"${float(current_price):.4f}",
-                    f"{quantity:.3f}",
-                    pnl_str,
-                    f"{row['composite_score']:.1f}" if row["composite_score"] else "—",
-                    f"[Close:{row['market_id']}]",
-                )
-
-            color = "green" if total_unrealized >= 0 else "red"
-            self.query_one("#positions_summary", Static).update(
+            # Mark prices and P&L are computed SQL-side (get_open_positions_with_pnl)
+            total_unrealized = positions[0]["total_open_pnl"]
+            rows: Dict[str, tuple] = {str(row["id"]): format_position_row(row) for row in positions}
+
+            sync_rows(table, rows, self._rows)
+
+            self._summary.update(
                 f"{len(positions)} open position(s) | "
-                f"Total Unrealized P&L: [{color}]${total_unrealized:+.2f}[/{color}]"
+                f"Total Unrealized P&L: {PNL_TEMPLATES[total_unrealized >= 0].format(total_unrealized)}"
             )
         except Exception:
             pass
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "panic_close_btn":
-            self._confirm_panic_close()
+            # Exclusive: a second click while the dialog is open replaces it
+            # rather than queueing another panic close
+            self.run_worker(self._confirm_panic_close(), group="panic_close", exclusive=True)
 
-    def _confirm_panic_close(self) -> None:
-        """Show confirmation before panic closing all positions."""
-        positions = self.engine.paper_trader.get_open_positions()
+    async def _confirm_panic_close(self) -> None:
+        """Ask for confirmation, then panic close all positions. Runs as a worker."""
+        positions = await asyncio.to_thread(self.engine.paper_trader.get_open_positions)
         count = len(positions)
         if count == 0:
             return
 
-        # Post message to app to show confirmation dialog
-        self.app.push_screen_wait = True
-        import asyncio
-        asyncio.create_task(self._execute_panic_close(count))
+        if await self.app.push_screen_wait(ConfirmPanicClose(count)):
+            await self._execute_panic_close(count)
 
     async def _execute_panic_close(self, count: int) -> None:
         """Execute panic close with current market prices."""
         try:
-            # Build current prices dict from engine
-            current_prices = {}
-            for market in (self.engine.markets or []):
-                market_id = market.get("id") or f"{market.get('exchange')}:{market.get('ticker')}"
-                yes_price = market.get("yes_price") or market.get("yes_ask", 0.5)
-                current_prices[market_id] = float(yes_price)
+            current_prices = build_current_prices(self.engine.markets)
 
             result = await self.engine.paper_trader.panic_close_all(current_prices)
             pnl = result.get("total_pnl", 0.0)
+            self.refresh_data()
 
             if self.engine.notifier:
                 await self.engine.notifier.notify_panic_close(pnl, count)
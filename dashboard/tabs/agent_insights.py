@@ -9,11 +9,26 @@ Shows:
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.widget import Widget
 from textual.widgets import DataTable, Label, Static
 
+from dashboard.data_hub import WEIGHT_CATEGORIES
+
+
+@lru_cache(maxsize=32)
+def _format_weights_line(category: str, ta: float, sent: float, speed: float) -> str:
+    """Rich markup for one category's weight panel; weights rarely change."""
+    return (
+        f"[bold]{category.capitalize()}[/bold]  "
+        f"[blue]TA={ta:.2f}[/blue]  "
+        f"[magenta]Sent={sent:.2f}[/magenta]  "
+        f"[yellow]Speed={speed:.2f}[/yellow]"
+    )
+
 
 class AgentInsightsTab(Widget):
     """Tab 7: Agent weight history and signal performance metrics."""
@@ -54,52 +69,50 @@ class AgentInsightsTab(Widget):
         yield DataTable(id="agent_log_table", zebra_stripes=True)
 
     def on_mount(self) -> None:
-        table = self.query_one("#agent_log_table", DataTable)
+        # Bound once; refreshes reuse them instead of re-querying the DOM
+        self._table = table = self.query_one("#agent_log_table", DataTable)
+        self._weight_widgets = {
+            category: self.query_one(f"#weights_{category}", Static)
+            for category in WEIGHT_CATEGORIES
+        }
         table.add_column("Time", width=18)
         table.add_column("Category", width=10)
         table.add_column("Action", width=18)
         table.add_column("Old Weights", width=30)
         table.add_column("New Weights", width=30)
         table.add_column("Reason", width=50)
-        self.set_interval(30.0, self.refresh_data)
-        self.refresh_data()
+        # Weights and history are polled off the UI thread by the app's DataHub
+        self.app.hub.subscribe("agent", self._show_agent)
 
     def refresh_data(self) -> None:
-        """Reload weight data and agent log from DB."""
+        """Ask the data hub to re-read weights and the agent log now."""
+        self.app.hub.refresh("agent")
+
+    def _show_agent(self, snapshot: tuple) -> None:
+        """Render a (weights by category, adjustment history) snapshot."""
         try:
-            from database.schema import get_current_weights
-
-            for category in ("sports", "crypto", "weather"):
-                weights = get_current_weights(category)
-                ta = weights.get("ta", 0.0)
-                sent = weights.get("sentiment", 0.0)
-                speed = weights.get("speed", 0.0)
-                widget = self.query_one(f"#weights_{category}", Static)
-                widget.update(
-                    f"[bold]{category.capitalize()}[/bold]  "
-                    f"[blue]TA={ta:.2f}[/blue]  "
-                    f"[magenta]Sent={sent:.2f}[/magenta]  "
-                    f"[yellow]Speed={speed:.2f}[/yellow]"
-                )
+            all_weights, rows = snapshot
+            for category, weights in all_weights.items():
+                self._weight_widgets[category].update(_format_weights_line(
+                    category,
+                    weights.get("ta", 0.0),
+                    weights.get("sentiment", 0.0),
+                    weights.get("speed", 0.0),
+                ))
 
             # Agent log
-            table = self.query_one("#agent_log_table", DataTable)
+            table = self._table
             table.clear()
 
-            rows = self.engine.agent.get_adjustment_history(limit=50)
+            # Cells arrive display-ready (trimmed in the hub's SQL)
             for row in rows:
-                ts = (row["timestamp"] or "")[:19].replace("T", " ")
-                old_val = row["old_value"] or ""
-                new_val = row["new_value"] or ""
-                reason = (row["reason"] or "")[:48]
-
                 table.add_row(
-                    ts,
+                    row["timestamp"] or "",
                     row["category"] or "—",
                     row["action"] or "—",
-                    old_val[:28],
-                    new_val[:28],
-                    reason,
+                    row["old_value"],
+                    row["new_value"],
+                    row["reason"],
                 )
         except Exception:
             pass
@@ -19,13 +19,33 @@ Signal-related log entries get additional color:
 
 from __future__ import annotations
 
+import asyncio
+import re
+import sqlite3
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from rich.markup import escape
 from textual.app import ComposeResult
 from textual.containers import Horizontal
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Button, RichLog, Static
 
+from dashboard.fetch_errors import FetchErrorReporting
+from database.connection import execute_query
+
+
+# Extra WHERE clause per level filter. Levels are inlined so each filter maps
+# to one fixed SQL string that SQLite's statement cache can reuse.
+_LEVEL_CLAUSES = {
+    "all": "",
+    "info": " AND level IN ('DEBUG', 'INFO', 'WARNING', 'ERROR')",
+    "warn": " AND level IN ('WARNING', 'ERROR')",
+}
+
 
-class BotActivityTab(Widget):
+class BotActivityTab(FetchErrorReporting, Widget):
     """Tab 9: Scrolling real-time bot activity log."""
 
     DEFAULT_CSS = """
@@ -62,11 +82,62 @@ class BotActivityTab(Widget):
         "PANIC": "red bold blink",
     }
 
+    # All keywords in one case-insensitive pass. Each keyword is its own group
+    # inside a lookahead, so every occurrence is seen (even overlapping ones)
+    # and match.lastindex is the keyword's 1-based position in KEYWORD_COLORS.
+    _KEYWORD_PATTERN = re.compile(
+        "(?=" + "|".join(f"({re.escape(keyword)})" for keyword in KEYWORD_COLORS) + ")",
+        re.IGNORECASE,
+    )
+    _KEYWORD_COLOR_LIST = tuple(KEYWORD_COLORS.values())
+
+    # Rows fetched per poll; a full page means a backlog is waiting
+    FETCH_LIMIT = 100
+
+    # Lines kept in the RichLog; older lines are dropped as new ones arrive
+    MAX_LINES = 2000
+
+    # Most recent matching rows shown when a filter is first opened
+    HISTORY_LINES = 500
+
+    # Level filters selectable from the toolbar
+    FILTERS = tuple(_LEVEL_CLAUSES)
+
+    # Per filter: rows newer than an id (params: after_id, limit) ...
+    _FILTER_SQL = {
+        name: f"SELECT * FROM bot_log WHERE id > ?{clause} ORDER BY timestamp ASC LIMIT ?"
+        for name, clause in _LEVEL_CLAUSES.items()
+    }
+    # ... and the newest matching rows, oldest first (params: limit)
+    _TAIL_SQL = {
+        name: (
+            f"SELECT * FROM (SELECT * FROM bot_log WHERE id > 0{clause} "
+            "ORDER BY id DESC LIMIT ?) ORDER BY timestamp ASC"
+        )
+        for name, clause in _LEVEL_CLAUSES.items()
+    }
+
+    # Poll cadence (seconds): normal, while catching up on a backlog, and the
+    # ceiling reached by doubling after consecutive empty polls
+    POLL_INTERVAL = 1.0
+    BACKLOG_POLL_INTERVAL = 0.25
+    IDLE_POLL_INTERVAL = 5.0
+
     def __init__(self, engine, **kwargs) -> None:
         super().__init__(**kwargs)
         self.engine = engine
-        self._last_log_id: int = 0
+        self._poll_interval: float = self.POLL_INTERVAL
+        self._empty_streak: int = 0
+        self._timer: Optional[Timer] = None
+        # Per-filter read position and rendered lines, so switching filters
+        # only fetches rows logged since that filter was last shown.
+        # -1: load the recent tail on the filter's first poll.
+        self._last_log_ids: Dict[str, int] = {name: -1 for name in self.FILTERS}
+        self._lines: Dict[str, Deque[str]] = {
+            name: deque(maxlen=self.MAX_LINES) for name in self.FILTERS
+        }
         self._auto_scroll: bool = True
+        self._held: Deque[str] = deque(maxlen=self.MAX_LINES)  # lines fetched while paused
         self._filter: str = "all"
 
     def compose(self) -> ComposeResult:
@@ -77,49 +148,86 @@ class BotActivityTab(Widget):
             yield Button("WARN+", id="log_filter_warn", variant="default")
             yield Button("Pause Scroll", id="toggle_scroll_btn", variant="default")
             yield Button("Clear", id="clear_log_btn", variant="default")
-        yield RichLog(id="activity_log", markup=True, highlight=True, wrap=True)
+        yield RichLog(
+            id="activity_log", markup=True, highlight=True, wrap=True, max_lines=self.MAX_LINES,
+        )
 
     def on_mount(self) -> None:
-        self.set_interval(1.0, self.refresh_data)
+        # Bound once; polls reuse it instead of re-querying the DOM
+        self._log = self.query_one("#activity_log", RichLog)
+        self._timer = self.set_interval(self._poll_interval, self.refresh_data)
+
+    def _set_poll_interval(self, seconds: float) -> None:
+        """Restart the poll timer if the cadence changed."""
+        if seconds == self._poll_interval:
+            return
+        self._poll_interval = seconds
+        if self._timer is not None:
+            self._timer.stop()
+        self._timer = self.set_interval(seconds, self.refresh_data)
 
-    def refresh_data(self) -> None:
-        """Poll for new log entries from the DB."""
+    def _adapt_poll_interval(self, row_count: int) -> None:
+        """Back off while idle, speed up while a backlog is draining."""
+        if row_count == 0:
+            self._empty_streak += 1
+            seconds = min(self.IDLE_POLL_INTERVAL, self.POLL_INTERVAL * 2 ** min(self._empty_streak, 3))
+        else:
+            self._empty_streak = 0
+            seconds = self.BACKLOG_POLL_INTERVAL if row_count >= self.FETCH_LIMIT else self.POLL_INTERVAL
+        self._set_poll_interval(seconds)
+
+    async def refresh_data(self) -> None:
+        """Poll for new log entries from the DB without blocking the UI loop."""
+        log_filter = self._filter
+        after_id = self._last_log_ids[log_filter]
         try:
-            from database.connection import execute_query
-
-            level_filter = {
-                "all": None,
-                "info": ("DEBUG", "INFO", "WARNING", "ERROR"),
-                "warn": ("WARNING", "ERROR"),
-            }.get(self._filter)
-
-            if level_filter:
-                rows = execute_query(
-                    """SELECT * FROM bot_log WHERE id > ? AND level IN ({})
-                       ORDER BY timestamp ASC LIMIT 100""".format(
-                        ",".join("?" * len(level_filter))
-                    ),
-                    (self._last_log_id,) + tuple(level_filter),
-                )
-            else:
-                rows = execute_query(
-                    "SELECT * FROM bot_log WHERE id > ? ORDER BY timestamp ASC LIMIT 100",
-                    (self._last_log_id,),
-                )
-
-            if not rows:
-                return
-
-            log = self.query_one("#activity_log", RichLog)
-            for row in rows:
-                self._last_log_id = max(self._last_log_id, row["id"])
-                self._write_log_entry(log, row)
-
-        except Exception:
-            pass
-
-    def _write_log_entry(self, log: RichLog, row) -> None:
-        """Format and write a log entry with appropriate colors."""
+            last_id, lines = await asyncio.to_thread(self._fetch_entries, log_filter, after_id)
+        except sqlite3.Error as e:
+            self._report_fetch_error("Activity log", e)
+            return
+        self._fetch_errors = 0
+        if self._last_log_ids[log_filter] != after_id:
+            return  # an overlapping poll already consumed these rows
+
+        self._last_log_ids[log_filter] = last_id
+        self._lines[log_filter].extend(lines)
+        if log_filter != self._filter:
+            return  # filter switched while the query ran; kept for switching back
+
+        self._adapt_poll_interval(len(lines))
+        self._write_lines(lines)
+
+    def _write_lines(self, lines) -> None:
+        """
+        Append lines to the RichLog in a single write (one re-layout per poll
+        rather than one per line). While scrolling is paused the lines are
+        held back and written when it resumes.
+        """
+        if not lines:
+            return
+        if not self._auto_scroll:
+            self._held.extend(lines)
+            return
+        self._log.write("\n".join(lines))
+
+    def _fetch_entries(self, log_filter: str, after_id: int) -> Tuple[int, List[str]]:
+        """
+        Query log rows newer than `after_id` and format them as markup.
+        A negative `after_id` loads the newest HISTORY_LINES matching rows
+        instead, so opening a filter never scans the whole table.
+        Runs in a worker thread; returns (highest id seen, formatted lines).
+        """
+        if after_id < 0:
+            after_id = 0
+            rows = execute_query(self._TAIL_SQL[log_filter], (self.HISTORY_LINES,))
+        else:
+            rows = execute_query(self._FILTER_SQL[log_filter], (after_id, self.FETCH_LIMIT))
+
+        last_id = max((row["id"] for row in rows), default=after_id)
+        return max(last_id, after_id), [self._format_log_entry(row) for row in rows]
+
+    def _format_log_entry(self, row) -> str:
+        """Format a log entry as Rich markup with appropriate colors."""
         level = row["level"] or "INFO"
         module = row["module"] or "engine"
         message = row["message"] or ""
@@ -127,19 +235,19 @@ class BotActivityTab(Widget):
 
         level_color = self.LEVEL_COLORS.get(level, "white")
 
-        # Check for keyword highlighting
-        msg_upper = message.upper()
+        # Keyword highlighting: the first KEYWORD_COLORS entry found anywhere wins
         msg_color = level_color
-        for keyword, kcolor in self.KEYWORD_COLORS.items():
-            if keyword in msg_upper:
-                msg_color = kcolor
-                break
+        rank = min((m.lastindex for m in self._KEYWORD_PATTERN.finditer(message)), default=0)
+        if rank:
+            msg_color = self._KEYWORD_COLOR_LIST[rank - 1]
 
-        log.write(
+        # Module and message are free text: escape them so a stray "[/x]"
+        # can't break the markup of the whole batch
+        return (
             f"[dim]{ts}[/dim] "
             f"[{level_color}]{level:7}[/{level_color}] "
-            f"[dim]{module:12}[/dim] "
-            f"[{msg_color}]{message}[/{msg_color}]"
+            f"[dim]{escape(f'{module:12}')}[/dim] "
+            f"[{msg_color}]{escape(message)}[/{msg_color}]"
         )
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -149,22 +257,41 @@ class BotActivityTab(Widget):
             self._auto_scroll = not self._auto_scroll
             btn = self.query_one("#toggle_scroll_btn", Button)
             btn.label = "Resume Scroll" if not self._auto_scroll else "Pause Scroll"
+            if self._auto_scroll:
+                held = list(self._held)
+                self._held.clear()
+                self._write_lines(held)
 
         elif btn_id == "clear_log_btn":
-            log = self.query_one("#activity_log", RichLog)
-            log.clear()
+            # Read positions are kept, so cleared lines do not come back
+            for lines in self._lines.values():
+                lines.clear()
+            self._held.clear()
+            self._log.clear()
 
         elif btn_id == "log_filter_all":
-            self._filter = "all"
-            self._last_log_id = 0
-            self.query_one("#activity_log", RichLog).clear()
+            self._set_filter("all")
 
         elif btn_id == "log_filter_info":
-            self._filter = "info"
-            self._last_log_id = 0
-            self.query_one("#activity_log", RichLog).clear()
+            self._set_filter("info")
 
         elif btn_id == "log_filter_warn":
-            self._filter = "warn"
-            self._last_log_id = 0
-            self.query_one("#activity_log", RichLog).clear()
+            self._set_filter("warn")
+
+    def _set_filter(self, log_filter: str) -> None:
+        """
+        Switch level filter: redraw that filter's cached lines and resume
+        polling from where it left off, at normal cadence.
+        """
+        if log_filter == self._filter:
+            return
+        self._filter = log_filter
+        self._empty_streak = 0
+        self._set_poll_interval(self.POLL_INTERVAL)
+
+        self._held.clear()  # the redraw below already includes them
+        log = self._log
+        log.clear()
+        if self._lines[log_filter]:
+            log.write("\n".join(self._lines[log_filter]))
+        self.call_later(self.refresh_data)
@@ -10,10 +10,16 @@ Shows the connection status of all external APIs:
 
 from __future__ import annotations
 
+import asyncio
+from typing import Dict
+
 from textual.app import ComposeResult
 from textual.widget import Widget
 from textual.widgets import DataTable, Static
 
+from dashboard.table_sync import sync_rows
+from database.connection import execute_many
+
 
 class DataFeedsTab(Widget):
     """Tab 6: Health status for all external data sources."""
@@ -56,6 +62,7 @@ class DataFeedsTab(Widget):
     def __init__(self, engine, **kwargs) -> None:
         super().__init__(**kwargs)
         self.engine = engine
+        self._rows: Dict[str, tuple] = {}  # source id -> cells last shown
 
     def compose(self) -> ComposeResult:
         yield Static(
@@ -65,46 +72,45 @@ class DataFeedsTab(Widget):
         yield DataTable(id="feeds_table", zebra_stripes=True)
 
     def on_mount(self) -> None:
-        table = self.query_one("#feeds_table", DataTable)
+        # Bound once; refreshes reuse it instead of re-querying the DOM
+        self._table = table = self.query_one("#feeds_table", DataTable)
         for name, width in self.COLUMNS:
             table.add_column(name, width=width)
-        self._seed_default_sources()
-        self.set_interval(30.0, self.refresh_data)
+        self.run_worker(self._seed_and_refresh(), group="seed_sources", exclusive=True)
+        # Statuses are polled off the UI thread by the app's DataHub
+        self.app.hub.subscribe("feeds", self._show_feeds)
+
+    async def _seed_and_refresh(self) -> None:
+        """Seed default sources in a worker thread, then re-read statuses."""
+        await asyncio.to_thread(self._seed_default_sources)
         self.refresh_data()
 
     def _seed_default_sources(self) -> None:
-        """Insert default source records into DB if missing."""
+        """Insert default source records into DB if missing. Blocking; run off the UI thread."""
         try:
-            from database.connection import execute_query, execute_write
-            for source_id, source_name in self.DEFAULT_SOURCES:
-                existing = execute_query(
-                    "SELECT id FROM data_source_status WHERE id=?", (source_id,)
-                )
-                if not existing:
-                    execute_write(
-                        """INSERT OR IGNORE INTO data_source_status
-                           (id, source_name, status) VALUES (?, ?, 'unknown')""",
-                        (source_id, source_name),
-                    )
+            # INSERT OR IGNORE skips existing ids; one statement, one commit
+            execute_many(
+                """INSERT OR IGNORE INTO data_source_status
+                   (id, source_name, status) VALUES (?, ?, 'unknown')""",
+                self.DEFAULT_SOURCES,
+            )
         except Exception:
             pass
 
     def refresh_data(self) -> None:
-        """Reload source statuses from DB."""
-        try:
-            from database.connection import execute_query
-
-            table = self.query_one("#feeds_table", DataTable)
-            table.clear()
+        """Ask the data hub to re-read source statuses now."""
+        self.app.hub.refresh("feeds")
 
-            rows = execute_query(
-                "SELECT * FROM data_source_status ORDER BY source_name"
-            )
+    def _show_feeds(self, rows: list) -> None:
+        """Render a data_source_status snapshot, updating only changed cells."""
+        try:
+            table = self._table
 
             if not rows:
-                self._seed_default_sources()
+                self.run_worker(self._seed_and_refresh(), group="seed_sources", exclusive=True)
                 return
 
+            cells: Dict[str, tuple] = {}
             for row in rows:
                 status = row["status"] or "unknown"
                 status_display = {
@@ -119,7 +125,7 @@ class DataFeedsTab(Widget):
                 errors = str(row["error_count"] or 0)
                 latency = f"{row['latency_ms']:.0f}ms" if row["latency_ms"] else "—"
 
-                table.add_row(
+                cells[row["id"]] = (
                     row["source_name"],
                     status_display,
                     last_success,
@@ -127,5 +133,7 @@ class DataFeedsTab(Widget):
                     errors,
                     latency,
                 )
+
+            sync_rows(table, cells, self._rows)
         except Exception:
             pass
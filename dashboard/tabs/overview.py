@@ -11,12 +11,23 @@ Shows:
 
 from __future__ import annotations
 
+import asyncio
+import sqlite3
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import numpy as np
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.reactive import reactive
 from textual.widget import Widget
 from textual.widgets import Label, Static
 
+from dashboard.fetch_errors import FetchErrorReporting
+
+# 10 ** decimal places, indexed by the number of places a card displays
+_SCALE = (1, 10, 100)
+
 
 class StatCard(Static):
     """A single stat display card with label and value."""
@@ -45,12 +56,14 @@ class StatCard(Static):
 
     def compose(self) -> ComposeResult:
         yield Label(self._label, classes="stat-label")
-        yield Label(self._value, classes="stat-value", id=f"stat_value_{self.id or 'x'}")
+        # Kept so update_value() does not have to query for it
+        self._value_label = Label(self._value, classes="stat-value", id=f"stat_value_{self.id or 'x'}")
+        yield self._value_label
 
     def update_value(self, value: str, color: str = "white") -> None:
         """Update the displayed value."""
         try:
-            label = self.query_one(".stat-value", Label)
+            label = self._value_label
             label.update(value)
             label.styles.color = color
         except Exception:
@@ -60,6 +73,12 @@ class StatCard(Static):
 class EquityCurve(Static):
     """Simple ASCII equity curve using block characters."""
 
+    HEIGHT = 5       # chart rows
+    MAX_WIDTH = 60   # most recent points shown
+    _WAITING = "[dim]Equity curve — waiting for trade data...[/dim]"
+    # Code points for an empty / filled chart cell, indexed by the fill mask
+    _CELL_CODES = np.array([ord("░"), ord("█")], dtype="<u4")
+
     DEFAULT_CSS = """
     EquityCurve {
         height: 8;
@@ -70,35 +89,50 @@ class EquityCurve(Static):
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
-        self._data: list = []
-
-    def update_data(self, balances: list) -> None:
-        """Update the chart with new balance data."""
-        self._data = [float(b) for b in balances if b is not None]
+        # Only the most recent MAX_WIDTH points are ever kept
+        self._data: Deque[float] = deque(maxlen=self.MAX_WIDTH)
+        # Markup for the current data; render() runs on every repaint but the
+        # chart only changes when update_data() is called
+        self._rendered: str = self._WAITING
+        # (data, HEIGHT) that _rendered was built from
+        self._cache_key: Optional[tuple] = None
+
+    def update_data(self, balances) -> None:
+        """Update the chart with new balance data; a no-op if nothing changed."""
+        data = deque((float(b) for b in balances if b is not None), maxlen=self.MAX_WIDTH)
+        key = (tuple(data), self.HEIGHT)
+        if key == self._cache_key:
+            return
+        self._data = data
+        self._rendered = self._build_chart()
+        self._cache_key = key
         self.refresh()
 
     def render(self) -> str:
+        return self._rendered
+
+    def _build_chart(self) -> str:
+        """Chart markup for self._data."""
         if len(self._data) < 2:
-            return "[dim]Equity curve — waiting for trade data...[/dim]"
-
-        height = 5
-        width = min(len(self._data), 60)
-        data = self._data[-width:]
-
-        min_val = min(data)
-        max_val = max(data)
-        val_range = max(max_val - min_val, 0.01)
-
-        rows = []
-        for row in range(height - 1, -1, -1):
-            line = ""
-            threshold = min_val + (row / (height - 1)) * val_range
-            for val in data:
-                if val >= threshold:
-                    line += "█"
-                else:
-                    line += "░"
-            rows.append(line)
+            return self._WAITING
+
+        height = self.HEIGHT
+        data = np.fromiter(self._data, dtype=float, count=len(self._data))
+
+        min_val = data.min()
+        val_range = max(data.max() - min_val, 0.01)
+
+        # (height, width) grid: a cell is filled when the point reaches that
+        # row's threshold; the top row is the highest threshold
+        thresholds = min_val + (np.arange(height - 1, -1, -1) / (height - 1)) * val_range
+        filled = data[None, :] >= thresholds[:, None]
+
+        # Map the mask through a code-point table and decode the whole grid
+        # (newline column included) in one go instead of joining per cell
+        codes = np.empty((height, len(data) + 1), dtype="<u4")
+        codes[:, :-1] = self._CELL_CODES[filled.view(np.uint8)]
+        codes[:, -1] = ord("\n")
+        chart = codes.tobytes()[:-4].decode("utf-32-le")
 
         start = self._data[0]
         current = self._data[-1]
@@ -106,14 +140,13 @@ class EquityCurve(Static):
         change_str = f"+${change:.2f}" if change >= 0 else f"-${abs(change):.2f}"
         color = "green" if change >= 0 else "red"
 
-        chart = "\n".join(rows)
         return (
             f"[dim]Equity Curve — ${start:.2f} → ${current:.2f} "
             f"[{color}]({change_str})[/{color}][/dim]\n{chart}"
         )
 
 
-class OverviewTab(Widget):
+class OverviewTab(FetchErrorReporting, Widget):
     """
     Tab 1: Main overview dashboard showing balance, mode, P&L, and stats.
     """
@@ -157,6 +190,8 @@ class OverviewTab(Widget):
     def __init__(self, engine, **kwargs) -> None:
         super().__init__(**kwargs)
         self.engine = engine
+        # What each widget currently shows, so unchanged values skip the DOM
+        self._shown: Dict[str, object] = {}  # widget id -> last shown value key
 
     def compose(self) -> ComposeResult:
         with Vertical():
@@ -200,23 +235,46 @@ class OverviewTab(Widget):
                 yield StatCard("Uptime", "—", id="uptime")
 
     def on_mount(self) -> None:
-        """Start refresh timer after mount."""
-        self.set_interval(2.0, self.refresh_data)
-        self.refresh_data()
-
-    def refresh_data(self) -> None:
+        """Bind the widgets refreshed every tick and load the first values."""
+        self._stat_cards: Dict[str, StatCard] = {card.id: card for card in self.query(StatCard)}
+        self._balance_display = self.query_one("#balance_display", Static)
+        self._mode_badge = self.query_one("#mode_badge", Static)
+        self._equity_curve = self.query_one("#equity_curve", EquityCurve)
+        self.call_later(self.refresh_data)
+
+    async def refresh_data(self) -> None:
         """Pull latest data from engine and update all widgets."""
         try:
-            trader = self.engine.paper_trader
-            risk = self.engine.risk
-
-            # Balance and mode
-            balance = trader.balance
-            mode = self.engine.config.trading_mode.upper()
-            balance_display = self.query_one("#balance_display", Static)
-            balance_display.update(f"[bold]${balance:.2f}[/bold]")
-
-            mode_badge = self.query_one("#mode_badge", Static)
+            # DB reads run in a worker thread so the UI loop never waits on SQLite
+            today_pnl, stats, equity_data = await asyncio.to_thread(self._fetch_stats)
+        except sqlite3.Error as e:
+            self._report_fetch_error("Overview", e)
+            return
+
+        # Up to a dozen widgets can change in one tick; repaint them together
+        with self.app.batch_update():
+            try:
+                self._show_stats(today_pnl, stats, equity_data)
+            except (TypeError, KeyError) as e:
+                # A NULL or missing value in the fetched rows
+                self._report_fetch_error("Overview", e)
+                return
+        self._fetch_errors = 0
+
+    def _show_stats(self, today_pnl: float, stats: dict, equity_data: list) -> None:
+        """Apply one refresh to the widgets, skipping values already shown."""
+        trader = self.engine.paper_trader
+        risk = self.engine.risk
+
+        # Balance and mode
+        balance_cents = round(trader.balance * 100)
+        if self._shown.get("balance_display") != balance_cents:
+            self._balance_display.update(f"[bold]${trader.balance:.2f}[/bold]")
+            self._shown["balance_display"] = balance_cents
+
+        mode = self.engine.config.trading_mode.upper()
+        if self._shown.get("mode_badge") != mode:
+            mode_badge = self._mode_badge
             if mode == "PAPER":
                 mode_badge.update("◉ PAPER MODE")
                 mode_badge.remove_class("mode-live")
@@ -225,39 +283,50 @@ class OverviewTab(Widget):
                 mode_badge.update("⚠ LIVE MODE")
                 mode_badge.remove_class("mode-paper")
                 mode_badge.add_class("mode-live")
-
-            # P&L stats
-            today_pnl = trader.get_today_pnl()
-            stats = trader.get_stats()
-
-            self._update_stat("today_pnl", f"${today_pnl:+.2f}", "green" if today_pnl >= 0 else "red")
-            self._update_stat("total_pnl", f"${stats['total_pnl']:+.2f}", "green" if stats['total_pnl'] >= 0 else "red")
-            self._update_stat("open_positions", str(risk.position_count))
-            self._update_stat("exposure_pct", f"{risk.exposure_pct*100:.1f}%")
-
-            # Performance stats
-            if stats["total_trades"] > 0:
-                self._update_stat("win_rate", f"{stats['win_rate']:.1f}%")
-                self._update_stat("profit_factor", f"{stats['profit_factor']:.2f}x")
-                self._update_stat("total_trades", str(stats["total_trades"]))
-                self._update_stat("avg_win", f"${stats['avg_win']:.2f}")
-                self._update_stat("avg_loss", f"${stats['avg_loss']:.2f}")
-                self._update_stat("best_trade", f"${stats['best_trade']:.2f}")
-                self._update_stat("worst_trade", f"${stats['worst_trade']:.2f}")
-
-            # Equity curve
-            equity_data = trader.get_equity_curve(limit=60)
-            if equity_data:
-                balances = [row["balance"] for row in equity_data]
-                self.query_one("#equity_curve", EquityCurve).update_data(balances)
-
-        except Exception:
-            pass  # never crash the dashboard on data refresh
+            self._shown["mode_badge"] = mode
+
+        # (widget id, value, format, decimal places shown, color)
+        total_pnl = stats["total_pnl"]
+        cards: List[Tuple[str, float, str, int, str]] = [
+            ("today_pnl", today_pnl, "${:+.2f}", 2, "green" if today_pnl >= 0 else "red"),
+            ("total_pnl", total_pnl, "${:+.2f}", 2, "green" if total_pnl >= 0 else "red"),
+            ("open_positions", risk.position_count, "{}", 0, "white"),
+            ("exposure_pct", risk.exposure_pct * 100, "{:.1f}%", 1, "white"),
+        ]
+
+        # Performance stats
+        if stats["total_trades"] > 0:
+            cards += [
+                ("win_rate", stats["win_rate"], "{:.1f}%", 1, "white"),
+                ("profit_factor", stats["profit_factor"], "{:.2f}x", 2, "white"),
+                ("total_trades", stats["total_trades"], "{}", 0, "white"),
+                ("avg_win", stats["avg_win"], "${:.2f}", 2, "white"),
+                ("avg_loss", stats["avg_loss"], "${:.2f}", 2, "white"),
+                ("best_trade", stats["best_trade"], "${:.2f}", 2, "white"),
+                ("worst_trade", stats["worst_trade"], "${:.2f}", 2, "white"),
+            ]
+
+        # Compare values quantized to their displayed precision, so the
+        # string is only formatted when what the card shows would change
+        for widget_id, value, fmt, places, color in cards:
+            key = (round(value * _SCALE[places]), color)
+            if self._shown.get(widget_id) != key:
+                self._update_stat(widget_id, fmt.format(value), color)
+                self._shown[widget_id] = key
+
+        # Equity curve
+        if equity_data:
+            # The curve memoizes its chart, so unchanged balances are a no-op
+            self._equity_curve.update_data([row["balance"] for row in equity_data])
+
+    def _fetch_stats(self) -> tuple:
+        """(today's P&L, stats dict, equity curve rows). Blocking; runs off the UI thread."""
+        trader = self.engine.paper_trader
+        return trader.get_today_pnl(), trader.get_stats(), trader.get_equity_curve(limit=60)
 
     def _update_stat(self, widget_id: str, value: str, color: str = "white") -> None:
         """Safely update a StatCard value."""
         try:
-            card = self.query_one(f"#{widget_id}", StatCard)
-            card.update_value(value, color)
+            self._stat_cards[widget_id].update_value(value, color)
         except Exception:
             pass
@@ -16,6 +16,17 @@ from textual.containers import Horizontal, Vertical
 from textual.widget import Widget
 from textual.widgets import Button, Input, Label, Static, Switch
 
+from config import config
+from database.connection import execute_many
+
+# API sources shown in the connection status section: (source id, display name)
+API_SOURCES = (
+    ("kalshi", "Kalshi"), ("polymarket", "Polymarket"),
+    ("binance", "Binance"), ("openweathermap", "OpenWeatherMap"),
+    ("the_odds_api", "The Odds API"), ("newsapi", "NewsAPI"),
+    ("telegram", "Telegram"),
+)
+
 
 class SettingRow(Widget):
     """A labeled settings row with an input field."""
@@ -67,13 +78,10 @@ class SettingsTab(Widget):
         padding: 1;
         margin: 0 0 1 0;
     }
-    .api-status-row {
-        height: 2;
-        layout: horizontal;
+    .api-status-block {
+        height: auto;
         padding: 0 1;
     }
-    .api-label { width: 30; color: $text-muted; }
-    .api-status { width: 20; }
     .btn-row {
         height: 3;
         layout: horizontal;
@@ -85,10 +93,11 @@ class SettingsTab(Widget):
     def __init__(self, engine, **kwargs) -> None:
         super().__init__(**kwargs)
         self.engine = engine
+        # Credentials are read from the environment once at startup, so the
+        # status can be resolved here rather than on every compose
+        self._api_status = self._configured_sources()
 
     def compose(self) -> ComposeResult:
-        from config import config
-
         # Mode control
         yield Label("Trading Mode", classes="section-title")
         with Horizontal(classes="mode-section"):
@@ -120,17 +129,8 @@ class SettingsTab(Widget):
 
         # API connection status (read-only display)
         yield Label("API Connection Status", classes="section-title")
-        for source_id, source_name in [
-            ("kalshi", "Kalshi"), ("polymarket", "Polymarket"),
-            ("binance", "Binance"), ("openweathermap", "OpenWeatherMap"),
-            ("the_odds_api", "The Odds API"), ("newsapi", "NewsAPI"),
-            ("telegram", "Telegram"),
-        ]:
-            configured = self._check_configured(source_id)
-            status_str = "[green]✓ configured[/green]" if configured else "[dim]✗ not configured[/dim]"
-            with Horizontal(classes="api-status-row"):
-                yield Label(source_name + ":", classes="api-label")
-                yield Static(status_str, classes="api-status", id=f"api_status_{source_id}")
+        # All sources in one Static rather than a Horizontal/Label/Static per row
+        yield Static(self._render_api_block(), id="api_status_block", classes="api-status-block")
 
         # Bot controls
         yield Label("Bot Controls", classes="section-title")
@@ -139,10 +139,10 @@ class SettingsTab(Widget):
             yield Button("⏸ Pause Bot", id="pause_bot_btn", variant="warning")
             yield Button("⏹ Stop Bot", id="stop_bot_btn", variant="error")
 
-    def _check_configured(self, source_id: str) -> bool:
-        """Check whether an API source appears to be configured."""
-        from config import config
-        checks = {
+    @staticmethod
+    def _configured_sources() -> dict:
+        """Map each API source id to whether it appears to be configured."""
+        return {
             "kalshi": config.kalshi_configured,
             "polymarket": config.polymarket_configured,
             "binance": bool(config.binance_api_key),
@@ -151,7 +151,19 @@ class SettingsTab(Widget):
             "newsapi": bool(config.news_api_key),
             "telegram": config.telegram_configured,
         }
-        return checks.get(source_id, False)
+
+    def _render_api_block(self) -> str:
+        """API status lines, one per source, as a single markup string."""
+        return "\n".join(
+            f"{source_name + ':':30}"
+            + ("[green]✓ configured[/green]" if self._check_configured(source_id)
+               else "[dim]✗ not configured[/dim]")
+            for source_id, source_name in API_SOURCES
+        )
+
+    def _check_configured(self, source_id: str) -> bool:
+        """Check whether an API source appears to be configured."""
+        return self._api_status.get(source_id, False)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         btn_id = event.button.id
@@ -177,8 +189,6 @@ class SettingsTab(Widget):
     def _save_risk_settings(self) -> None:
         """Save modified risk parameters to the settings DB table."""
         try:
-            from database.connection import execute_write
-
             fields = [
                 ("trade_threshold", False),
                 ("max_positions", False),
@@ -187,6 +197,7 @@ class SettingsTab(Widget):
                 ("stop_loss_pct", True),
                 ("take_profit_pct", True),
             ]
+            rows = []
             for field_id, is_pct in fields:
                 try:
                     input_widget = self.query_one(f"#input_{field_id}", Input)
@@ -194,14 +205,16 @@ class SettingsTab(Widget):
                     val = float(val_str)
                     if is_pct:
                         val = val / 100.0
-                    execute_write(
-                        """INSERT OR REPLACE INTO settings (key, value)
-                           VALUES (?, ?)""",
-                        (field_id, str(val)),
-                    )
+                    rows.append((field_id, str(val)))
                 except Exception:
                     pass
 
+            # All fields in one statement and one commit
+            execute_many(
+                """INSERT OR REPLACE INTO settings (key, value)
+                   VALUES (?, ?)""",
+                rows,
+            )
             self.app.notify("Risk settings saved", severity="information")
         except Exception as e:
             self.app.notify(f"Save failed: {e}", severity="error")
@@ -11,13 +11,27 @@ Supports filtering by signal type.
 
 from __future__ import annotations
 
+import asyncio
+import sqlite3
+from typing import List, Tuple
+
+from rich.markup import escape
 from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.widget import Widget
 from textual.widgets import Button, RichLog, Static
 
+from dashboard.fetch_errors import FetchErrorReporting
+from database.connection import execute_query_tuples
+
+# One signal log line; c = the signal type's color
+_LINE_FMT = (
+    "[dim]{ts}[/dim] [{c}][{t:9}][/{c}] [bold]{m}[/bold] "
+    "score=[{c}]{v:.1f}[/{c}] direction={d}{a}"
+)
 
-class SignalLogTab(Widget):
+
+class SignalLogTab(FetchErrorReporting, Widget):
     """Tab 5: Real-time signal log from all three signal types."""
 
     DEFAULT_CSS = """
@@ -42,6 +56,15 @@ class SignalLogTab(Widget):
         "speed": "yellow",
         "composite": "green",
     }
+    # Bound lookup used per row (a builtin method, so it does not bind to self)
+    _color_for = SIGNAL_COLORS.get
+
+    # New signals since a given id; columns in _format_signal_entry() order
+    _COLUMNS = "id, signal_type, timestamp, direction, value, acted_on, market_id"
+    _ALL_SQL = f"""SELECT {_COLUMNS} FROM signals WHERE id > ?
+                   ORDER BY timestamp ASC LIMIT 50"""
+    _TYPE_SQL = f"""SELECT {_COLUMNS} FROM signals WHERE id > ? AND signal_type = ?
+                    ORDER BY timestamp ASC LIMIT 50"""
 
     def __init__(self, engine, **kwargs) -> None:
         super().__init__(**kwargs)
@@ -59,60 +82,59 @@ class SignalLogTab(Widget):
         yield RichLog(id="signal_richlog", markup=True, highlight=True, wrap=True)
 
     def on_mount(self) -> None:
-        self.set_interval(3.0, self.refresh_data)
-        self.refresh_data()
+        # Bound once; refreshes reuse it instead of re-querying the DOM
+        self._log = self.query_one("#signal_richlog", RichLog)
+        self.call_later(self.refresh_data)
 
-    def refresh_data(self) -> None:
-        """Load new signals from DB since last check."""
+    async def refresh_data(self) -> None:
+        """Load new signals from DB since last check, without blocking the UI loop."""
+        signal_filter, after_id = self._filter, self._last_signal_id
         try:
-            from database.connection import execute_query
-
-            # Only load signals newer than last seen
-            if self._filter == "all":
-                rows = execute_query(
-                    """SELECT * FROM signals WHERE id > ?
-                       ORDER BY timestamp ASC LIMIT 50""",
-                    (self._last_signal_id,),
-                )
-            else:
-                rows = execute_query(
-                    """SELECT * FROM signals WHERE id > ? AND signal_type = ?
-                       ORDER BY timestamp ASC LIMIT 50""",
-                    (self._last_signal_id, self._filter),
-                )
-
-            if not rows:
-                return
-
-            log = self.query_one("#signal_richlog", RichLog)
-            for row in rows:
-                self._last_signal_id = max(self._last_signal_id, row["id"])
-                self._add_signal_entry(log, row)
-
-        except Exception:
-            pass
-
-    def _add_signal_entry(self, log: RichLog, row) -> None:
-        """Format and add a signal entry to the log."""
-        signal_type = row["signal_type"] or "ta"
-        color = self.SIGNAL_COLORS.get(signal_type, "white")
-        ts = (row["timestamp"] or "")[:19].replace("T", " ")
-        direction = row["direction"] or "neutral"
-        value = row["value"] or 0.0
-        acted = " [executed]" if row["acted_on"] else ""
-
-        # Format the log line
-        market_id = row["market_id"] or ""
+            last_id, lines = await asyncio.to_thread(self._fetch_entries, signal_filter, after_id)
+        except sqlite3.Error as e:
+            self._report_fetch_error("Signal log", e)
+            return
+        self._fetch_errors = 0
+        if (signal_filter, after_id) != (self._filter, self._last_signal_id):
+            return  # filter switched or another poll won; next poll re-reads
+
+        self._last_signal_id = last_id
+        if lines:
+            self._log.write("\n".join(lines))
+
+    def _fetch_entries(self, signal_filter: str, after_id: int) -> Tuple[int, List[str]]:
+        """
+        Query signals newer than `after_id` and format them as markup.
+        Runs in a worker thread; returns (highest id seen, formatted lines).
+        """
+        # Only load signals newer than last seen
+        if signal_filter == "all":
+            rows = execute_query_tuples(self._ALL_SQL, (after_id,))
+        else:
+            rows = execute_query_tuples(self._TYPE_SQL, (after_id, signal_filter))
+
+        last_id = max((row[0] for row in rows), default=after_id)
+        return max(last_id, after_id), [self._format_signal_entry(*row) for row in rows]
+
+    def _format_signal_entry(
+        self, signal_id, signal_type, timestamp, direction, value, acted_on, market_id
+    ) -> str:
+        """Format one signals row (unpacked in _COLUMNS order) as Rich markup."""
+        signal_type = signal_type or "ta"
+        market_id = market_id or ""
         market_short = market_id.split(":")[-1] if ":" in market_id else market_id
         if len(market_short) > 20:
             market_short = market_short[:19] + "…"
 
-        log.write(
-            f"[dim]{ts}[/dim] "
-            f"[{color}][{signal_type.upper():9}][/{color}] "
-            f"[bold]{market_short:20}[/bold] "
-            f"score=[{color}]{value:.1f}[/{color}] "
-            f"direction={direction}{acted}"
+        return _LINE_FMT.format(
+            ts=(timestamp or "")[:19].replace("T", " "),
+            c=self._color_for(signal_type, "white"),
+            t=signal_type.upper(),
+            # Free text from the DB: escaped so it can't break the markup
+            m=escape(f"{market_short:20}"),
+            v=value or 0.0,
+            d=escape(direction or "neutral"),
+            a=" [executed]" if acted_on else "",
         )
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -126,6 +148,5 @@ class SignalLogTab(Widget):
         if btn_id in filter_map:
             self._filter = filter_map[btn_id]
             self._last_signal_id = 0
-            log = self.query_one("#signal_richlog", RichLog)
-            log.clear()
-            self.refresh_data()
+            self._log.clear()
+            self.call_later(self.refresh_data)
@@ -7,17 +7,23 @@ and signal breakdown. Includes CSV export functionality.
 
 from __future__ import annotations
 
+import asyncio
 import csv
 import os
+import sqlite3
 from datetime import datetime
+from typing import Dict, Optional
 
 from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.widget import Widget
 from textual.widgets import Button, DataTable, Label, Static
 
+from dashboard.fetch_errors import FetchErrorReporting
+from dashboard.table_sync import short_title, sync_rows
 
-class TradeHistoryTab(Widget):
+
+class TradeHistoryTab(FetchErrorReporting, Widget):
     """Tab 3: Full trade history with P&L and signal details."""
 
     DEFAULT_CSS = """
@@ -52,9 +58,24 @@ class TradeHistoryTab(Widget):
         ("Mode", 6),
     ]
 
+    # trades columns written by Export CSV, in file order
+    EXPORT_COLUMNS = (
+        "entry_time", "exit_time", "market_id", "direction",
+        "entry_price", "exit_price", "quantity", "pnl",
+        "composite_score", "mode", "slippage",
+    )
+
+    # Most recent trades kept in the table
+    MAX_ROWS = 200
+
     def __init__(self, engine, **kwargs) -> None:
         super().__init__(**kwargs)
         self.engine = engine
+        # Delta loading: only trades opened/closed after _since are fetched,
+        # merged into the rows already shown (trade id -> cells / entry time)
+        self._since: Optional[str] = None
+        self._rows: Dict[str, tuple] = {}
+        self._entry_times: Dict[str, str] = {}
 
     def compose(self) -> ComposeResult:
         with Horizontal(classes="trade-controls"):
@@ -64,68 +85,98 @@ class TradeHistoryTab(Widget):
         yield Static("", id="trade_totals", classes="trade-totals")
 
     def on_mount(self) -> None:
-        table = self.query_one("#trades_table", DataTable)
+        # Bound once; refreshes reuse them instead of re-querying the DOM
+        self._table = table = self.query_one("#trades_table", DataTable)
+        self._totals = self.query_one("#trade_totals", Static)
         for name, width in self.COLUMNS:
             table.add_column(name, width=width)
-        self.set_interval(10.0, self.refresh_data)
-        self.refresh_data()
+        self.call_later(self.refresh_data)
 
-    def refresh_data(self) -> None:
-        """Reload trade history from the paper trading engine."""
+    async def refresh_data(self) -> None:
+        """Merge trades opened or closed since the last refresh into the table."""
+        table = self._table
+        since = self._since
         try:
-            table = self.query_one("#trades_table", DataTable)
+            # The queries run in a worker thread so the UI loop never waits on SQLite
+            trades, totals = await asyncio.to_thread(self._fetch_trades, since)
+        except sqlite3.Error as e:
+            self._report_fetch_error("Trade history", e)
+            return
+        self._fetch_errors = 0
+        if since != self._since:
+            return  # an overlapping refresh already merged newer rows
+        if not trades:
+            return
+
+        rows = dict(self._rows)
+        added = False
+        for row in trades:
+            key = str(row["id"])
+            added = added or key not in rows
+            rows[key] = self._format_row(row)
+            self._entry_times[key] = row["entry_time"] or ""
+            for stamp in (row["entry_time"], row["exit_time"]):
+                if stamp and (self._since is None or stamp > self._since):
+                    self._since = stamp
+
+        # Keep the newest MAX_ROWS trades
+        if len(rows) > self.MAX_ROWS:
+            oldest = sorted(rows, key=self._entry_times.__getitem__)
+            for key in oldest[: len(rows) - self.MAX_ROWS]:
+                del rows[key], self._entry_times[key]
+
+        if added and self._rows:
+            # sync_rows() would append new trades at the bottom, and
+            # DataTable.sort() only sees cell values, which need not tell
+            # two trades apart. Re-add every row newest-first by trade id.
+            entry_times = self._entry_times
+            rows = dict(sorted(rows.items(), key=lambda item: entry_times[item[0]], reverse=True))
             table.clear()
-
-            trades = self.engine.paper_trader.get_trade_history(limit=200)
-            total_pnl = 0.0
-            wins = losses = 0
-
-            for row in trades:
-                pnl = row["pnl"] if row["pnl"] is not None else None
-                entry_time = (row["entry_time"] or "")[:16].replace("T", " ")
-
-                if pnl is not None:
-                    total_pnl += pnl
-                    if pnl > 0:
-                        wins += 1
-                        pnl_str = f"[green]+${pnl:.2f}[/green]"
-                    else:
-                        losses += 1
-                        pnl_str = f"[red]-${abs(pnl):.2f}[/red]"
-                else:
-                    pnl_str = "[dim]open[/dim]"
-
-                title = (row["title"] or row["market_id"] or "")
-                if len(title) > 26:
-                    title = title[:25] + "…"
-
-                exit_price = row["exit_price"]
-                exit_str = f"${exit_price:.4f}" if exit_price else "—"
-
-                table.add_row(
-                    entry_time,
-                    title,
-                    row["direction"],
-                    f"${row['entry_price']:.4f}",
-                    exit_str,
-                    f"{row['quantity']:.3f}",
-                    pnl_str,
-                    f"{row['composite_score']:.1f}" if row["composite_score"] else "—",
-                    row["mode"].upper(),
-                )
-
-            # Update totals footer
-            if wins + losses > 0:
-                win_rate = wins / (wins + losses) * 100
-                color = "green" if total_pnl >= 0 else "red"
-                totals = self.query_one("#trade_totals", Static)
-                totals.update(
-                    f"Total: {wins+losses} trades | Wins: {wins} | "
-                    f"Win Rate: {win_rate:.1f}% | "
-                    f"Total P&L: [{color}]${total_pnl:+.2f}[/{color}]"
-                )
-        except Exception:
-            pass
+            self._rows.clear()
+        sync_rows(table, rows, self._rows)
+
+        # Totals footer covers every closed trade, not just the rows shown
+        count, wins, total_pnl = totals["trades"], totals["wins"], totals["total_pnl"]
+        if count > 0:
+            win_rate = wins / count * 100
+            color = "green" if total_pnl >= 0 else "red"
+            self._totals.update(
+                f"Total: {count} trades | Wins: {wins} | "
+                f"Win Rate: {win_rate:.1f}% | "
+                f"Total P&L: [{color}]${total_pnl:+.2f}[/{color}]"
+            )
+
+    def _fetch_trades(self, since: Optional[str]) -> tuple:
+        """(trades changed since `since`, footer totals). Runs in a worker thread."""
+        trader = self.engine.paper_trader
+        trades = trader.get_trade_history(self.MAX_ROWS, since)
+        return trades, (trader.get_trade_totals() if trades else None)
+
+    @staticmethod
+    def _format_row(row) -> tuple:
+        """Table cells for one trades row. NULL columns render as placeholders."""
+        pnl = row["pnl"]
+        if pnl is None:
+            pnl_str = "[dim]open[/dim]"
+        elif pnl > 0:
+            pnl_str = f"[green]+${pnl:.2f}[/green]"
+        else:
+            pnl_str = f"[red]-${abs(pnl):.2f}[/red]"
+
+        entry_price = row["entry_price"]
+        exit_price = row["exit_price"]
+        quantity = row["quantity"]
+        return (
+            (row["entry_time"] or "")[:16].replace("T", " "),
+            short_title(row["title"] or row["market_id"] or "", 26),
+            row["direction"] or "—",
+            f"${entry_price:.4f}" if entry_price is not None else "—",
+            f"${exit_price:.4f}" if exit_price else "—",
+            f"{quantity:.3f}" if quantity is not None else "—",
+            pnl_str,
+            f"{row['composite_score']:.1f}" if row["composite_score"] else "—",
+            (row["mode"] or "—").upper(),
+        )
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "export_csv_btn":
@@ -139,20 +190,12 @@ class TradeHistoryTab(Widget):
             filename = f"exports/trades_{timestamp}.csv"
 
             trades = self.engine.paper_trader.get_trade_history(limit=10000)
-            with open(filename, "w", newline="") as f:
+            with open(filename, "w", newline="", buffering=1 << 20) as f:
                 writer = csv.writer(f)
-                writer.writerow([
-                    "entry_time", "exit_time", "market_id", "direction",
-                    "entry_price", "exit_price", "quantity", "pnl",
-                    "composite_score", "mode", "slippage",
-                ])
-                for row in trades:
-                    writer.writerow([
-                        row["entry_time"], row["exit_time"], row["market_id"],
-                        row["direction"], row["entry_price"], row["exit_price"],
-                        row["quantity"], row["pnl"], row["composite_score"],
-                        row["mode"], row["slippage"],
-                    ])
+                writer.writerow(self.EXPORT_COLUMNS)
+                writer.writerows(
+                    tuple(row[column] for column in self.EXPORT_COLUMNS) for row in trades
+                )
 
             # Show brief notification
             header = self.query_one("#trade_header", Static)
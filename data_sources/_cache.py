@@ -0,0 +1,82 @@
+"""
+data_sources/_cache.py — Bounded in-memory TTL cache for the data sources.
+
+The data sources used to keep plain dicts of key -> (value, timestamp) and
+check the age on read. Nothing was ever evicted, so every symbol, query or
+city ever requested stayed in memory for the life of the process.
+
+TTLCache caps the number of entries (least recently used goes first) and
+records an expiry time per entry, so get() returns the default once an
+entry is older than its TTL. Entries use the cache-wide TTL unless set()
+is given one, so a source can match the TTL to how fast that key changes.
+
+Expired entries are not dropped on read: get_stale() still returns them,
+which lets a source fall back to its last known value when the API call
+fails. serve_stale() does the same and keeps the value live for a short
+while, so callers during an outage are answered from memory and the API
+is only retried once that TTL lapses.
+
+Usage:
+    _price_cache = TTLCache(maxsize=256, ttl=30)
+    price = _price_cache.get("BTC")
+    if price is None:
+        price = await fetch()
+        _price_cache["BTC"] = price              # cache-wide TTL
+        _price_cache.set("BTC", price, ttl=10)   # per-entry TTL
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """LRU cache of at most `maxsize` entries, valid for `ttl` seconds by default."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (value, expires_at); ordered oldest-used first
+        self._data: OrderedDict[Hashable, Tuple[Any, float]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for `key`, or `default` if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            return default
+        self._data.move_to_end(key)
+        return entry[0]
+
+    def get_stale(self, key: Hashable, default: Any = None) -> Any:
+        """Return the last value stored for `key`, even if it has expired."""
+        entry = self._data.get(key)
+        return default if entry is None else entry[0]
+
+    def serve_stale(self, key: Hashable, ttl: Optional[float] = None) -> Any:
+        """
+        Return the last value stored for `key` (None if there is none) and
+        keep it valid for another `ttl` seconds (the cache default if None).
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        self.set(key, entry[0], ttl)
+        return entry[0]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store `value`, valid for `ttl` seconds (the cache default if None)."""
+        self._data[key] = (value, time.monotonic() + (self.ttl if ttl is None else ttl))
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.set(key, value)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        self._data.clear()
@@ -0,0 +1,126 @@
+"""
+data_sources/_http.py — Shared aiohttp session for the data sources.
+
+Each data source used to open its own ClientSession with a default
+connector, so every feed paid its own DNS lookups and TCP/TLS handshakes.
+All of them now share one session whose connector keeps connections alive
+and caches DNS, so repeat calls to the same API reuse an open connection.
+
+If aiodns and Brotli are installed (aiohttp[speedups], see the optional
+section of requirements.txt) aiohttp uses them on its own: DNS lookups
+run on c-ares instead of the thread pool, and responses may be
+br-compressed. Nothing here needs to change either way.
+
+The session is bound to the event loop that created it; a call from a
+different loop (e.g. successive asyncio.run() calls in tests) gets a fresh
+one. Close it once at shutdown with close_shared_session().
+
+get_json() is the one-call GET used by the sources. It retries transient
+failures (connection errors, timeouts, 429 and 5xx responses) with
+jittered exponential backoff, so a single blip does not send a source to
+its fallback path. All attempts share one 10 s budget, the timeout of a
+single request, so retrying never makes a stalled API slower to give up
+on. Sources that hold a cached value to fall back on pass retry=False and
+serve that value straight away instead.
+
+json_loads / json_dumps use orjson when it is installed (several times
+faster on large responses such as Binance klines) and the stdlib json
+module otherwise.
+
+Usage:
+    data = await get_json(url, params=params)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from typing import Any, Optional
+
+import aiohttp
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(obj) -> str:
+        """Serialize `obj` to a JSON string."""
+        return orjson.dumps(obj).decode()
+except ImportError:  # orjson is optional — fall back to the stdlib codec
+    from json import dumps as json_dumps, loads as json_loads
+
+_REQUEST_TIMEOUT = 10.0  # seconds; total for all attempts of one get_json()
+_RETRY_ATTEMPTS = 3
+_RETRY_BASE_DELAY = 0.5  # seconds; doubles per attempt, with jitter
+_RETRY_MAX_DELAY = 4.0
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def get_shared_session() -> aiohttp.ClientSession:
+    """Return the shared ClientSession, creating it on first use."""
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            ttl_dns_cache=300,       # seconds
+            keepalive_timeout=75,    # seconds an idle connection stays open
+        )
+        _session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=_REQUEST_TIMEOUT, connect=3, sock_read=7),
+        )
+        _session_loop = loop
+    return _session
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """True for errors worth retrying: network failures, 429 and 5xx."""
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status == 429 or exc.status >= 500
+    return isinstance(exc, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+
+async def get_json(url: str, params: Optional[dict] = None, retry: bool = True) -> Any:
+    """
+    GET `url` on the shared session and decode the JSON body.
+
+    With `retry`, transient failures are retried up to _RETRY_ATTEMPTS
+    times in total, within one _REQUEST_TIMEOUT budget: each retry only
+    gets the time left. Other errors, and the last transient one, are
+    raised to the caller. Pass retry=False when a cached value can answer.
+    """
+    attempts = _RETRY_ATTEMPTS if retry else 1
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + _REQUEST_TIMEOUT
+    for attempt in range(attempts):
+        try:
+            session = await get_shared_session()
+            timeout = aiohttp.ClientTimeout(
+                total=deadline - loop.time(), connect=3, sock_read=7
+            )
+            async with session.get(url, params=params, ssl=True, timeout=timeout) as resp:
+                resp.raise_for_status()
+                return await resp.json(loads=json_loads)
+        except Exception as e:
+            if attempt == attempts - 1 or not _is_transient(e):
+                raise
+            delay = min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2 ** attempt)
+            delay = random.uniform(delay / 2, delay)
+            # Give up if the retry would have under a second left to run
+            if loop.time() + delay > deadline - 1.0:
+                raise
+            await asyncio.sleep(delay)
+
+
+async def close_shared_session() -> None:
+    """Close the shared session if open. Call once on shutdown."""
+    global _session, _session_loop
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
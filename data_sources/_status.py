@@ -0,0 +1,130 @@
+"""
+data_sources/_status.py — Background writer for data_source_status updates.
+
+Every fetch records its outcome in data_source_status. The sources used to
+do that with a blocking execute_write() inside the request coroutine, which
+stalled the event loop for a SQLite commit on every API call. They now call
+record_status(), which only enqueues the update; a single background task
+drains the queue every 0.5 s and writes up to 100 updates per transaction
+from a worker thread.
+
+The writer task starts on the first update and is replaced if the running
+event loop changes. Call flush_status_updates() once at shutdown to write
+whatever is still queued; it waits for a batch that is already being
+written to finish first.
+
+Usage:
+    record_status("binance", "Binance", healthy=True)
+    record_status("binance", "Binance", healthy=False, error=str(e))
+    await flush_status_updates()
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from database.connection import execute_batch
+
+_HEALTHY_SQL = """INSERT INTO data_source_status
+   (id, source_name, status, last_success, error_count, latency_ms)
+   VALUES (?, ?, 'healthy', ?, 0, ?)
+   ON CONFLICT(id) DO UPDATE SET
+     status='healthy', last_success=excluded.last_success, error_count=0,
+     latency_ms=COALESCE(excluded.latency_ms, data_source_status.latency_ms)"""
+
+_DOWN_SQL = """INSERT INTO data_source_status
+   (id, source_name, status, last_error, error_count)
+   VALUES (?, ?, 'down', ?, 1)
+   ON CONFLICT(id) DO UPDATE SET
+     status='down', last_error=excluded.last_error, error_count=error_count+1"""
+
+_FLUSH_INTERVAL = 0.5  # seconds between batch writes
+_MAX_BATCH = 100
+
+_queue: Optional[asyncio.Queue] = None
+_writer: Optional[asyncio.Task] = None
+_writer_loop: Optional[asyncio.AbstractEventLoop] = None
+# The batch the writer is committing from a worker thread, if any
+_in_flight: Optional[asyncio.Future] = None
+
+
+def record_status(
+    source_id: str,
+    source_name: str,
+    healthy: bool,
+    error: str = "",
+    latency_ms: Optional[float] = None,
+) -> None:
+    """Queue a health update for `source_id`. Never blocks on the DB."""
+    now = datetime.now(timezone.utc).isoformat()
+    if healthy:
+        statement = (_HEALTHY_SQL, (source_id, source_name, now, latency_ms))
+    else:
+        statement = (_DOWN_SQL, (source_id, source_name, f"{now}: {error}"))
+    try:
+        queue = _ensure_writer()
+    except RuntimeError:
+        # No running event loop — write synchronously
+        _write([statement])
+        return
+    queue.put_nowait(statement)
+
+
+def _ensure_writer() -> asyncio.Queue:
+    """Return the update queue, starting the writer task on first use."""
+    global _queue, _writer, _writer_loop, _in_flight
+    loop = asyncio.get_running_loop()
+    if _writer is None or _writer.done() or _writer_loop is not loop:
+        _queue = asyncio.Queue()
+        _in_flight = None
+        _writer = loop.create_task(_status_writer(_queue))
+        _writer_loop = loop
+    return _queue
+
+
+async def _status_writer(queue: asyncio.Queue) -> None:
+    """Write queued updates in batches, at most once per _FLUSH_INTERVAL."""
+    global _in_flight
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < _MAX_BATCH and not queue.empty():
+            batch.append(queue.get_nowait())
+        # Shielded so cancelling the writer does not abandon the thread
+        # mid-commit; flush_status_updates() waits for it instead
+        _in_flight = asyncio.ensure_future(asyncio.to_thread(_write, batch))
+        await asyncio.shield(_in_flight)
+        _in_flight = None
+        await asyncio.sleep(_FLUSH_INTERVAL)
+
+
+def _write(batch: List[tuple]) -> None:
+    try:
+        execute_batch(batch)
+    except Exception:
+        pass
+
+
+async def flush_status_updates() -> None:
+    """Stop the writer and write any queued updates. Call once on shutdown."""
+    global _queue, _writer, _writer_loop, _in_flight
+    if _writer is not None and _writer_loop is asyncio.get_running_loop():
+        _writer.cancel()
+        try:
+            await _writer
+        except asyncio.CancelledError:
+            pass
+        # Let a batch already being written finish before the caller goes
+        # on to close the DB connections
+        if _in_flight is not None:
+            await _in_flight
+        pending = []
+        while not _queue.empty():
+            pending.append(_queue.get_nowait())
+        if pending:
+            _write(pending)
+    _queue = None
+    _writer = None
+    _writer_loop = None
+    _in_flight = None
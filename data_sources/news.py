@@ -14,17 +14,21 @@ Usage:
 
 from __future__ import annotations
 
-import time
+import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 
-import aiohttp
+from data_sources._cache import TTLCache
+from data_sources._http import get_json, json_dumps, json_loads
+from data_sources._status import record_status
+from database.connection import execute_batch, execute_query
 
 NEWSAPI_BASE = "https://newsapi.org/v2"
 
-# In-memory cache: query -> (headlines, timestamp)
-_cache: Dict[str, tuple] = {}
-_CACHE_TTL = 1800  # 30 minutes (news doesn't change that fast)
+# In-memory cache: (query, from_hours, language, max_results) -> headlines
+# Up to 30 minutes (news doesn't change that fast); see _headlines_ttl()
+_cache = TTLCache(maxsize=1024, ttl=1800)
+_MIN_CACHE_TTL = 300
 
 # Default queries per market category
 CATEGORY_QUERIES: Dict[str, List[str]] = {
@@ -52,13 +56,6 @@ class NewsDataSource:
     def __init__(self, api_key: str = "") -> None:
         self._api_key = api_key
         self._stub_mode = not bool(api_key)
-        self._session: Optional[aiohttp.ClientSession] = None
-
-    async def _get_session(self) -> aiohttp.ClientSession:
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=10)
-            self._session = aiohttp.ClientSession(timeout=timeout)
-        return self._session
 
     async def get_headlines(
         self,
@@ -79,35 +76,50 @@ class NewsDataSource:
         Returns:
             List of headline strings (title + description).
         """
+        writes: List[tuple] = []
+        headlines = await self._fetch_headlines(query, from_hours, language, max_results, writes)
+        self._flush_writes(writes)
+        return headlines
+
+    async def _fetch_headlines(
+        self,
+        query: str,
+        from_hours: int,
+        language: str,
+        max_results: int,
+        writes: List[tuple],
+    ) -> List[str]:
+        """get_headlines() body; DB writes are queued on `writes` for the caller to flush."""
         # Check memory cache first
-        cache_key = f"{query}:{from_hours}"
+        # max_results is part of the key: it is also the page size requested,
+        # so a short page must not be served to a caller that wants more
+        cache_key = (query, from_hours, language, max_results)
         cached = _cache.get(cache_key)
-        if cached and (time.time() - cached[1] < _CACHE_TTL):
-            return cached[0]
+        if cached is not None:
+            return cached
 
         if self._stub_mode:
             result = self._stub_headlines(query)
-            _cache[cache_key] = (result, time.time())
+            _cache[cache_key] = result
             return result
 
         try:
             from_dt = (datetime.now(timezone.utc) - timedelta(hours=from_hours)).isoformat()
 
-            session = await self._get_session()
-            async with session.get(
+            data = await get_json(
                 f"{NEWSAPI_BASE}/everything",
                 params={
                     "q": query,
                     "from": from_dt,
                     "language": language,
                     "sortBy": "publishedAt",
+                    # Only fetch what the caller keeps (NewsAPI max is 100)
                     "pageSize": min(max_results, 100),
                     "apiKey": self._api_key,
                 },
-                ssl=True,
-            ) as resp:
-                resp.raise_for_status()
-                data = await resp.json()
+                # Cached headlines can answer a failure at once
+                retry=_cache.get_stale(cache_key) is None,
+            )
 
             articles = data.get("articles", [])
             headlines = []
@@ -121,24 +133,37 @@ class NewsDataSource:
                     headlines.append(text)
 
             # Cache result
-            _cache[cache_key] = (headlines, time.time())
+            _cache.set(cache_key, headlines, ttl=self._headlines_ttl(from_hours))
 
             # Also cache in DB for persistence across restarts
-            self._cache_to_db(query, headlines)
+            self._cache_to_db(writes, query, headlines)
 
             self._update_status("newsapi", healthy=True)
             return headlines[:max_results]
 
         except Exception as e:
             self._update_status("newsapi", healthy=False, error=str(e))
-            # Try DB cache as fallback
+            # Serve the last headlines (even if expired), retrying after the
+            # minimum TTL; then try the DB cache
+            stale = _cache.serve_stale(cache_key, ttl=_MIN_CACHE_TTL)
+            if stale is not None:
+                return stale
             db_cached = self._get_db_cache(query)
             if db_cached:
                 return db_cached
             result = self._stub_headlines(query)
-            _cache[cache_key] = (result, time.time())
+            _cache[cache_key] = result
             return result
 
+    @staticmethod
+    def _headlines_ttl(from_hours: int) -> float:
+        """
+        Cache TTL for a query: a minute per hour of lookback, 5-30 minutes.
+        A short window is dominated by the newest articles and turns over
+        quickly; a day-long window barely changes between polls.
+        """
+        return min(_cache.ttl, max(_MIN_CACHE_TTL, from_hours * 60))
+
     async def get_category_headlines(
         self, category: str, limit: int = 15
     ) -> List[str]:
@@ -153,20 +178,17 @@ class NewsDataSource:
             Combined list of headlines for the category.
         """
         queries = CATEGORY_QUERIES.get(category.lower(), [category])
-        all_headlines = []
 
-        for query in queries[:3]:  # limit to 3 queries per category to conserve API calls
-            headlines = await self.get_headlines(query, from_hours=12, max_results=5)
-            all_headlines.extend(headlines)
+        # Limit to 3 queries per category to conserve API calls; run them
+        # concurrently and commit their DB writes in one transaction
+        writes: List[tuple] = []
+        results = await asyncio.gather(*(
+            self._fetch_headlines(query, 12, "en", 5, writes) for query in queries[:3]
+        ))
+        self._flush_writes(writes)
 
         # Deduplicate while preserving order
-        seen = set()
-        unique = []
-        for h in all_headlines:
-            if h not in seen:
-                seen.add(h)
-                unique.append(h)
-
+        unique = list(dict.fromkeys(h for headlines in results for h in headlines))
         return unique[:limit]
 
     # ------------------------------------------------------------------ #
@@ -220,26 +242,30 @@ class NewsDataSource:
     # DB cache
     # ------------------------------------------------------------------ #
 
-    def _cache_to_db(self, query: str, headlines: List[str]) -> None:
-        """Save headlines to DB sentiment_cache for persistence."""
-        if not headlines:
+    @staticmethod
+    def _flush_writes(writes: List[tuple]) -> None:
+        """Commit queued (sql, params) writes in a single transaction."""
+        if not writes:
             return
-        now = datetime.now(timezone.utc).isoformat()
         try:
-            from database.connection import execute_write
-            combined = " | ".join(headlines[:10])
-            execute_write(
-                """INSERT INTO sentiment_cache (source, query, sentiment_score, raw_text, timestamp)
-                   VALUES ('newsapi', ?, 50, ?, ?)""",
-                (query, combined, now),
-            )
+            execute_batch(writes)
         except Exception:
             pass
 
+    def _cache_to_db(self, writes: List[tuple], query: str, headlines: List[str]) -> None:
+        """Queue saving headlines to DB sentiment_cache for persistence."""
+        if not headlines:
+            return
+        now = datetime.now(timezone.utc).isoformat()
+        writes.append((
+            """INSERT INTO sentiment_cache (source, query, sentiment_score, raw_text, timestamp)
+               VALUES ('newsapi', ?, 50, ?, ?)""",
+            (query, json_dumps(headlines[:10]), now),
+        ))
+
     def _get_db_cache(self, query: str) -> Optional[List[str]]:
         """Try to retrieve cached headlines from DB."""
         try:
-            from database.connection import execute_query
             rows = execute_query(
                 """SELECT raw_text FROM sentiment_cache
                    WHERE source='newsapi' AND query=?
@@ -247,35 +273,25 @@ class NewsDataSource:
                    ORDER BY timestamp DESC LIMIT 1""",
                 (query,),
             )
-            if rows and rows[0]["raw_text"]:
-                return rows[0]["raw_text"].split(" | ")
+            raw_text = rows[0]["raw_text"] if rows else None
+            if raw_text:
+                # Stored as a JSON array; older rows joined headlines with " | ".
+                # Parse first rather than sniffing for "[": a legacy row can
+                # start with a bracketed headline such as "[VIDEO] ...".
+                try:
+                    headlines = json_loads(raw_text)
+                except (ValueError, TypeError):
+                    headlines = None
+                if isinstance(headlines, list):
+                    return headlines
+                return raw_text.split(" | ")
         except Exception:
             pass
         return None
 
     def _update_status(self, source_id: str, healthy: bool, error: str = "") -> None:
-        now = datetime.now(timezone.utc).isoformat()
-        try:
-            from database.connection import execute_write
-            if healthy:
-                execute_write(
-                    """INSERT INTO data_source_status (id, source_name, status, last_success, error_count)
-                       VALUES (?, ?, 'healthy', ?, 0)
-                       ON CONFLICT(id) DO UPDATE SET
-                         status='healthy', last_success=excluded.last_success, error_count=0""",
-                    (source_id, "NewsAPI", now),
-                )
-            else:
-                execute_write(
-                    """INSERT INTO data_source_status (id, source_name, status, last_error, error_count)
-                       VALUES (?, ?, 'down', ?, 1)
-                       ON CONFLICT(id) DO UPDATE SET
-                         status='down', last_error=excluded.last_error, error_count=error_count+1""",
-                    (source_id, "NewsAPI", f"{now}: {error}"),
-                )
-        except Exception:
-            pass
+        """Queue a data source health update (written in the background)."""
+        record_status(source_id, "NewsAPI", healthy, error)
 
     async def close(self) -> None:
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """No-op: the shared session is closed by close_shared_session() at shutdown."""
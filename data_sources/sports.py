@@ -17,11 +17,14 @@ Usage:
 from __future__ import annotations
 
 import random
-import time
+import re
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional
 
-import aiohttp
+from data_sources._cache import TTLCache
+from data_sources._http import get_json
+from data_sources._status import record_status
 
 ODDS_API_BASE = "https://api.the-odds-api.com/v4"
 
@@ -34,9 +37,27 @@ SPORT_SLUGS: Dict[str, str] = {
     "ncaaf": "americanfootball_ncaaf",
 }
 
-# Simple cache
-_games_cache: Dict[str, tuple] = {}
-_CACHE_TTL = 600  # 10 minutes
+# Cache: "sport_slug:regions" -> games, 10 minute TTL
+_games_cache = TTLCache(maxsize=64, ttl=600)
+# Moneylines move quickly close to kickoff, so refresh those every minute
+_NEAR_GAME_WINDOW = timedelta(hours=2)
+_NEAR_GAME_TTL = 60
+
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+@lru_cache(maxsize=4096)
+def _match_tokens(text: str) -> FrozenSet[str]:
+    """Distinctive lowercase words (4+ chars) of a team name or market title."""
+    return frozenset(w for w in _WORD_RE.findall(text.lower()) if len(w) > 3)
+
+
+def _american_to_prob(american_odds: int) -> float:
+    """Convert American odds (e.g., +150 or -200) to implied probability."""
+    if american_odds > 0:
+        return 100 / (american_odds + 100)
+    return -american_odds / (100 - american_odds)
 
 
 class SportsDataSource:
@@ -48,13 +69,6 @@ class SportsDataSource:
     def __init__(self, api_key: str = "") -> None:
         self._api_key = api_key
         self._stub_mode = not bool(api_key)
-        self._session: Optional[aiohttp.ClientSession] = None
-
-    async def _get_session(self) -> aiohttp.ClientSession:
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=10)
-            self._session = aiohttp.ClientSession(timeout=timeout)
-        return self._session
 
     async def get_upcoming_games(
         self, sport: str = "nfl", regions: str = "us", limit: int = 20
@@ -74,17 +88,16 @@ class SportsDataSource:
         cache_key = f"{sport_slug}:{regions}"
 
         cached = _games_cache.get(cache_key)
-        if cached and (time.time() - cached[1] < _CACHE_TTL):
-            return cached[0]
+        if cached is not None:
+            return cached
 
         if self._stub_mode:
             result = self._generate_stub_games(sport, limit)
-            _games_cache[cache_key] = (result, time.time())
+            _games_cache[cache_key] = result
             return result
 
         try:
-            session = await self._get_session()
-            async with session.get(
+            data = await get_json(
                 f"{ODDS_API_BASE}/sports/{sport_slug}/odds",
                 params={
                     "apiKey": self._api_key,
@@ -93,47 +106,59 @@ class SportsDataSource:
                     "oddsFormat": "american",
                     "dateFormat": "iso",
                 },
-                ssl=True,
-            ) as resp:
-                resp.raise_for_status()
-                data = await resp.json()
+                # Games cached earlier can answer a failure at once
+                retry=_games_cache.get_stale(cache_key) is None,
+            )
 
             games = [self._normalize_game(g) for g in (data or [])]
             result = games[:limit]
-            _games_cache[cache_key] = (result, time.time())
+            _games_cache.set(cache_key, result, ttl=self._games_ttl(result))
             self._update_status("the_odds_api", healthy=True)
             return result
 
         except Exception as e:
             self._update_status("the_odds_api", healthy=False, error=str(e))
+            # Serve the last games (even if expired) and retry in a minute
+            stale = _games_cache.serve_stale(cache_key, ttl=_NEAR_GAME_TTL)
+            if stale is not None:
+                return stale
             result = self._generate_stub_games(sport, limit)
-            _games_cache[cache_key] = (result, time.time())
+            _games_cache[cache_key] = result
             return result
 
+    @staticmethod
+    def _games_ttl(games: List[dict]) -> float:
+        """Cache TTL: short if any game starts (or started) within the window."""
+        soon = datetime.now(timezone.utc) + _NEAR_GAME_WINDOW
+        for game in games:
+            try:
+                if datetime.fromisoformat(game["commence_time"]) <= soon:
+                    return _NEAR_GAME_TTL
+            except (KeyError, TypeError, ValueError):
+                continue
+        return _games_cache.ttl
+
     def _normalize_game(self, raw: dict) -> dict:
         """Normalize The Odds API game dict to our standard format."""
         home = raw.get("home_team", "")
         away = raw.get("away_team", "")
 
-        # Extract best odds for each team from bookmakers
+        # Odds come from the first bookmaker's first h2h market
         home_prob = 0.5
         away_prob = 0.5
 
-        for bookmaker in raw.get("bookmakers", []):
-            for market in bookmaker.get("markets", []):
-                if market.get("key") == "h2h":
-                    outcomes = market.get("outcomes", [])
-                    for outcome in outcomes:
-                        price = outcome.get("price", 0)
-                        if price != 0:
-                            # Convert American odds to probability
-                            prob = self._american_to_prob(price)
-                            if outcome.get("name") == home:
-                                home_prob = prob
-                            elif outcome.get("name") == away:
-                                away_prob = prob
-                    break
-            break  # just use first bookmaker for now
+        bookmakers = raw.get("bookmakers") or []
+        markets = (bookmakers[0].get("markets") or []) if bookmakers else []
+        h2h = next((m for m in markets if m.get("key") == "h2h"), None)
+        if h2h is not None:
+            for outcome in h2h.get("outcomes", []):
+                price = outcome.get("price", 0)
+                if price != 0:
+                    name = outcome.get("name")
+                    if name == home:
+                        home_prob = _american_to_prob(price)
+                    elif name == away:
+                        away_prob = _american_to_prob(price)
 
         # Normalize probabilities (they won't sum to 1 due to vig)
         total = home_prob + away_prob
@@ -149,17 +174,9 @@ class SportsDataSource:
             "commence_time": raw.get("commence_time", ""),
             "home_win_prob": round(home_prob, 4),
             "away_win_prob": round(away_prob, 4),
-            "bookmaker": raw.get("bookmakers", [{}])[0].get("title", "") if raw.get("bookmakers") else "",
+            "bookmaker": bookmakers[0].get("title", "") if bookmakers else "",
         }
 
-    @staticmethod
-    def _american_to_prob(american_odds: int) -> float:
-        """Convert American odds (e.g., +150 or -200) to implied probability."""
-        if american_odds > 0:
-            return 100 / (american_odds + 100)
-        else:
-            return abs(american_odds) / (abs(american_odds) + 100)
-
     def compute_prediction_market_edge(
         self,
         game: dict,
@@ -173,13 +190,11 @@ class SportsDataSource:
         but the prediction market has "Team A wins?" at 60%, there's a 15%
         edge opportunity.
         """
-        title_lower = market_title.lower()
-        home = game.get("home_team", "").lower()
-        away = game.get("away_team", "").lower()
-
-        # Try to match the market to the game
-        home_in_title = any(word in title_lower for word in home.split() if len(word) > 3)
-        away_in_title = any(word in title_lower for word in away.split() if len(word) > 3)
+        # Try to match the market to the game. Tokens are cached per string:
+        # every market title is checked against every game and vice versa.
+        title_tokens = _match_tokens(market_title)
+        home_in_title = not title_tokens.isdisjoint(_match_tokens(game.get("home_team", "")))
+        away_in_title = not title_tokens.isdisjoint(_match_tokens(game.get("away_team", "")))
 
         if not (home_in_title or away_in_title):
             return None
@@ -242,29 +257,8 @@ class SportsDataSource:
         return games
 
     def _update_status(self, source_id: str, healthy: bool, error: str = "") -> None:
-        import datetime
-        now = datetime.datetime.now(datetime.timezone.utc).isoformat()
-        try:
-            from database.connection import execute_write
-            if healthy:
-                execute_write(
-                    """INSERT INTO data_source_status (id, source_name, status, last_success, error_count)
-                       VALUES (?, ?, 'healthy', ?, 0)
-                       ON CONFLICT(id) DO UPDATE SET
-                         status='healthy', last_success=excluded.last_success, error_count=0""",
-                    (source_id, "The Odds API", now),
-                )
-            else:
-                execute_write(
-                    """INSERT INTO data_source_status (id, source_name, status, last_error, error_count)
-                       VALUES (?, ?, 'down', ?, 1)
-                       ON CONFLICT(id) DO UPDATE SET
-                         status='down', last_error=excluded.last_error, error_count=error_count+1""",
-                    (source_id, "The Odds API", f"{now}: {error}"),
-                )
-        except Exception:
-            pass
+        """Queue a data source health update (written in the background)."""
+        record_status(source_id, "The Odds API", healthy, error)
 
     async def close(self) -> None:
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """No-op: the shared session is closed by close_shared_session() at shutdown."""
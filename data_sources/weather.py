@@ -20,13 +20,14 @@ import random
 import time
 from typing import Dict, List, Optional
 
-import aiohttp
+from data_sources._cache import TTLCache
+from data_sources._http import get_json
+from data_sources._status import record_status
 
 OWM_BASE = "https://api.openweathermap.org/data/2.5"
 
-# Cache: city -> (data, timestamp)
-_weather_cache: Dict[str, tuple] = {}
-_CACHE_TTL = 300  # 5 minutes
+# Cache: "kind:city" -> data, 5 minute TTL
+_weather_cache = TTLCache(maxsize=128, ttl=300)
 
 
 class WeatherDataSource:
@@ -38,13 +39,6 @@ class WeatherDataSource:
     def __init__(self, api_key: str = "") -> None:
         self._api_key = api_key
         self._stub_mode = not bool(api_key)
-        self._session: Optional[aiohttp.ClientSession] = None
-
-    async def _get_session(self) -> aiohttp.ClientSession:
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=10)
-            self._session = aiohttp.ClientSession(timeout=timeout)
-        return self._session
 
     async def get_current(self, city: str) -> dict:
         """
@@ -63,27 +57,25 @@ class WeatherDataSource:
         """
         cache_key = f"current:{city.lower()}"
         cached = _weather_cache.get(cache_key)
-        if cached and (time.time() - cached[1] < _CACHE_TTL):
-            return cached[0]
+        if cached is not None:
+            return cached
 
         if self._stub_mode:
             result = self._stub_current(city)
-            _weather_cache[cache_key] = (result, time.time())
+            _weather_cache[cache_key] = result
             return result
 
         try:
-            session = await self._get_session()
-            async with session.get(
+            data = await get_json(
                 f"{OWM_BASE}/weather",
                 params={
                     "q": city,
                     "appid": self._api_key,
                     "units": "imperial",
                 },
-                ssl=True,
-            ) as resp:
-                resp.raise_for_status()
-                data = await resp.json()
+                # A cached reading can answer a failure at once
+                retry=_weather_cache.get_stale(cache_key) is None,
+            )
 
             result = {
                 "city": city,
@@ -94,14 +86,18 @@ class WeatherDataSource:
                 "wind_mph": data["wind"]["speed"],
                 "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
             }
-            _weather_cache[cache_key] = (result, time.time())
+            _weather_cache[cache_key] = result
             self._update_status("openweathermap", healthy=True)
             return result
 
         except Exception as e:
             self._update_status("openweathermap", healthy=False, error=str(e))
+            # Serve the last reading (even if expired) for another TTL
+            stale = _weather_cache.serve_stale(cache_key)
+            if stale is not None:
+                return stale
             result = self._stub_current(city)
-            _weather_cache[cache_key] = (result, time.time())
+            _weather_cache[cache_key] = result
             return result
 
     async def get_forecast(self, city: str, days: int = 5) -> List[dict]:
@@ -115,8 +111,7 @@ class WeatherDataSource:
             return self._stub_forecast(city, days)
 
         try:
-            session = await self._get_session()
-            async with session.get(
+            data = await get_json(
                 f"{OWM_BASE}/forecast",
                 params={
                     "q": city,
@@ -124,10 +119,7 @@ class WeatherDataSource:
                     "units": "imperial",
                     "cnt": days * 8,  # 8 readings per day (3-hour intervals)
                 },
-                ssl=True,
-            ) as resp:
-                resp.raise_for_status()
-                data = await resp.json()
+            )
 
             # Aggregate 3-hour readings into daily forecasts
             daily: Dict[str, dict] = {}
@@ -247,30 +239,8 @@ class WeatherDataSource:
         return forecasts
 
     def _update_status(self, source_id: str, healthy: bool, error: str = "") -> None:
-        """Update data source health status."""
-        import datetime
-        now = datetime.datetime.now(datetime.timezone.utc).isoformat()
-        try:
-            from database.connection import execute_write
-            if healthy:
-                execute_write(
-                    """INSERT INTO data_source_status (id, source_name, status, last_success, error_count)
-                       VALUES (?, ?, 'healthy', ?, 0)
-                       ON CONFLICT(id) DO UPDATE SET
-                         status='healthy', last_success=excluded.last_success, error_count=0""",
-                    (source_id, "OpenWeatherMap", now),
-                )
-            else:
-                execute_write(
-                    """INSERT INTO data_source_status (id, source_name, status, last_error, error_count)
-                       VALUES (?, ?, 'down', ?, 1)
-                       ON CONFLICT(id) DO UPDATE SET
-                         status='down', last_error=excluded.last_error, error_count=error_count+1""",
-                    (source_id, "OpenWeatherMap", f"{now}: {error}"),
-                )
-        except Exception:
-            pass
+        """Queue a data source health update (written in the background)."""
+        record_status(source_id, "OpenWeatherMap", healthy, error)
 
     async def close(self) -> None:
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """No-op: the shared session is closed by close_shared_session() at shutdown."""
@@ -25,9 +25,16 @@ from typing import Generator
 from config import config
 
 # Thread-local storage so each thread gets its own connection.
-# The dashboard and engine run in the same thread (asyncio), but
-# this protects against any accidental multi-threaded access.
+# The dashboard and engine share the event loop thread, but the dashboard's
+# DataHub and tab fetches and the data-source status writer run their
+# queries via asyncio.to_thread, so each executor thread opens its own.
+# Every connection handed out is also recorded in _connections so
+# close_connection() can close them all, not just the calling thread's;
+# bumping _generation makes other threads reopen on their next access.
 _local = threading.local()
+_connections: list[sqlite3.Connection] = []
+_connections_lock = threading.Lock()
+_generation = 0
 
 # The resolved DB path — set once at initialization.
 _db_path: str = ""
@@ -39,14 +46,9 @@ def initialize_db(db_path: str | None = None) -> None:
     Call once at application startup before any DB operations.
     """
     global _db_path
-    # Close any cached thread-local connection so the next access
+    # Close every cached connection (all threads) so the next access
     # opens a fresh connection to the new path.
-    if hasattr(_local, "conn") and _local.conn is not None:
-        try:
-            _local.conn.close()
-        except Exception:
-            pass
-        _local.conn = None
+    close_connection()
     _db_path = db_path or config.db_path
     # Create the file and run initial PRAGMA settings.
     conn = _get_raw_connection()
@@ -75,9 +77,14 @@ def get_connection() -> sqlite3.Connection:
     Return the thread-local SQLite connection, creating it if needed.
     The connection is reused across calls within the same thread.
     """
-    if not hasattr(_local, "conn") or _local.conn is None:
-        _local.conn = _get_raw_connection()
-    return _local.conn
+    conn = getattr(_local, "conn", None)
+    if conn is None or _local.generation != _generation:
+        conn = _get_raw_connection()
+        with _connections_lock:
+            _connections.append(conn)
+        _local.conn = conn
+        _local.generation = _generation
+    return conn
 
 
 @contextmanager
@@ -100,13 +107,21 @@ def get_db() -> Generator[sqlite3.Connection, None, None]:
 
 
 def close_connection() -> None:
-    """Close the thread-local connection if open. Call on shutdown."""
-    if hasattr(_local, "conn") and _local.conn is not None:
+    """
+    Close the connections of every thread, including the executor threads
+    used by asyncio.to_thread. Call on shutdown.
+    """
+    global _generation
+    with _connections_lock:
+        connections = _connections[:]
+        _connections.clear()
+        _generation += 1
+    for conn in connections:
         try:
-            _local.conn.close()
+            conn.close()
         except Exception:
             pass
-        _local.conn = None
+    _local.conn = None
 
 
 def execute_query(sql: str, params: tuple = ()) -> list[sqlite3.Row]:
@@ -119,6 +134,18 @@ def execute_query(sql: str, params: tuple = ()) -> list[sqlite3.Row]:
         return cursor.fetchall()
 
 
+def execute_query_tuples(sql: str, params: tuple = ()) -> list[tuple]:
+    """
+    Like execute_query(), but rows are plain tuples in SELECT column order.
+    For hot polling loops that unpack every row: skips sqlite3.Row and its
+    per-column name lookups. Select explicit columns, not *.
+    """
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        return cursor.execute(sql, params).fetchall()
+
+
 def execute_write(sql: str, params: tuple = ()) -> int:
     """
     Execute an INSERT/UPDATE/DELETE and return the lastrowid.
@@ -132,3 +159,13 @@ def execute_many(sql: str, params_list: list[tuple]) -> None:
     """Execute a batch write operation."""
     with get_db() as conn:
         conn.executemany(sql, params_list)
+
+
+def execute_batch(statements: list[tuple[str, tuple]]) -> None:
+    """
+    Execute several (sql, params) writes in a single transaction.
+    Like execute_many(), but the statements may differ; one commit total.
+    """
+    with get_db() as conn:
+        for sql, params in statements:
+            conn.execute(sql, params)
@@ -62,6 +62,8 @@ class PaperTradingEngine:
         self.risk: RiskManager = risk or RiskManager(starting_balance)
         self._log = log_callback or (lambda level, msg: None)
         self._mode: str = "paper"
+        # Called with the new balance after every fill or close (e.g. dashboard subtitle)
+        self._balance_listeners: List[Callable[[float], None]] = []
 
         # Restore state from DB if any open positions exist
         self._restore_state()
@@ -74,8 +76,7 @@ class PaperTradingEngine:
                 "SELECT balance FROM balance_history WHERE mode='paper' ORDER BY timestamp DESC LIMIT 1"
             )
             if rows:
-                self.balance = rows[0]["balance"]
-                self.risk.update_balance(self.balance)
+                self._set_balance(rows[0]["balance"])
 
             # Restore open positions into risk manager
             pos_rows = execute_query(
@@ -95,6 +96,20 @@ class PaperTradingEngine:
         except Exception as e:
             self._log("WARNING", f"Could not restore paper trading state: {e}")
 
+    def add_balance_listener(self, callback: Callable[[float], None]) -> None:
+        """Register `callback(balance)` to be called whenever the balance changes."""
+        self._balance_listeners.append(callback)
+
+    def _set_balance(self, balance: float) -> None:
+        """Update the balance, the risk manager, and any balance listeners."""
+        self.balance = balance
+        self.risk.update_balance(balance)
+        for callback in self._balance_listeners:
+            try:
+                callback(balance)
+            except Exception:
+                pass  # a listener must never break trade execution
+
     # ------------------------------------------------------------------ #
     # Trade execution
     # ------------------------------------------------------------------ #
@@ -152,8 +167,7 @@ class PaperTradingEngine:
             return None
 
         # Deduct from balance
-        self.balance -= actual_cost
-        self.risk.update_balance(self.balance)
+        self._set_balance(self.balance - actual_cost)
 
         # Build trade record
         now = datetime.now(timezone.utc).isoformat()
@@ -256,8 +270,7 @@ class PaperTradingEngine:
 
         # Update balance
         proceeds = filled_exit * trade.quantity
-        self.balance += proceeds
-        self.risk.update_balance(self.balance)
+        self._set_balance(self.balance + proceeds)
 
         # Update DB
         now = datetime.now(timezone.utc).isoformat()
@@ -340,18 +353,77 @@ class PaperTradingEngine:
                ORDER BY t.entry_time DESC"""
         )
 
-    def get_trade_history(self, limit: int = 100) -> list:
-        """Return recent paper trades from the DB."""
+    def get_open_positions_with_pnl(self) -> list:
+        """
+        Open paper positions with mark-to-market P&L computed in SQLite.
+
+        Adds to each get_open_positions() row:
+          mark_price      — markets.yes_price, else positions.current_price, else entry
+          open_pnl        — (mark_price - entry_price) * quantity
+          total_open_pnl  — sum of open_pnl across all returned rows
+        Zero/NULL prices fall through to the next source, and a missing
+        entry price counts as 0.5.
+        """
+        return execute_query(
+            """SELECT *,
+                      (mark_price - _entry) * _qty AS open_pnl,
+                      SUM((mark_price - _entry) * _qty) OVER () AS total_open_pnl
+               FROM (
+                   SELECT p.*, t.composite_score, t.signal_breakdown, t.entry_time,
+                          m.title, m.category, m.yes_price,
+                          COALESCE(NULLIF(p.entry_price, 0), 0.5) AS _entry,
+                          COALESCE(p.quantity, 0.0) AS _qty,
+                          COALESCE(NULLIF(m.yes_price, 0), NULLIF(p.current_price, 0),
+                                   NULLIF(p.entry_price, 0), 0.5) AS mark_price
+                   FROM positions p
+                   JOIN trades t ON p.trade_id = t.id
+                   LEFT JOIN markets m ON t.market_id = m.id
+                   WHERE t.status = 'open' AND t.mode = 'paper'
+               )
+               ORDER BY entry_time DESC"""
+        )
+
+    def get_trade_history(self, limit: int = 100, since: Optional[str] = None) -> list:
+        """
+        Return recent paper trades from the DB, newest first.
+        With `since` (an ISO timestamp), only trades opened or closed after it.
+        """
+        if since is None:
+            return execute_query(
+                """SELECT t.*, m.title, m.category
+                   FROM trades t
+                   LEFT JOIN markets m ON t.market_id = m.id
+                   WHERE t.mode = 'paper'
+                   ORDER BY t.entry_time DESC
+                   LIMIT ?""",
+                (limit,),
+            )
         return execute_query(
             """SELECT t.*, m.title, m.category
                FROM trades t
                LEFT JOIN markets m ON t.market_id = m.id
-               WHERE t.mode = 'paper'
+               WHERE t.mode = 'paper' AND (t.entry_time > ? OR t.exit_time > ?)
                ORDER BY t.entry_time DESC
                LIMIT ?""",
-            (limit,),
+            (since, since, limit),
         )
 
+    def get_trade_totals(self) -> dict:
+        """
+        Return closed paper trade totals (trades, wins, losses, total_pnl),
+        aggregated SQL-side over all trades rather than a display window.
+        """
+        row = execute_query(
+            """SELECT
+                COUNT(pnl) as trades,
+                COUNT(*) FILTER (WHERE pnl > 0) as wins,
+                COUNT(*) FILTER (WHERE pnl <= 0) as losses,
+                COALESCE(SUM(pnl), 0.0) as total_pnl
+               FROM trades
+               WHERE mode = 'paper'"""
+        )[0]
+        return dict(row)
+
     def get_stats(self) -> dict:
         """Return performance statistics."""
         rows = execute_query(
@@ -125,6 +125,10 @@ class SignalAggregator:
         else:
             recommendation = "HOLD"
 
+        # TechnicalAnalyzer returns unrounded floats; round once here, where
+        # the composite is handed to persistence and display
+        ta_score = round(ta_score, 2)
+
         return {
             "market_id": market_id,
             "final_score": final_score,
@@ -0,0 +1,33 @@
+"""
+engine/snapshot.py — Immutable view of engine state for the dashboard.
+
+The scan loop mutates `markets` / `latest_scores` as it goes. Instead of the
+dashboard reading those live containers on every tick, the engine
+periodically publishes a frozen EngineSnapshot and swaps it in with a single
+attribute assignment. Readers never see a half-updated view, need no lock,
+and can skip work with an identity check when nothing was published since
+their last render.
+
+Usage:
+    snap = engine.snapshot
+    if snap is self._last_snapshot:
+        return
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class EngineSnapshot:
+    """Markets and their latest composite scores as of `ts` (time.time())."""
+
+    markets: Tuple[dict, ...]
+    latest_scores: Mapping[str, Mapping[str, Any]]
+    ts: float
+
+
+EMPTY_SNAPSHOT = EngineSnapshot(markets=(), latest_scores=MappingProxyType({}), ts=0.0)
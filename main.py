@@ -26,11 +26,14 @@ import signal
 import sys
 import time
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional
 
+from analysis.technical import CandleSeries
 from config import config
 from database.connection import initialize_db
 from database.schema import create_all_tables
+from engine.snapshot import EMPTY_SNAPSHOT, EngineSnapshot
 
 
 def _setup_logging() -> None:
@@ -59,6 +62,7 @@ class TradingEngine:
     """
 
     SCAN_INTERVAL: int = 30   # seconds between full market scans
+    SNAPSHOT_INTERVAL: float = 5.0  # min seconds between dashboard snapshots mid-scan
     LOG_MODULE: str = "engine"
 
     def __init__(self) -> None:
@@ -69,6 +73,12 @@ class TradingEngine:
         # These are populated in initialize()
         self.markets: List[dict] = []
         self.latest_scores: Dict[str, dict] = {}
+        # Immutable copy of markets/latest_scores for the dashboard, replaced
+        # wholesale by _publish_snapshot()
+        self.snapshot: EngineSnapshot = EMPTY_SNAPSHOT
+        # Set whenever markets, scores, signals, trades or the balance change;
+        # the dashboard waits on it instead of polling on fixed timers
+        self.state_dirty = asyncio.Event()
 
         # Component placeholders (initialized in initialize())
         self.kalshi = None
@@ -137,6 +147,8 @@ class TradingEngine:
             risk=self.risk,
             log_callback=self._log,
         )
+        # Fills and closes move the balance, positions and trade history
+        self.paper_trader.add_balance_listener(lambda _balance: self.state_dirty.set())
         self.aggregator = SignalAggregator()
         self.agent = AgentEngine()
 
@@ -148,6 +160,7 @@ class TradingEngine:
 
         # Load initial market list
         self.markets = await self._fetch_all_markets()
+        self._publish_snapshot()
         self._log("INFO", f"Loaded {len(self.markets)} markets across all exchanges and categories")
 
         # Notify startup
@@ -262,6 +275,10 @@ class TradingEngine:
                 except Exception as e:
                     market_id = market.get("id", "unknown")
                     self._log("ERROR", f"Error analyzing {market_id}: {e}")
+                # Let the dashboard see scores as they land, without copying per market
+                if time.time() - self.snapshot.ts >= self.SNAPSHOT_INTERVAL:
+                    self._publish_snapshot()
+            self._publish_snapshot()
 
             # Check agent for weight adjustments
             try:
@@ -280,6 +297,15 @@ class TradingEngine:
             # Wait for next scan interval
             await asyncio.sleep(max(0, self.SCAN_INTERVAL - scan_duration))
 
+    def _publish_snapshot(self) -> None:
+        """Swap in a frozen copy of markets and latest scores for the dashboard."""
+        self.snapshot = EngineSnapshot(
+            markets=tuple(self.markets),
+            latest_scores=MappingProxyType(dict(self.latest_scores)),
+            ts=time.time(),
+        )
+        self.state_dirty.set()
+
     async def _analyze_market(self, market: dict) -> None:
         """
         Run the full signal pipeline for a single market.
@@ -299,16 +325,16 @@ class TradingEngine:
                 # For Polymarket: use crypto price data as proxy where applicable
                 if category == "crypto":
                     symbol = "BTC" if "btc" in ticker.lower() or "bitcoin" in ticker.lower() else "ETH"
-                    raw_candles = await self.crypto_feed.get_candles(symbol, interval="1h", limit=100)
+                    series = await self.crypto_feed.get_candle_series(symbol, interval="1h", limit=100)
                     # Normalize crypto prices to [0, 1] scale for TA (rough approximation)
-                    if raw_candles:
-                        max_price = max(c["close"] for c in raw_candles)
+                    if len(series):
+                        max_price = float(series.close.max())
                         if max_price > 0:
-                            candles = [
-                                {**c, "open": c["open"]/max_price, "high": c["high"]/max_price,
-                                 "low": c["low"]/max_price, "close": c["close"]/max_price}
-                                for c in raw_candles
-                            ]
+                            candles = CandleSeries(
+                                series.open / max_price, series.high / max_price,
+                                series.low / max_price, series.close / max_price,
+                                series.volume,
+                            )
         except Exception as e:
             self._log("DEBUG", f"Could not fetch candles for {market_id}: {e}")
 
@@ -359,6 +385,7 @@ class TradingEngine:
         # 7. Save signals to DB
         try:
             self.aggregator.save_all_signals(market_id, composite)
+            self.state_dirty.set()
         except Exception:
             pass
 
@@ -433,6 +460,10 @@ class TradingEngine:
                 await self.sports_feed.close()
             if self.news_feed:
                 await self.news_feed.close()
+            from data_sources._http import close_shared_session
+            from data_sources._status import flush_status_updates
+            await close_shared_session()
+            await flush_status_updates()
         except Exception:
             pass
 
@@ -0,0 +1,69 @@
+"""
+tests/test_cache.py — Tests for the data source TTL cache.
+
+Run with: python -m pytest tests/test_cache.py -v
+"""
+
+import pytest
+
+from data_sources import _cache
+from data_sources._cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable stand-in for time.monotonic()."""
+    now = [1000.0]
+    monkeypatch.setattr(_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+class TestTTLCache:
+    """Test expiry, stale reads, and LRU eviction."""
+
+    def test_get_before_and_after_expiry(self, clock):
+        cache = TTLCache(maxsize=4, ttl=30)
+        cache["BTC"] = 65000.0
+        assert cache.get("BTC") == 65000.0
+        clock[0] += 31
+        assert cache.get("BTC") is None
+        assert cache.get_stale("BTC") == 65000.0
+
+    def test_missing_key_returns_default(self, clock):
+        cache = TTLCache(maxsize=4, ttl=30)
+        assert cache.get("ETH") is None
+        assert cache.get("ETH", 0.0) == 0.0
+        assert cache.get_stale("ETH") is None
+
+    def test_evicts_least_recently_used(self, clock):
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache.get("a")          # "b" is now least recently used
+        cache["c"] = 3
+        assert len(cache) == 2
+        assert cache.get("a") == 1
+        assert cache.get_stale("b") is None
+        assert cache.get("c") == 3
+
+    def test_per_entry_ttl(self, clock):
+        cache = TTLCache(maxsize=4, ttl=30)
+        cache.set("fast", 1, ttl=5)
+        cache["slow"] = 2
+        clock[0] += 10
+        assert cache.get("fast") is None
+        assert cache.get("slow") == 2
+
+    def test_serve_stale_extends_expired_entry(self, clock):
+        cache = TTLCache(maxsize=4, ttl=30)
+        assert cache.serve_stale("BTC") is None
+        cache["BTC"] = 65000.0
+        clock[0] += 31
+        assert cache.serve_stale("BTC", ttl=10) == 65000.0
+        assert cache.get("BTC") == 65000.0
+        clock[0] += 11
+        assert cache.get("BTC") is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
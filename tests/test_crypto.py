@@ -0,0 +1,50 @@
+"""
+tests/test_crypto.py — Tests for the batched Binance price fetch.
+
+Run with: python -m pytest tests/test_crypto.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from data_sources import crypto
+from data_sources.crypto import SYMBOL_MAP, CryptoDataSource
+
+
+@pytest.fixture
+def ticker(monkeypatch):
+    """Fake Binance ticker: the batched call answers only BTCUSDT."""
+    calls = []
+
+    async def fake_get_json(url, params=None, retry=True):
+        calls.append(params)
+        if "symbols" in params:
+            return [{"symbol": "BTCUSDT", "price": "65000.0"}]
+        return {"symbol": params["symbol"], "price": "100.0"}
+
+    monkeypatch.setattr(crypto, "get_json", fake_get_json)
+    crypto._price_cache.clear()
+    crypto._price_history.clear()
+    yield calls
+    crypto._price_cache.clear()
+    crypto._price_history.clear()
+
+
+class TestGetAllPrices:
+    """Test that every tracked symbol gets a price."""
+
+    def test_symbols_missing_from_batch_are_fetched(self, ticker):
+        prices = asyncio.run(CryptoDataSource().get_all_prices())
+        assert set(prices) == set(SYMBOL_MAP)
+        assert prices["BTC"] == 65000.0
+        # One batched call, then one call per symbol it left out
+        singles = sorted(p["symbol"] for p in ticker if "symbol" in p)
+        assert singles == sorted(v for k, v in SYMBOL_MAP.items() if k != "BTC")
+
+    def test_symbols_missing_from_batch_serve_stale_price(self, ticker):
+        crypto._price_cache.set("ETH", 3100.0, ttl=-1)  # expired, still stale-readable
+        prices = asyncio.run(CryptoDataSource().get_all_prices())
+        assert set(prices) == set(SYMBOL_MAP)
+        assert prices["ETH"] == 3100.0
+        assert all(p.get("symbol") != "ETHUSDT" for p in ticker)
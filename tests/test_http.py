@@ -0,0 +1,138 @@
+"""
+tests/test_http.py — Tests for get_json() retries and its shared deadline.
+
+Run with: python -m pytest tests/test_http.py -v
+"""
+
+import asyncio
+
+import aiohttp
+import pytest
+
+from data_sources import _http
+
+
+class _FakeResponse:
+    def __init__(self, status: int, body=None) -> None:
+        self.status = status
+        self.body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(None, (), status=self.status)
+
+    async def json(self, loads=None):
+        return self.body
+
+
+class _FakeSession:
+    """Stand-in for the shared session: replays `outcomes`, one per get()."""
+
+    def __init__(self, outcomes) -> None:
+        self.outcomes = list(outcomes)
+        self.timeouts = []
+
+    def get(self, url, params=None, ssl=True, timeout=None):
+        self.timeouts.append(timeout)
+        outcome = self.outcomes.pop(0)
+        if callable(outcome):
+            outcome = outcome(timeout)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def session(monkeypatch):
+    """Install a _FakeSession; the test sets .outcomes before calling."""
+    fake = _FakeSession([])
+
+    async def get_shared_session():
+        return fake
+
+    monkeypatch.setattr(_http, "get_shared_session", get_shared_session)
+    return fake
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Fake time for get_json(): the running loop's time() reads `now[0]`,
+    and asyncio.sleep() advances it instead of waiting.
+    """
+    now = [0.0]
+    sleeps = []
+
+    async def fake_sleep(delay, result=None):
+        sleeps.append(delay)
+        now[0] += delay
+        return result
+
+    monkeypatch.setattr(_http.asyncio, "sleep", fake_sleep)
+    return now, sleeps
+
+
+def _run(coro_fn, monkeypatch, now):
+    """Run coro_fn() on a fresh loop whose time() is the fake clock."""
+    async def main():
+        monkeypatch.setattr(asyncio.get_running_loop(), "time", lambda: now[0])
+        return await coro_fn()
+
+    return asyncio.run(main())
+
+
+class TestGetJson:
+    """Test which failures are retried and that retries keep to the deadline."""
+
+    @pytest.mark.parametrize("status", [429, 500, 503])
+    def test_transient_status_is_retried(self, session, clock, monkeypatch, status):
+        now, sleeps = clock
+        session.outcomes = [_FakeResponse(status), _FakeResponse(200, {"ok": True})]
+        data = _run(lambda: _http.get_json("https://api.test/x"), monkeypatch, now)
+        assert data == {"ok": True}
+        assert len(session.timeouts) == 2
+        assert len(sleeps) == 1
+
+    @pytest.mark.parametrize("status", [400, 401, 404])
+    def test_client_error_is_raised_at_once(self, session, clock, monkeypatch, status):
+        now, sleeps = clock
+        session.outcomes = [_FakeResponse(status), _FakeResponse(200, {"ok": True})]
+        with pytest.raises(aiohttp.ClientResponseError) as info:
+            _run(lambda: _http.get_json("https://api.test/x"), monkeypatch, now)
+        assert info.value.status == status
+        assert len(session.timeouts) == 1
+        assert sleeps == []
+
+    def test_retry_false_makes_one_attempt(self, session, clock, monkeypatch):
+        now, sleeps = clock
+        session.outcomes = [_FakeResponse(503), _FakeResponse(200, {"ok": True})]
+        with pytest.raises(aiohttp.ClientResponseError):
+            _run(
+                lambda: _http.get_json("https://api.test/x", retry=False),
+                monkeypatch, now,
+            )
+        assert len(session.timeouts) == 1
+        assert sleeps == []
+
+    def test_stalled_attempts_stop_within_request_timeout(self, session, clock, monkeypatch):
+        now, sleeps = clock
+
+        def stall(timeout):
+            # A stalled read gives up after sock_read, or sooner if the
+            # request's total runs out first
+            now[0] += min(timeout.total, timeout.sock_read)
+            return asyncio.TimeoutError()
+
+        session.outcomes = [stall] * _http._RETRY_ATTEMPTS
+        with pytest.raises(asyncio.TimeoutError):
+            _run(lambda: _http.get_json("https://api.test/x"), monkeypatch, now)
+        assert len(session.timeouts) > 1
+        assert now[0] <= _http._REQUEST_TIMEOUT
+        # The retry was only given the time left in the budget
+        assert session.timeouts[1].total < _http._REQUEST_TIMEOUT - session.timeouts[0].sock_read
@@ -0,0 +1,56 @@
+"""
+tests/test_news.py — Tests for the news headline DB cache.
+
+Run with: python -m pytest tests/test_news.py -v
+"""
+
+import pytest
+
+from data_sources.news import NewsDataSource
+
+
+@pytest.fixture
+def db_setup(tmp_path):
+    """Initialize a fresh test database."""
+    from database.connection import close_connection, initialize_db
+    from database.schema import create_all_tables
+    initialize_db(str(tmp_path / "test.db"))
+    create_all_tables()
+    yield
+    close_connection()
+
+
+def _insert_row(query: str, raw_text: str) -> None:
+    from database.connection import execute_write
+    execute_write(
+        """INSERT INTO sentiment_cache (source, query, sentiment_score, raw_text, timestamp)
+           VALUES ('newsapi', ?, 50, ?, datetime('now'))""",
+        (query, raw_text),
+    )
+
+
+class TestNewsDbCache:
+    """Test reading JSON rows and legacy " | "-joined rows."""
+
+    def test_json_row_round_trip(self, db_setup):
+        source = NewsDataSource()
+        headlines = ["Bitcoin tops $100k | analysts react", "ETH upgrade ships"]
+        writes = []
+        source._cache_to_db(writes, "Bitcoin", headlines)
+        source._flush_writes(writes)
+        assert source._get_db_cache("Bitcoin") == headlines
+
+    def test_legacy_row(self, db_setup):
+        _insert_row("Bitcoin", "Bitcoin tops $100k | ETH upgrade ships")
+        assert NewsDataSource()._get_db_cache("Bitcoin") == [
+            "Bitcoin tops $100k", "ETH upgrade ships",
+        ]
+
+    def test_legacy_row_starting_with_bracket(self, db_setup):
+        _insert_row("Bitcoin", "[VIDEO] Bitcoin explained | ETH upgrade ships")
+        assert NewsDataSource()._get_db_cache("Bitcoin") == [
+            "[VIDEO] Bitcoin explained", "ETH upgrade ships",
+        ]
+
+    def test_missing_row(self, db_setup):
+        assert NewsDataSource()._get_db_cache("Bitcoin") is None
@@ -160,6 +160,70 @@ class TestPaperTradingEngine:
         assert PaperTradingEngine.PRICE_MIN == 0.01
         assert PaperTradingEngine.PRICE_MAX == 0.99
 
+    def test_open_positions_with_pnl(self, db_setup):
+        from database.connection import execute_write
+        from engine.paper_trading import PaperTradingEngine
+        from engine.risk import RiskManager
+        risk = RiskManager(starting_balance=100.0)
+        trader = PaperTradingEngine(100.0, risk, log_callback=lambda l, m: None)
+        trader.balance = 100.0
+        risk.update_balance(100.0)
+
+        composite = {"final_score": 75.0, "ta_score": 72.0, "sentiment_score": 65.0, "speed_score": 80.0}
+        asyncio.run(
+            trader.execute_trade("kalshi:KXTEST", "YES", 0.52, composite)
+        )
+        execute_write("UPDATE markets SET yes_price = 0.60 WHERE id = 'kalshi:KXTEST'")
+
+        rows = trader.get_open_positions_with_pnl()
+        assert len(rows) == 1
+        row = rows[0]
+        expected = (0.60 - row["entry_price"]) * row["quantity"]
+        assert row["mark_price"] == pytest.approx(0.60)
+        assert row["open_pnl"] == pytest.approx(expected)
+        assert row["total_open_pnl"] == pytest.approx(expected)
+
+    def test_balance_listener_notified_on_fill(self, engine):
+        seen = []
+        engine.add_balance_listener(seen.append)
+        composite = {"final_score": 75.0, "ta_score": 72.0, "sentiment_score": 65.0, "speed_score": 80.0}
+        asyncio.run(
+            engine.execute_trade("kalshi:KXTEST", "YES", 0.52, composite)
+        )
+        assert seen == [engine.balance]
+        assert engine.balance < 100.0
+
+    def test_trade_history_since(self, engine):
+        composite = {"final_score": 75.0, "ta_score": 72.0, "sentiment_score": 65.0, "speed_score": 80.0}
+        trade = asyncio.run(
+            engine.execute_trade("kalshi:KXTEST", "YES", 0.52, composite)
+        )
+        history = engine.get_trade_history(limit=10)
+        assert len(history) == 1
+        since = history[0]["entry_time"]
+
+        assert engine.get_trade_history(limit=10, since=since) == []
+        asyncio.run(engine.close_position("kalshi:KXTEST", 0.60, "test"))
+        changed = engine.get_trade_history(limit=10, since=since)
+        assert [row["id"] for row in changed] == [trade.id]
+        assert changed[0]["status"] == "closed"
+
+    def test_trade_totals(self, engine):
+        assert engine.get_trade_totals() == {"trades": 0, "wins": 0, "losses": 0, "total_pnl": 0.0}
+        composite = {"final_score": 75.0, "ta_score": 72.0, "sentiment_score": 65.0, "speed_score": 80.0}
+        asyncio.run(
+            engine.execute_trade("kalshi:KXTEST", "YES", 0.52, composite)
+        )
+        # Open trades have no pnl yet and are not counted
+        assert engine.get_trade_totals()["trades"] == 0
+
+        asyncio.run(engine.close_position("kalshi:KXTEST", 0.70, "test"))
+        totals = engine.get_trade_totals()
+        assert totals["trades"] == 1
+        assert totals["wins"] == 1
+        assert totals["losses"] == 0
+        assert totals["total_pnl"] == pytest.approx(engine.get_stats()["total_pnl"], abs=0.01)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
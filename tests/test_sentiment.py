@@ -0,0 +1,100 @@
+"""
+tests/test_sentiment.py — Tests for the sentiment engine and domain boosters.
+
+Run with: python -m pytest tests/test_sentiment.py -v
+"""
+
+import pytest
+from analysis.sentiment import SentimentAnalyzer
+
+
+class TestDomainBoosters:
+    """Test category-specific keyword boosting."""
+
+    def setup_method(self):
+        self.analyzer = SentimentAnalyzer()
+
+    def test_booster_applies_to_whole_words_only(self):
+        base = self.analyzer.score_text("The outlook is unchanged")
+        boosted = self.analyzer.score_text("The outlook is unchanged", "sports")
+        # "out" must not match inside "outlook"
+        assert boosted == pytest.approx(base)
+
+    def test_booster_category_case_insensitive(self):
+        lower = self.analyzer.score_text("Star player injured", "sports")
+        upper = self.analyzer.score_text("Star player injured", "Sports")
+        assert lower == pytest.approx(upper)
+        assert lower < self.analyzer.score_text("Star player injured")
+
+    def test_repeated_booster_word_counts_once(self):
+        # Use the keyword fallback so the base score is deterministic (0.0)
+        self.analyzer._vader_available = False
+        assert self.analyzer.score_text("rally", "crypto") == pytest.approx(65.0)
+        assert self.analyzer.score_text("rally rally", "crypto") == pytest.approx(65.0)
+
+    def test_empty_text_is_neutral(self):
+        assert self.analyzer.score_text("   ", "crypto") == 50.0
+
+
+class TestKeywordFallback:
+    """Test the keyword scorer used when VADER is not installed."""
+
+    def test_counts_positive_and_negative_words(self):
+        analyzer = SentimentAnalyzer()
+        assert analyzer._simple_keyword_score("Big win, record profit") == pytest.approx(1.0)
+        assert analyzer._simple_keyword_score("Loss after the crash") == pytest.approx(-1.0)
+        assert analyzer._simple_keyword_score("Strong gain, one miss") == pytest.approx(1 / 3)
+
+    def test_no_lexicon_words_is_neutral(self):
+        assert SentimentAnalyzer()._simple_keyword_score("nothing to see") == 0.0
+
+
+class TestScoreBatch:
+    """Test recency-weighted batch aggregation."""
+
+    def test_recent_items_weigh_more(self):
+        analyzer = SentimentAnalyzer()
+        analyzer._vader_available = False
+        # Scores: 100 then 0 -> weights 0.9, 1.0 -> 90 / 1.9
+        assert analyzer.score_batch(["win", "loss"]) == pytest.approx(47.37)
+        assert analyzer.score_batch(["loss", "win"]) == pytest.approx(52.63)
+
+    def test_empty_batch_is_neutral(self):
+        assert SentimentAnalyzer().score_batch([]) == 50.0
+
+
+class TestAnalyzeMarket:
+    """Test the full per-market sentiment result."""
+
+    def test_scores_each_item_once(self):
+        analyzer = SentimentAnalyzer()
+        result = analyzer.analyze_market("test:m", "crypto", ["ETF approval", "Exchange hack"])
+        info = analyzer._score_cached.cache_info()
+        assert (info.misses, info.hits) == (2, 0)
+        assert result["source_count"] == 2
+        assert result["sentiment_score"] == analyzer.score_batch(["ETF approval", "Exchange hack"], "crypto")
+
+    def test_score_many_matches_score_text(self):
+        analyzer = SentimentAnalyzer()
+        texts = ["Bitcoin rally continues", "", "Exchange hack drains funds"]
+        assert analyzer.score_many(texts, "crypto") == [analyzer.score_text(t, "crypto") for t in texts]
+
+
+class TestScoreCache:
+    """Test memoization of per-text scores."""
+
+    def test_repeated_headline_hits_cache(self):
+        analyzer = SentimentAnalyzer()
+        first = analyzer.score_text("Bitcoin ETF approval", "crypto")
+        second = analyzer.score_text("Bitcoin ETF approval", "crypto")
+        assert first == second
+        assert analyzer._score_cached.cache_info().hits == 1
+
+    def test_analyzers_share_one_vader_instance(self):
+        assert SentimentAnalyzer()._vader is SentimentAnalyzer()._vader
+
+    def test_category_case_shares_cache_entry(self):
+        analyzer = SentimentAnalyzer()
+        analyzer.score_text("Exchange hack", "Crypto")
+        analyzer.score_text("Exchange hack", "crypto")
+        assert analyzer._score_cached.cache_info().hits == 1
@@ -0,0 +1,132 @@
+"""
+tests/test_speed.py — Tests for the speed/information advantage engine.
+
+Run with: python -m pytest tests/test_speed.py -v
+"""
+
+import time
+
+import pytest
+from analysis.speed import BEARISH, HISTORY_LENGTH, MarketSpeedData, SpeedMonitor
+
+
+class TestMarketSpeedData:
+    """Test per-market tick history and derived metrics."""
+
+    def test_history_is_bounded(self):
+        data = MarketSpeedData(market_id="test:m")
+        for i in range(HISTORY_LENGTH + 10):
+            data.record(price=0.5 + i * 0.001, volume=float(i))
+        assert len(data.price_history) == HISTORY_LENGTH
+        assert len(data.volume_history) == HISTORY_LENGTH
+        assert data.volume_history[0] == 10.0
+
+    def test_volume_baseline_excludes_latest(self):
+        data = MarketSpeedData(market_id="test:m")
+        for vol in (100.0, 200.0, 900.0):
+            data.record(price=0.5, volume=vol)
+        assert data.volume_baseline == pytest.approx(150.0)
+        assert data.latest_volume_spike == pytest.approx(6.0)
+
+    def test_volume_baseline_tracks_evictions(self):
+        data = MarketSpeedData(market_id="test:m")
+        vols = [float(i * 7 % 13) for i in range(HISTORY_LENGTH * 3)]
+        for vol in vols:
+            data.record(price=0.5, volume=vol)
+        window = vols[-HISTORY_LENGTH:]
+        assert data.volume_baseline == pytest.approx(sum(window[:-1]) / (HISTORY_LENGTH - 1))
+
+    def test_price_momentum_uses_three_ticks(self):
+        data = MarketSpeedData(market_id="test:m")
+        for price in (0.40, 0.45, 0.50, 0.52):
+            data.record(price=price, volume=0.0)
+        assert data.price_momentum == pytest.approx(0.07)
+
+
+class TestSpeedMonitor:
+    """Test composite speed scoring."""
+
+    def test_untracked_market_is_stale(self):
+        result = SpeedMonitor().compute_speed_score("test:none", "crypto")
+        assert result["score_breakdown"]["freshness"] == -15.0
+        assert result["staleness_seconds"] == 9999.0
+
+    def test_staleness_decays_linearly_after_a_minute(self):
+        monitor = SpeedMonitor()
+        monitor.record_update("test:m", price=0.5, volume=100.0)
+        last = monitor._get_data("test:m").last_update_ts
+        result = monitor.compute_speed_score("test:m", "crypto", now=last + 90.0)
+        assert result["staleness_seconds"] == pytest.approx(90.0)
+        assert result["score_breakdown"]["freshness"] == pytest.approx(-5.0)
+
+    def test_fresh_volume_spike_scores_high(self):
+        monitor = SpeedMonitor()
+        for vol in (100.0, 100.0, 100.0, 500.0):
+            monitor.record_update("test:m", price=0.5, volume=vol)
+        result = monitor.compute_speed_score("test:m", "crypto")
+        assert result["score_breakdown"]["freshness"] == 15.0
+        assert result["score_breakdown"]["volume_spike"] == 15.0
+        assert result["speed_score"] == pytest.approx(80.0)
+        assert result["direction"] == "bullish"
+
+    def test_consensus_edge_sets_direction(self):
+        monitor = SpeedMonitor()
+        monitor.record_update("test:m", price=0.5, volume=100.0)
+        monitor.update_consensus("test:m", consensus_score=20.0, direction="bearish", source_count=3)
+        assert monitor._get_data("test:m").consensus_direction == BEARISH
+        result = monitor.compute_speed_score("test:m", "weather", current_market_price=0.5)
+        assert result["consensus_edge"] == pytest.approx(-30.0)
+        assert result["score_breakdown"]["consensus_bonus"] == pytest.approx(-9.0)
+        assert result["direction"] == "bearish"
+
+    def test_batch_scores_match_single_market_scores(self):
+        monitor = SpeedMonitor()
+        ticks = {
+            "test:spike": [(0.50, 100.0), (0.50, 100.0), (0.50, 100.0), (0.50, 500.0)],
+            "test:rising": [(0.40, 50.0), (0.45, 50.0), (0.50, 80.0)],
+            "test:falling": [(0.60, 50.0), (0.55, 50.0), (0.50, 50.0)],
+            "test:flat": [(0.50, 10.0)],
+        }
+        for market_id, rows in ticks.items():
+            for price, vol in rows:
+                monitor.record_update(market_id, price=price, volume=vol)
+        monitor.update_consensus("test:flat", consensus_score=80.0, direction="bullish", source_count=4)
+        monitor.update_consensus("test:falling", consensus_score=45.0, direction="neutral", source_count=2)
+        prices = {"test:flat": 0.5, "test:falling": 0.5, "test:spike": 0.5}
+
+        now = time.monotonic() + 45.0  # lands in the +5 freshness step
+        batch = monitor.compute_all_speed_scores(prices, now=now)
+        assert set(batch) == set(ticks)
+        for market_id in ticks:
+            single = monitor.compute_speed_score(market_id, "crypto", prices.get(market_id), now=now)
+            assert batch[market_id] == single
+
+    def test_batch_scores_empty_monitor(self):
+        assert SpeedMonitor().compute_all_speed_scores() == {}
+
+    def test_repeat_poll_reuses_result_until_inputs_change(self):
+        monitor = SpeedMonitor()
+        monitor.record_update("test:m", price=0.5, volume=100.0)
+        now = time.monotonic()
+        first = monitor.compute_speed_score("test:m", "crypto", 0.5, now=now)
+        assert monitor.compute_speed_score("test:m", "crypto", 0.5, now=now) == first
+
+        monitor.update_consensus("test:m", consensus_score=90.0, direction="bullish", source_count=3)
+        updated = monitor.compute_speed_score("test:m", "crypto", 0.5, now=now)
+        assert updated != first
+        assert updated["consensus_edge"] == pytest.approx(40.0)
+
+    def test_reused_result_is_not_shared_with_callers(self):
+        monitor = SpeedMonitor()
+        monitor.record_update("test:m", price=0.5, volume=100.0)
+        now = time.monotonic()
+        first = monitor.compute_speed_score("test:m", "crypto", 0.5, now=now)
+        expected = {**first, "score_breakdown": dict(first["score_breakdown"])}
+        first["speed_score"] = -1.0
+        first["score_breakdown"]["freshness"] = -1.0
+        first["extra"] = True
+
+        second = monitor.compute_speed_score("test:m", "crypto", 0.5, now=now)
+        assert second == expected
+        second["direction"] = "edited"
+        assert monitor.compute_speed_score("test:m", "crypto", 0.5, now=now) == expected
@@ -0,0 +1,100 @@
+"""
+tests/test_sports.py — Tests for sportsbook odds parsing and market matching.
+
+Run with: python -m pytest tests/test_sports.py -v
+"""
+
+import pytest
+
+from data_sources.sports import SportsDataSource
+
+
+def _raw_game(markets):
+    return {
+        "id": "g1",
+        "sport_key": "americanfootball_nfl",
+        "home_team": "Kansas City Chiefs",
+        "away_team": "Buffalo Bills",
+        "commence_time": "2026-10-18T17:00:00Z",
+        "bookmakers": [{"title": "DraftKings", "markets": markets}],
+    }
+
+
+_H2H = {
+    "key": "h2h",
+    "outcomes": [
+        {"name": "Kansas City Chiefs", "price": -180},
+        {"name": "Buffalo Bills", "price": 150},
+    ],
+}
+_SPREADS = {
+    "key": "spreads",
+    "outcomes": [
+        {"name": "Kansas City Chiefs", "price": -110, "point": -3.5},
+        {"name": "Buffalo Bills", "price": -110, "point": 3.5},
+    ],
+}
+
+
+class TestNormalizeGame:
+    """Test that head-to-head odds are read from the h2h market."""
+
+    def test_h2h_first(self):
+        game = SportsDataSource()._normalize_game(_raw_game([_H2H]))
+        assert game["home_win_prob"] == pytest.approx(0.6164, abs=1e-4)
+        assert game["away_win_prob"] == pytest.approx(0.3836, abs=1e-4)
+        assert game["bookmaker"] == "DraftKings"
+
+    def test_h2h_not_first_market(self):
+        game = SportsDataSource()._normalize_game(_raw_game([_SPREADS, _H2H]))
+        assert game["home_win_prob"] == pytest.approx(0.6164, abs=1e-4)
+        assert game["away_win_prob"] == pytest.approx(0.3836, abs=1e-4)
+
+    def test_no_h2h_market_is_even(self):
+        game = SportsDataSource()._normalize_game(_raw_game([_SPREADS]))
+        assert game["home_win_prob"] == 0.5
+        assert game["away_win_prob"] == 0.5
+
+    def test_no_bookmakers(self):
+        raw = _raw_game([])
+        raw["bookmakers"] = []
+        game = SportsDataSource()._normalize_game(raw)
+        assert game["home_win_prob"] == 0.5
+        assert game["bookmaker"] == ""
+
+
+class TestPredictionMarketEdge:
+    """Test matching market titles to games by team-name words."""
+
+    GAME = {
+        "home_team": "Kansas City Chiefs",
+        "away_team": "Buffalo Bills",
+        "home_win_prob": 0.75,
+        "away_win_prob": 0.25,
+    }
+
+    def test_home_team_matched_case_insensitively(self):
+        edge = SportsDataSource().compute_prediction_market_edge(
+            self.GAME, "Will the CHIEFS win on Sunday?", 0.60
+        )
+        assert edge["sportsbook_probability"] == 0.75
+        assert edge["direction"] == "bullish"
+
+    def test_away_team_matched(self):
+        edge = SportsDataSource().compute_prediction_market_edge(
+            self.GAME, "Bills to beat the spread?", 0.40
+        )
+        assert edge["sportsbook_probability"] == 0.25
+        assert edge["direction"] == "bearish"
+
+    def test_short_words_and_substrings_do_not_match(self):
+        # "KC" is too short to count, and "Billsy" is not "Bills"
+        source = SportsDataSource()
+        assert source.compute_prediction_market_edge(self.GAME, "Billsy in KC?", 0.10) is None
+        assert source.compute_prediction_market_edge(self.GAME, "Will it rain?", 0.10) is None
+
+    def test_small_divergence_is_no_edge(self):
+        edge = SportsDataSource().compute_prediction_market_edge(
+            self.GAME, "Chiefs win?", 0.70
+        )
+        assert edge is None
@@ -0,0 +1,56 @@
+"""
+tests/test_status.py — Tests for the background data_source_status writer.
+
+Run with: python -m pytest tests/test_status.py -v
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from data_sources import _status
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    """Replace the DB write with one that records each batch; the first is slow."""
+    done = []
+    calls = []
+
+    def slow_write(batch):
+        calls.append(batch)
+        if len(calls) == 1:
+            time.sleep(0.3)
+        done.append([params[0] for _, params in batch])
+
+    monkeypatch.setattr(_status, "_write", slow_write)
+    yield done
+    _status._queue = _status._writer = _status._writer_loop = None
+    _status._in_flight = None
+
+
+class TestStatusWriter:
+    """Test that shutdown writes every queued and in-flight update."""
+
+    def test_flush_writes_queued_updates(self, writes):
+        async def main():
+            _status.record_status("binance", "Binance", healthy=True)
+            _status.record_status("newsapi", "NewsAPI", healthy=False, error="boom")
+            await _status.flush_status_updates()
+
+        asyncio.run(main())
+        assert sorted(sum(writes, [])) == ["binance", "newsapi"]
+
+    def test_flush_waits_for_batch_in_flight(self, writes):
+        async def main():
+            _status.record_status("binance", "Binance", healthy=True)
+            # Let the writer pick up the first batch and start writing it
+            await asyncio.sleep(0.05)
+            _status.record_status("newsapi", "NewsAPI", healthy=True)
+            await _status.flush_status_updates()
+            # Everything is written by the time flush returns
+            return list(writes)
+
+        written = asyncio.run(main())
+        assert written == [["binance"], ["newsapi"]]
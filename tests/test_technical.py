@@ -5,7 +5,15 @@ Run with: python -m pytest tests/test_technical.py -v
 """
 
 import pytest
-from analysis.technical import BreakoutMachine, BreakoutState, TechnicalAnalyzer
+from analysis.technical import (
+    BEARISH,
+    BULLISH,
+    NEUTRAL,
+    BreakoutMachine,
+    BreakoutState,
+    TechnicalAnalyzer,
+    candles_to_series,
+)
 
 
 def make_candle(close: float, volume: float = 100.0) -> dict:
@@ -61,6 +69,13 @@ class TestIndicators:
         result = ta.ema(prices, 9)
         assert result == pytest.approx(0.5, abs=0.001)
 
+    def test_ema_recurrence(self):
+        ta = TechnicalAnalyzer()
+        # k = 2 / (3 + 1) = 0.5: 1.0 -> 1.5 -> 2.25
+        assert ta.ema([1.0, 2.0, 3.0], 3) == pytest.approx(2.25)
+        assert ta.ema([0.7], 3) == pytest.approx(0.7)
+        assert ta.ema([], 3) == 0.0
+
     def test_vwap_no_volume(self):
         ta = TechnicalAnalyzer()
         candles = [{"high": 0.6, "low": 0.5, "close": 0.55, "volume": 0} for _ in range(5)]
@@ -68,6 +83,14 @@ class TestIndicators:
         # No volume data → simple average of close prices
         assert result == pytest.approx(0.55, abs=0.001)
 
+    def test_vwap_weights_typical_price_by_volume(self):
+        ta = TechnicalAnalyzer()
+        candles = [
+            {"high": 0.6, "low": 0.4, "close": 0.5, "volume": 100},   # typical 0.5
+            {"high": 0.9, "low": 0.6, "close": 0.9, "volume": 300},   # typical 0.8
+        ]
+        assert ta.vwap(candles) == pytest.approx((0.5 * 100 + 0.8 * 300) / 400)
+
     def test_volume_spike_no_spike(self):
         ta = TechnicalAnalyzer()
         candles = [{"volume": 100} for _ in range(20)] + [{"volume": 110}]
@@ -80,6 +103,16 @@ class TestIndicators:
         ratio = ta.volume_spike_ratio(candles)
         assert ratio > 4.0
 
+    def test_series_matches_candle_dicts(self):
+        ta = TechnicalAnalyzer()
+        candles = [make_candle(0.5 + i * 0.01, volume=100.0 + i * 40) for i in range(25)]
+        series = candles_to_series(candles)
+        assert len(series) == 25
+        assert series.close.flags.c_contiguous
+        assert ta.vwap(series) == pytest.approx(ta.vwap(candles))
+        assert ta.volume_spike_ratio(series) == pytest.approx(ta.volume_spike_ratio(candles))
+        assert ta.sma(series.close, 10) == pytest.approx(ta.sma([c["close"] for c in candles], 10))
+
     def test_orderbook_imbalance(self):
         ta = TechnicalAnalyzer()
         assert ta.orderbook_imbalance(100, 0) == pytest.approx(1.0)
@@ -109,6 +142,23 @@ class TestBreakoutStateMachine:
         assert detected is False
         assert machine.state == BreakoutState.SCANNING
 
+    def test_scan_consolidations_checks_every_window(self):
+        machine = BreakoutMachine()
+        # 5 tight candles, then a wide swing, then 5 more tight candles
+        closes = [0.50] * 5 + [0.60, 0.40] + [0.45] * 5
+        series = candles_to_series([make_candle(c) for c in closes])
+        mask = machine.scan_consolidations(series)
+        assert mask.tolist() == [True] + [False] * 6 + [True]
+        assert machine.last_consolidation(series) == 7
+        assert machine.last_consolidation(candles_to_series([make_candle(0.5)])) is None
+
+    def test_detect_consolidation_from_series(self):
+        machine = BreakoutMachine()
+        series = candles_to_series([make_candle(0.50) for _ in range(6)])
+        assert machine.try_detect_consolidation(series) is True
+        assert machine.consolidation_high == pytest.approx(0.502)
+        assert machine.consolidation_low == pytest.approx(0.498)
+
     def test_bullish_breakout(self):
         machine = BreakoutMachine()
         machine.state = BreakoutState.CONSOLIDATION_DETECTED
@@ -120,6 +170,39 @@ class TestBreakoutStateMachine:
         state, confidence = machine.update(breakout_candle)
         assert state == BreakoutState.FIRST_BREAKOUT
         assert machine.breakout_direction == "bullish"
+        assert machine.breakout_dir == BULLISH
+
+    def test_update_accepts_candle_without_volume(self):
+        machine = BreakoutMachine()
+        machine.update({"close": 0.5, "high": 0.51, "low": 0.49})
+        machine.update_scalar(0.5, 0.51, 0.49, 300.0)
+        assert list(machine.recent_volumes) == [0.0, 300.0]
+
+    def test_breakout_direction_name_round_trips(self):
+        machine = BreakoutMachine()
+        assert machine.breakout_dir == NEUTRAL
+        machine.breakout_direction = "bearish"
+        assert machine.breakout_dir == BEARISH
+        assert machine.breakout_direction == "bearish"
+
+    def test_constructor_takes_public_field_names(self):
+        machine = BreakoutMachine(
+            state=BreakoutState.FIRST_BREAKOUT,
+            breakout_direction="bullish",
+            consolidation_high=0.55,
+            consolidation_low=0.45,
+            recent_volumes=[100.0, 200.0],
+        )
+        assert machine.breakout_dir == BULLISH
+        assert machine.consolidation_high == 0.55
+        assert machine.consolidation_low == 0.45
+        assert list(machine.recent_volumes) == [100.0, 200.0]
+        # Derived triggers match assigning the same box after construction
+        assigned = BreakoutMachine()
+        assigned.consolidation_high = 0.55
+        assigned.consolidation_low = 0.45
+        assert machine._upper_trigger == assigned._upper_trigger
+        assert machine._retest_band_low == assigned._retest_band_low
 
     def test_retest_after_breakout(self):
         machine = BreakoutMachine()
@@ -134,6 +217,19 @@ class TestBreakoutStateMachine:
         state, confidence = machine.update(retest_candle)
         assert state == BreakoutState.RETEST
 
+    def test_bearish_retest_uses_consolidation_low(self):
+        machine = BreakoutMachine()
+        machine.state = BreakoutState.FIRST_BREAKOUT
+        machine.breakout_direction = "bearish"
+        machine.consolidation_high = 0.55
+        machine.consolidation_low = 0.45
+
+        # 0.45 * 1.015 = 0.45675 — just outside the band, still in FIRST_BREAKOUT
+        state, _ = machine.update(make_candle(0.458))
+        assert state == BreakoutState.FIRST_BREAKOUT
+        state, _ = machine.update(make_candle(0.456))
+        assert state == BreakoutState.RETEST
+
     def test_second_breakout_signal(self):
         machine = BreakoutMachine()
         machine.state = BreakoutState.RETEST
@@ -148,6 +244,13 @@ class TestBreakoutStateMachine:
         assert state == BreakoutState.SECOND_BREAKOUT_SIGNAL
         assert confidence >= 75.0
 
+    def test_recent_volumes_window(self):
+        machine = BreakoutMachine()
+        for i in range(25):
+            machine.update(make_candle(0.5, volume=float(i)))
+        assert list(machine.recent_volumes) == [float(i) for i in range(5, 25)]
+        assert machine._volume_sum == pytest.approx(sum(range(5, 25)))
+
     def test_reset_on_timeout(self):
         machine = BreakoutMachine()
         machine.state = BreakoutState.FIRST_BREAKOUT
@@ -173,6 +276,18 @@ class TestTechnicalAnalyzer:
         assert result["ta_score"] == 50.0
         assert result["direction"] == "neutral"
 
+    def test_analyze_reports_state_name(self):
+        ta = TechnicalAnalyzer()
+        result = ta.analyze("test:market", [make_candle(0.5)])
+        assert result["breakout_state"] == "SCANNING"
+        assert ta.analyze("test:empty", [])["breakout_state"] == "SCANNING"
+
+    def test_neutral_results_are_independent_copies(self):
+        ta = TechnicalAnalyzer()
+        first = ta.analyze("test:empty", [])
+        first["ta_score"] = 99.0
+        assert ta.analyze("test:empty", [])["ta_score"] == 50.0
+
     def test_analyze_returns_score_in_range(self):
         ta = TechnicalAnalyzer()
         candles = [make_candle(0.5 + i * 0.001, volume=100) for i in range(50)]
@@ -186,6 +301,30 @@ class TestTechnicalAnalyzer:
         result = ta.analyze("test:trending", candles)
         assert result["ta_score"] >= 50.0
 
+    def test_analyze_batch_matches_per_candle_replay(self):
+        import random
+        rng = random.Random(7)
+        candles, price = [], 0.5
+        for i in range(400):
+            # Alternate tight ranges with bursts so every state is visited
+            step = 0.001 if (i // 15) % 2 == 0 else 0.02
+            price = min(0.95, max(0.05, price + rng.uniform(-step, step)))
+            candles.append(make_candle(price, volume=rng.uniform(50, 400)))
+
+        looped = TechnicalAnalyzer()
+        history = [looped.analyze("m", candles[: i + 1])["breakout_confidence"] for i in range(len(candles))]
+        batched = TechnicalAnalyzer()
+        result = batched.analyze_batch("m", candles)
+
+        assert result["breakout_history"] == pytest.approx(history)
+        assert len(set(history)) > 3  # replay exercised several states
+        expected, actual = looped._get_machine("m"), batched._get_machine("m")
+        assert actual.state == expected.state
+        assert actual.breakout_direction == expected.breakout_direction
+        assert actual.consolidation_high == pytest.approx(expected.consolidation_high)
+        assert actual.candles_in_state == expected.candles_in_state
+        assert list(actual.recent_volumes) == pytest.approx(list(expected.recent_volumes))
+
     def test_get_state_new_market(self):
         ta = TechnicalAnalyzer()
         state = ta.get_state("never:seen:before")